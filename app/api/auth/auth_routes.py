@@ -8,8 +8,10 @@ from app.api.auth.dto.auth_dto import UserRegisterDto
 from app.api.base_routes import BaseRoute
 from flask_jwt_extended import jwt_required
 from app.extensions import container
-from app.api.auth.schemas import AdminRegistrationErrorResponseSchema, AdminRegistrationResponseSchema, AdminRegistrationSchema, LogInResponseSchema, LoginSchema, UserRegistrationSchema, UserResponseSchema
+from app.api.auth.schemas import AdminRegistrationErrorResponseSchema, AdminRegistrationResponseSchema, AdminRegistrationSchema, LogInResponseSchema, LoginSchema, UserAccessResponseSchema, UserAccessSchema, UserRegistrationSchema, UserResponseSchema
+from app.api.decorators.auth_decorator import require_admin
 from app.services.auth_service.application.commands import CreateUserCommand, CreateOrGetHealthCareCenterCommand, LoginCommand, RegisterUserCommand, UserUpdateCommand,RegisterUserCommand, UserUpdateCommand,AdminRegistrationCommand
+from app.services.auth_service.application.commands.user.change_user_access_command import ChangeUserAccessCommand
 from app.services.auth_service.application.queries import AccessCodeValidationQuery
 from app.services.auth_service.infrastructure.persistence.models.user_model import UserModel
 from app.shared.domain.schema.common_errors import ErrorResponseSchema
@@ -100,12 +102,27 @@ class UserUpdate(BaseRoute):
 
     @jwt_required()
     def delete(self, user_id):
-        user = UserModel.query.get(user_id)
-        if not user:
-            abort(404, message="User not found")
-        user.deactivate()
+        # Deactivating goes through the service so the user's tokens are revoked too
+        container.auth_service().change_user_access(ChangeUserAccessCommand(user_id=user_id, is_active=False))
         return APIResponse.success(message="User deleted successfully")
 
+@auth_bp.route('/user/<uuid:user_id>/access')
+class UserAccess(BaseRoute):
+    @require_admin
+    @auth_bp.doc(summary="Change user access", description="Grant or remove admin privileges, activate or deactivate a user, or with an empty body only revoke their tokens. Every change bumps the user's authorization version, which revokes the tokens issued before it.")
+    @auth_bp.arguments(UserAccessSchema)
+    @auth_bp.response(HTTPStatus.NOT_FOUND, ErrorResponseSchema, description="User not found")
+    @auth_bp.response(HTTPStatus.OK, UserAccessResponseSchema)
+    def patch(self, access_data, user_id):
+        """Change a user's role or active state, revoking their existing tokens"""
+        command = ChangeUserAccessCommand(user_id=user_id, **access_data)
+        result = container.auth_service().change_user_access(command)
+        return self._success_response(
+            data=result,
+            message="User access updated successfully",
+            status_code=HTTPStatus.OK
+        )
+
 class UserDto(BaseModel):
     id: UUID
     username: str
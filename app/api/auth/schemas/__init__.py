@@ -1,10 +1,11 @@
 from .health_care import HealthCareCenterSchema, HealthCareCenterFilterSchema, HealthCareCenterResponseSchema, HealthCareCenterListResponseSchema
-from .user import UserSchema, UserRegistrationSchema, AdminRegistrationSchema
+from .user import UserSchema, UserRegistrationSchema, AdminRegistrationSchema, UserAccessSchema, UserAccessStateSchema
 from .auth import LoginSchema, AccessCodeGenerationSchema, AccessCodeFilterSchema
 from .responses import (
     AdminRegistrationResponseSchema,
     LogInResponseSchema,
     UserResponseSchema,
+    UserAccessResponseSchema,
     AccessCodeResponseSchema,
     AccessCodeValidationResponseSchema,
     AccessCodeItemSchema,
@@ -20,12 +21,15 @@ __all__ = [
     'UserSchema',
     'UserRegistrationSchema',
     'AdminRegistrationSchema',
+    'UserAccessSchema',
+    'UserAccessStateSchema',
     'LoginSchema',
     'AccessCodeGenerationSchema',
     'AccessCodeFilterSchema',
     'AdminRegistrationResponseSchema',
     'LogInResponseSchema',
     'UserResponseSchema',
+    'UserAccessResponseSchema',
     'AccessCodeResponseSchema',
     'AccessCodeValidationResponseSchema',
     'AccessCodeItemSchema',
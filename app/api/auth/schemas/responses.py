@@ -1,6 +1,6 @@
 from marshmallow import Schema, fields
 from app.shared.domain.schema.common_errors import ErrorResponseSchema
-from .user import UserSchema
+from .user import UserSchema, UserAccessStateSchema
 from .auth import AccessCodeGenerationSchema, LoginResponse
 
 class AdminRegistrationResponseSchema(Schema):
@@ -21,6 +21,11 @@ class UserResponseSchema(Schema):
     message = fields.Str(description="User message")
     success = fields.Bool(description="User success")
 
+class UserAccessResponseSchema(Schema):
+    data = fields.Nested(UserAccessStateSchema, description="User access state after the change")
+    message = fields.Str(description="Response message")
+    code = fields.Int(description="Response code")
+
 class AccessCodeResponseSchema(Schema):
     data = fields.Nested(AccessCodeGenerationSchema, description="Access code data")
     message = fields.Str(description="Response message")
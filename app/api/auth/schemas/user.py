@@ -46,5 +46,15 @@ class UserRegistrationSchema(UserSchema):
     code = fields.Str(required=True, description="The user code")
 #admin registration schema
 class AdminRegistrationSchema(UserBaseSchema):
-    initialization_key = fields.Str(required=True, description="Admin initialization key") 
+    initialization_key = fields.Str(required=True, description="Admin initialization key")
 
+class UserAccessSchema(Schema):
+    """Role and active-state change; with neither field set it only revokes the user's tokens"""
+    is_admin = fields.Bool(required=False, metadata={"description": "Grant or remove admin privileges"})
+    is_active = fields.Bool(required=False, metadata={"description": "Activate or deactivate the user"})
+
+class UserAccessStateSchema(Schema):
+    user_id = fields.UUID(metadata={"description": "The user ID"})
+    is_admin = fields.Bool(metadata={"description": "Whether the user is an admin"})
+    is_active = fields.Bool(metadata={"description": "Whether the user is active"})
+    authz_version = fields.Int(metadata={"description": "Authorization version; tokens issued under an older one are revoked"})
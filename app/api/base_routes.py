@@ -1,12 +1,14 @@
-from typing import Any
+import functools
+from typing import Any, Callable
 from flask.views import MethodView
 from http import HTTPStatus
 from flask_smorest import abort
 from werkzeug.exceptions import UnprocessableEntity
 from app.shared.domain.exceptions.common_errors import BaseAPIException
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
 from flask_smorest import Api
 from app.shared.utils.api_response import APIResponse
+from app.shared.infrastructure.serialization import OrjsonProvider
 from flask import current_app
 import datetime
 
@@ -34,6 +36,42 @@ class BaseRoute(MethodView):
                 errors=str(e)
             )
     
+    @staticmethod
+    def trusted_response(view: Callable) -> Callable:
+        """
+        Serialize the view's result straight to JSON, skipping the
+        marshmallow response schema.
+
+        For views whose payload is already a trusted DTO (dataclasses,
+        pydantic models or plain dicts built by a query service), so large
+        listings are not validated and converted a second time. Place it
+        below ``@bp.response``, which still documents the response; the
+        JSON provider serializes the payload as is. Disabled with
+        TRUSTED_RESPONSES_ENABLED=false, which restores the schema dump.
+
+        Only the orjson provider emits DTOs the way the schemas do (enums
+        by value, ISO 8601 datetimes); under Flask's default provider the
+        schema dump is kept.
+        """
+        @functools.wraps(view)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = view(*args, **kwargs)
+            if (isinstance(result, Response)
+                    or not current_app.config.get('TRUSTED_RESPONSES_ENABLED', True)
+                    or not isinstance(current_app.json, OrjsonProvider)):
+                return result
+
+            status_code, headers = HTTPStatus.OK, None
+            if isinstance(result, tuple):
+                result, status_code, *rest = result
+                headers = rest[0] if rest else None
+            response = current_app.json.response(result)
+            response.status_code = status_code
+            if headers:
+                response.headers.update(headers)
+            return response
+        return wrapper
+
     def _success_response(self, data=None, message="Success", status_code=HTTPStatus.OK):
         response = {
             "code": status_code,
@@ -77,3 +115,17 @@ def health_check():
     
     return jsonify(response), HTTPStatus.OK
         
+
+
+@health_bp.route('/pool')
+def pool_health():
+    """Connection pool usage of this worker's database engine"""
+    from app.dataBase import db
+    from app.shared.infrastructure.persistence.engine import pool_stats
+
+    response = {
+        "code": HTTPStatus.OK,
+        "message": "Connection pool statistics",
+        "data": pool_stats(db.engine)
+    }
+    return jsonify(response), HTTPStatus.OK
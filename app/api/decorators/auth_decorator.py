@@ -1,10 +1,13 @@
+import logging
 from functools import wraps
-from uuid import UUID
 from flask import request, jsonify
 from http import HTTPStatus
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
+from flask_jwt_extended import verify_jwt_in_request, get_jwt, get_jwt_identity
 
-from app.services.auth_service.infrastructure.persistence.models.user_model import UserModel
+from app.extensions import container
+from app.services.auth_service.domain.exceptions.auth_errors import AuthorizationError
+
+logger = logging.getLogger(__name__)
 
 def require_auth(f):
     @wraps(f)
@@ -21,22 +24,28 @@ def require_auth(f):
     return decorated
 
 def require_admin(f):
+    """
+    Allow only administrators.
+
+    Authorizes from the verified token claims and a per-worker cache of the
+    user's active/admin state, so admin requests do not load the user row
+    each time.
+    """
     @wraps(f)
     def decorated(*args, **kwargs):
         try:
             verify_jwt_in_request()
-            current_user = get_jwt_identity()
-            user = UserModel.query.get(UUID(current_user))
-            if not user.is_admin:
-                return jsonify({
-                    "success": False,
-                    "message": "Admin privileges required"
-                }), HTTPStatus.FORBIDDEN
-            return f(*args, **kwargs)
+            container.auth_service().authorize_admin(get_jwt_identity(), get_jwt())
+        except AuthorizationError as e:
+            return jsonify({
+                "success": False,
+                "message": e.message
+            }), HTTPStatus.FORBIDDEN
         except Exception as e:
-            print(e)
+            logger.info(f"Admin authorization failed: {str(e)}")
             return jsonify({
                 "success": False,
                 "message": "Authentication required"
             }), HTTPStatus.UNAUTHORIZED
-    return decorated 
\ No newline at end of file
+        return f(*args, **kwargs)
+    return decorated
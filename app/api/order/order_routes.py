@@ -2,14 +2,18 @@ from http import HTTPStatus
 from uuid import UUID
 from app.api import order_bp
 from app.api.base_routes import BaseRoute
-from app.api.order.schemas import CreateOrderSchema, OrderFilterSchema, OrderListResponseSchema, OrderResponseSchema, UpdateOrderStatusSchema
+from app.api.order.schemas import CreateOrderSchema, OrderExportSchema, OrderFilterSchema, OrderListResponseSchema, OrderResponseSchema, UpdateOrderStatusSchema
 from app.services.order_service.application.commands import CreateOrderCommand, UpdateOrderCommand, CancelOrderCommand
-from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO
+from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO, OrderFilterDTO
 from app.services.order_service.application.queries.order_filter_query import OrderFilterQuery
 from app.shared.domain.schema.common_errors import ErrorResponseSchema
 from app.shared.utils.api_response import APIResponse
+from app.api.decorators.auth_decorator import require_admin
+from app.services.order_service.infrastructure.export.order_export_writer import EXPORT_MEDIA_TYPES, gzip_chunks
 from app.extensions import container    
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime, UTC
+from flask import Response, current_app, request, stream_with_context
 
 
 @order_bp.route('/orders')
@@ -18,6 +22,7 @@ class OrderFilterRoutes(BaseRoute):
     @order_bp.doc(summary="Get orders by filter", description="Get filtered orders with pagination")
     @order_bp.arguments(OrderFilterSchema)
     @order_bp.response(HTTPStatus.OK, OrderListResponseSchema, description="List of orders")
+    @BaseRoute.trusted_response
     def post(self, data):             
         # Get orders using the service
         result = container.order_service().get_orders(OrderFilterQuery(**data))        
@@ -27,6 +32,34 @@ class OrderFilterRoutes(BaseRoute):
             status_code=HTTPStatus.OK
         )
 
+@order_bp.route('/orders/export')
+class OrderExportRoutes(BaseRoute):
+    @require_admin
+    @order_bp.doc(summary="Export orders", description="Stream every order matching the filter as CSV or NDJSON, optionally gzip-encoded")
+    @order_bp.arguments(OrderExportSchema, location="query")
+    def get(self, args):
+        fmt = args.pop('format')
+        compress = args.pop('gzip', None)
+        if compress is None:
+            compress = 'gzip' in request.accept_encodings
+        
+        chunks = container.order_service().stream_orders_export(
+            OrderFilterDTO(**args),
+            format=fmt,
+            batch_size=current_app.config.get('ORDER_EXPORT_BATCH_SIZE', 500)
+        )
+        if compress:
+            chunks = gzip_chunks(chunks)
+        
+        # stream_with_context keeps the request (and its database session) alive until the last chunk
+        response = Response(stream_with_context(chunks), content_type=EXPORT_MEDIA_TYPES[fmt])
+        filename = f"orders-{datetime.now(UTC):%Y%m%d%H%M%S}.{fmt}"
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response.headers['Vary'] = 'Accept-Encoding'
+        if compress:
+            response.headers['Content-Encoding'] = 'gzip'
+        return response
+
 @order_bp.route('/order')
 class OrderRoutes(BaseRoute):
     @order_bp.doc(summary="Create an order", description="Create an order")   
@@ -19,14 +19,27 @@ class OrderSchema(Schema):
     completed_at = fields.DateTime(dump_only=True)
 
 class OrderFilterSchema(Schema):
-    user_id=fields.UUID(required=False, description="Filter by user ID"),
-    status=fields.String(required=False, description="Filter by order status"),
-    start_date=fields.DateTime(required=False, description="Filter by start date"),
-    end_date=fields.DateTime(required=False, description="Filter by end date"),
-    min_amount=fields.Float(required=False, description="Filter by minimum amount"),
-    max_amount=fields.Float(required=False, description="Filter by maximum amount"),
-    page=fields.Integer(required=False, missing=1, description="Page number"),
-    per_page=fields.Integer(required=False, missing=10, description="Items per page")
+    user_id = fields.UUID(required=False, description="Filter by user ID")
+    status = fields.String(required=False, description="Filter by order status")
+    start_date = fields.DateTime(required=False, description="Filter by start date")
+    end_date = fields.DateTime(required=False, description="Filter by end date")
+    min_amount = fields.Float(required=False, description="Filter by minimum amount")
+    max_amount = fields.Float(required=False, description="Filter by maximum amount")
+    page = fields.Integer(required=False, missing=1, description="Page number")
+    per_page = fields.Integer(required=False, missing=10, description="Items per page")
+    cursor = fields.String(required=False, allow_none=True, description="Opaque cursor returned as next_cursor by the previous page")
+    use_cursor = fields.Boolean(required=False, missing=False, description="Use cursor pagination starting from the first page")
+    include_total = fields.Boolean(required=False, missing=True, description="Count all matching orders (can be skipped in cursor mode)")
+
+class OrderExportSchema(Schema):
+    format = fields.String(required=False, missing="csv", validate=validate.OneOf(["csv", "ndjson"]), description="Export format")
+    gzip = fields.Boolean(required=False, description="gzip-encode the export (defaults to the client's Accept-Encoding)")
+    user_id = fields.UUID(required=False, description="Filter by user ID")
+    status = fields.String(required=False, description="Filter by order status")
+    start_date = fields.DateTime(required=False, description="Filter by start date")
+    end_date = fields.DateTime(required=False, description="Filter by end date")
+    min_amount = fields.Float(required=False, description="Filter by minimum amount")
+    max_amount = fields.Float(required=False, description="Filter by maximum amount")
 
 class CreateOrderSchema(Schema):
     items = fields.List(fields.Nested(OrderItemSchema), required=True, validate=validate.Length(min=1))
@@ -37,9 +50,10 @@ class UpdateOrderStatusSchema(Schema):
 
 class PaginationSchema(Schema):
     page=fields.Integer(required=False)
-    pages=fields.Integer(required=False)
+    pages=fields.Integer(required=False, allow_none=True)
     per_page=fields.Integer(required=False)
-    total=fields.Integer(required=False)
+    total=fields.Integer(required=False, allow_none=True)
+    next_cursor=fields.String(required=False, allow_none=True)
 
 class OrderListSchema(Schema):
     orders = fields.Nested(OrderSchema,many=True)
@@ -55,6 +55,9 @@ class ProductFilterSchema(Schema):
     )
     page = fields.Int(description="Page number", default=1)
     items_per_page = fields.Int(description="Items per page", default=20)
+    cursor = fields.Str(description="Opaque cursor returned as next_cursor by the previous page")
+    use_cursor = fields.Bool(description="Use cursor pagination starting from the first page", default=False)
+    include_total = fields.Bool(description="Count all matching products (can be skipped in cursor mode)", default=True)
     # Additional fields for advanced filtering
     min_price = fields.Float(description="Minimum price filter")
     max_price = fields.Float(description="Maximum price filter")
@@ -73,6 +76,9 @@ class ProductSearchSchema(Schema):
     in_stock_only = fields.Bool(description="Show only products in stock", default=False)
     page = fields.Int(description="Page number", default=1)
     page_size = fields.Int(description="Items per page", default=20)
+    cursor = fields.Str(description="Opaque cursor returned as next_cursor by the previous page")
+    use_cursor = fields.Bool(description="Use cursor pagination starting from the first page", default=False)
+    include_total = fields.Bool(description="Count all matching products (can be skipped in cursor mode)", default=True)
     sort_by = fields.Str(
         description="Field to sort by", 
         validate=validate.OneOf(["name", "price", "created_at", "brand"]),
@@ -103,10 +109,11 @@ class ProductResponseSchema(Schema):
 class ProductPaginatedSchema(Schema):
     """Schema for paginated product response"""
     items = fields.List(fields.Nested(ProductSchema), description="List of products")
-    total = fields.Int(description="Total number of products")
+    total = fields.Int(description="Total number of products", allow_none=True)
     page = fields.Int(description="Current page number")
     items_per_page = fields.Int(description="Items per page")
-    total_pages = fields.Int(description="Total number of pages")
+    total_pages = fields.Int(description="Total number of pages", allow_none=True)
+    next_cursor = fields.Str(description="Cursor for the next page, null on the last page", allow_none=True)
 
 class ProductPaginatedResponseSchema(Schema):
     """Schema for product response"""
@@ -114,6 +121,20 @@ class ProductPaginatedResponseSchema(Schema):
     message = fields.Str()
     data = fields.Nested(ProductPaginatedSchema)
 
+class BulkProductResultSchema(Schema):
+    """Schema for the outcome of a bulk product creation"""
+    created = fields.List(fields.Nested(ProductSchema), description="Created products")
+    errors = fields.List(fields.Dict(), description="Rejected products with their index and error")
+    total_attempted = fields.Int(description="Number of products submitted")
+    total_created = fields.Int(description="Number of products created")
+    total_errors = fields.Int(description="Number of products rejected")
+
+class BulkProductResponseSchema(Schema):
+    """Schema for bulk product creation response"""
+    code = fields.Int()
+    message = fields.Str()
+    data = fields.Nested(BulkProductResultSchema)
+
 class ProductExpiryReportSchema(Schema):
     """Schema for product expiry report"""
     product = fields.Nested(ProductResponseSchema, description="Product information")
@@ -10,7 +10,10 @@ from app.services.product_service.application.queries.get_products_by_filter imp
 # from app.api.decorators.error_handler import handle_exceptions
 from app.api import product_bp
 from app.api.base_routes import BaseRoute
-from app.api.product.product_shemas import ProductSchema, ProductResponseSchema, ProductFilterSchema, ProductPaginatedResponseSchema, ProductSearchSchema, BulkProductSchema
+from app.api.decorators.auth_decorator import require_admin
+from app.services.product_service.infrastructure.importers.product_import_reader import IMPORT_FORMATS, detect_import_format
+from flask import current_app, request
+from app.api.product.product_shemas import ProductSchema, ProductResponseSchema, ProductFilterSchema, ProductPaginatedResponseSchema, ProductSearchSchema, BulkProductSchema, BulkProductResponseSchema
 from typing import Tuple, Dict, Any
 
 @product_bp.route('/')
@@ -184,7 +187,7 @@ class ProductBulkRoute(BaseRoute):
     
     @product_bp.doc(description="Create multiple products in a single operation")
     @product_bp.arguments(BulkProductSchema)
-    @product_bp.response(HTTPStatus.CREATED, ProductPaginatedResponseSchema)
+    @product_bp.response(HTTPStatus.CREATED, BulkProductResponseSchema)
     def post(self, request_data: Dict[str, Any]) -> Tuple[dict, int]:
         """Create multiple products at once"""
         try:
@@ -203,6 +206,47 @@ class ProductBulkRoute(BaseRoute):
                 status_code=HTTPStatus.BAD_REQUEST
             )
 
+@product_bp.route('/import')
+class ProductImportRoute(BaseRoute):
+    """
+    Streamed catalog import from CSV or JSON Lines
+    """
+    
+    @require_admin
+    @product_bp.doc(description=(
+        "Import products from a CSV or JSON Lines file, sent either as the multipart field 'file' "
+        "or as the raw request body (Content-Type text/csv or application/x-ndjson). "
+        "Pass ?format=csv|jsonl when neither reveals the format. Rows are inserted in chunked "
+        "transactions and the response lists the rows that were rejected."
+    ))
+    def post(self) -> Tuple[dict, int]:
+        """Import products in bulk"""
+        upload = request.files.get('file')
+        if upload is not None:
+            stream, fmt = upload.stream, detect_import_format(upload.mimetype, upload.filename)
+        else:
+            stream, fmt = request.stream, detect_import_format(request.mimetype)
+        fmt = request.args.get('format', fmt)
+        
+        if fmt not in IMPORT_FORMATS:
+            return self._error_response(
+                message="Unknown import format, expected csv or jsonl",
+                status_code=HTTPStatus.BAD_REQUEST
+            )
+        
+        report = container.product_service().import_products(
+            stream,
+            fmt,
+            chunk_size=current_app.config.get('PRODUCT_IMPORT_CHUNK_SIZE', 500),
+            max_errors=current_app.config.get('PRODUCT_IMPORT_MAX_ERRORS', 1000)
+        )
+        
+        return self._success_response(
+            data=report.model_dump(mode='json', exclude={'created'}),
+            message=f"Imported {report.total_created} of {report.total_rows} products",
+            status_code=HTTPStatus.CREATED if report.total_created else HTTPStatus.OK
+        )
+
 @product_bp.route('/categories/<uuid:category_id>')
 class ProductByCategoryRoute(BaseRoute):
     """
@@ -1,16 +1,28 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from dependency_injector import containers, providers
 
-from app.services.invoice_service.service import InvoiceService
-from app.services.order_service.service import OrderService
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.application.events.event_bus import EventBus
 from app.dataBase import Database
-from app.services.inventory_service.service import InventoryService
-from app.services.auth_service.service import AuthService
-from app.services.product_service.service import ProductService
-from app.services.category_service.service import CategoryService
 from app.shared.domain.enums.enums import ServiceType
 
+if TYPE_CHECKING:
+    from app.services.inventory_service.service import InventoryService
+    from app.services.product_service.service import ProductService
+    from app.services.category_service.service import CategoryService
+
+
+def _deferred(path: str):
+    """Constructor for ``module.Class`` that imports the module on first call."""
+    module_name, _, class_name = path.rpartition('.')
+
+    def build(*args, **kwargs):
+        return getattr(import_module(module_name), class_name)(*args, **kwargs)
+    return build
+
+
 class Container(containers.DeclarativeContainer):
     """IoC container."""
    
@@ -24,39 +36,44 @@ class Container(containers.DeclarativeContainer):
    
     
     # # Services
-    inventory_service = providers.Factory(
-        InventoryService,
+    # Each service module is imported when its service is first built rather
+    # than with the container, so a worker only loads the services it uses.
+    # Services are built once per worker process: they only hold the scoped
+    # session proxy and register their event handlers on construction, so
+    # rebuilding them per request would grow the event bus handler lists.
+    inventory_service = providers.ThreadSafeSingleton(
+        _deferred("app.services.inventory_service.service.InventoryService"),
         db=db,
         event_bus=event_bus,
         acl=unified_acl
     )
-    auth_service = providers.Factory(
-        AuthService,
+    auth_service = providers.ThreadSafeSingleton(
+        _deferred("app.services.auth_service.service.AuthService"),
         db=db,
         event_bus=event_bus
     )
-    order_service = providers.Factory(
-        OrderService,
+    order_service = providers.ThreadSafeSingleton(
+        _deferred("app.services.order_service.service.OrderService"),
         db=db,
         event_bus=event_bus,
         acl=unified_acl
     )
-    product_service = providers.Factory(
-        ProductService,
+    product_service = providers.ThreadSafeSingleton(
+        _deferred("app.services.product_service.service.ProductService"),
         db=db,
         event_bus=event_bus,
         acl=unified_acl
     )
 
-    invoice_service = providers.Factory(
-        InvoiceService,
+    invoice_service = providers.ThreadSafeSingleton(
+        _deferred("app.services.invoice_service.service.InvoiceService"),
         db=db,
         event_bus=event_bus,
         acl=unified_acl
     )
     
-    category_service = providers.Factory(
-        CategoryService,
+    category_service = providers.ThreadSafeSingleton(
+        _deferred("app.services.category_service.service.CategoryService"),
         db=db,
         event_bus=event_bus,
         acl=unified_acl
@@ -65,9 +82,9 @@ class Container(containers.DeclarativeContainer):
     @providers.Singleton
     def register_services(
         unified_acl: UnifiedACL,
-        inventory_service: InventoryService,
-        product_service: ProductService,
-        category_service: CategoryService,
+        inventory_service: "InventoryService",
+        product_service: "ProductService",
+        category_service: "CategoryService",
         # order_service: OrderService,
         # user_service: UserService,
         # payment_service: PaymentService,
@@ -1,3 +1,6 @@
+import os
+from contextlib import contextmanager
+
 from flask import Flask, jsonify
 from flask_marshmallow import Marshmallow
 from flask_jwt_extended import JWTManager
@@ -38,16 +41,35 @@ def init_resources(app: Flask):
             "For production, set DATABASE_URL environment variable or ensure fallback is configured."
         )
     
+    from app.shared.infrastructure.serialization import init_json_provider
+    init_json_provider(app)
+
+    # Resolved per dialect on first use, so it has to be set before the engine runs
+    from app.shared.database_types import configure_uuid_storage
+    configure_uuid_storage(app.config.get('SQLITE_UUID_STORAGE', 'text'))
+
+    # Pool sizing, timeouts and pragmas from the selected engine profile
+    from app.shared.infrastructure.persistence.engine import build_engine_options, configure_engine
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', build_engine_options(app.config))
+    
     # Initialize database
     try:
         db.init_app(app)
+        with app.app_context():
+            configure_engine(db.engine, app.config)
     except Exception as e:
         app.logger.error(f"Failed to initialize database: {e}")
         raise RuntimeError(f"Database initialization failed: {e}")
     
+    init_write_intent(app)
+
     # Initialize other extensions
     ma.init_app(app)
     jwt.init_app(app)
+    # Alembic is only needed by the migration commands; the flask CLI sets
+    # FLASK_RUN_FROM_CLI, so web workers never import it
+    if os.environ.get('FLASK_RUN_FROM_CLI'):
+        init_migrate(app)
     api.init_app(app)
 
     # Initialize container resources
@@ -64,6 +86,195 @@ def init_resources(app: Flask):
     
     app.extensions_data['event_bus'] = event_bus
 
+    if app.config.get('EVENT_BUS_DISPATCH_MODE') == 'concurrent':
+        event_bus.configure_dispatch(
+            concurrent=True,
+            max_workers=app.config.get('EVENT_BUS_MAX_WORKERS', 4),
+            backlog_size=app.config.get('EVENT_BUS_BACKLOG_SIZE', 1000),
+            handler_scope=_event_handler_scope(app)
+        )
+
+    if app.config.get('OUTBOX_ENABLED'):
+        init_outbox(app, event_bus)
+
+    init_event_relay(app, event_bus)
+
+    init_catalog_cache(app)
+    container.auth_service().configure_authorization(app.config.get('AUTHZ_CACHE_TTL', 30))
+
+    if app.config.get('SCHEDULER_ENABLED'):
+        init_scheduler(app)
+
+
+def init_migrate(app: Flask):
+    """Register Flask-Migrate for `flask db` and `flask migrate-db`"""
+    if 'migrate' in app.extensions:
+        return
+    from flask_migrate import Migrate
+    Migrate(app, db)
+
+
+def init_write_intent(app: Flask):
+    """Declare requests with unsafe methods as writes (BEGIN IMMEDIATE on SQLite)"""
+    from flask import g, request
+    from app.shared.infrastructure.persistence.engine import reset_write_intent, set_write_intent
+
+    @app.before_request
+    def _set_write_intent():
+        g.write_intent_token = set_write_intent(request.method not in ('GET', 'HEAD', 'OPTIONS'))
+
+    @app.teardown_request
+    def _reset_write_intent(exc=None):
+        token = g.pop('write_intent_token', None)
+        if token is not None:
+            reset_write_intent(token)
+
+
+def _event_handler_scope(app: Flask):
+    """Run each concurrently dispatched handler in its own app context and transaction"""
+    from app.shared.infrastructure.persistence.engine import write_intent
+
+    @contextmanager
+    def scope():
+        with app.app_context(), write_intent():
+            try:
+                yield
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+    return scope
+
+
+def init_event_relay(app: Flask, event_bus):
+    """Relay events to the other workers through EVENT_BUS_TRANSPORT and consume theirs"""
+    from app.shared.infrastructure.messaging import EventRelay, build_event_transport
+
+    transport = build_event_transport(app.config, app.instance_path)
+    if transport is None:
+        return
+
+    relay = EventRelay.from_config(app, event_bus, transport)
+    event_bus.set_transport(relay)
+    app.extensions_data['event_relay'] = relay
+
+    # Started by the first request in each worker, like the outbox dispatcher
+    @app.before_request
+    def _start_event_relay():
+        if relay.running:
+            return
+        subscribe_event_handlers()
+        relay.start()
+
+
+def init_catalog_cache(app: Flask):
+    """Put the configured cache backend in front of product catalog reads"""
+    from app.shared.infrastructure.cache import build_cache_backend
+
+    product_service = container.product_service()
+    product_service.configure_catalog_cache(
+        build_cache_backend(app.config),
+        app.config.get('CATALOG_CACHE_TTL', 30)
+    )
+
+
+def init_request_metrics(app: Flask):
+    """Record per-endpoint timings and serve them, with pool/cache/handler stats, on /metrics"""
+    from app.shared.infrastructure.observability import RequestMetrics, stats_collector
+    from app.shared.infrastructure.persistence.engine import pool_stats
+
+    event_bus = container.event_bus()
+    metrics = RequestMetrics()
+    with app.app_context():
+        engine = db.engine
+    metrics.init_app(app, engine, event_bus)
+
+    registry = metrics.registry
+    registry.add_collector(stats_collector("db_pool", "Connection pool usage", lambda: pool_stats(engine)))
+    registry.add_collector(stats_collector(
+        "catalog_cache", "Product catalog cache", lambda: container.product_service().get_catalog_cache_stats()
+    ))
+    registry.add_collector(stats_collector(
+        "authz_principal_cache", "Admin principal cache", lambda: container.auth_service().get_authorization_stats()
+    ))
+    registry.add_collector(stats_collector(
+        "event_handler", "Cumulative event handler stats", event_bus.get_handler_stats, label="handler"
+    ))
+    timings = app.extensions_data.get('startup_timings')
+    if timings is not None:
+        registry.add_collector(stats_collector("startup", "Startup phase durations of this worker", timings.stats))
+    relay = app.extensions_data.get('event_relay')
+    if relay is not None:
+        registry.add_collector(stats_collector("event_relay", "Cross-worker event relay and stream", relay.stats))
+    scheduler = app.extensions_data.get('scheduler')
+    if scheduler is not None:
+        registry.add_collector(stats_collector(
+            "scheduled_job", "Periodic job runs in this worker", scheduler.stats, label="job"
+        ))
+    app.extensions_data['request_metrics'] = metrics
+
+
+def build_scheduler(app: Flask):
+    """Periodic scheduler with every maintenance job registered"""
+    from app.shared.infrastructure.scheduler import PeriodicScheduler
+
+    scheduler = PeriodicScheduler(app)
+    scheduler.add_job(
+        "invoices.mark_overdue",
+        lambda: container.invoice_service().check_and_update_overdue_invoices(
+            app.config.get('OVERDUE_SWEEP_BATCH_SIZE', 500)
+        ),
+        interval=app.config.get('OVERDUE_SWEEP_INTERVAL', 3600)
+    )
+    return scheduler
+
+
+def init_scheduler(app: Flask):
+    """Run the periodic jobs in this worker, each guarded by an advisory lock"""
+    scheduler = build_scheduler(app)
+    app.extensions_data['scheduler'] = scheduler
+
+    # Like the outbox dispatcher, started by the first request so that CLI
+    # commands never spawn the scheduler thread
+    @app.before_request
+    def _start_scheduler():
+        if not scheduler.running:
+            scheduler.start()
+
+
+def subscribe_event_handlers():
+    """Build every service once so that all event handlers are subscribed."""
+    container.inventory_service()
+    container.product_service()
+    container.order_service()
+    container.invoice_service()
+    container.category_service()
+    container.auth_service()
+
+
+def init_outbox(app: Flask, event_bus):
+    """Route events through the transactional outbox and start its dispatcher"""
+    from app.shared.infrastructure.outbox import OutboxDispatcher, TransactionalOutbox
+
+    event_bus.set_outbox(TransactionalOutbox(lambda: db.session))
+
+    if not app.config.get('OUTBOX_RUN_DISPATCHER'):
+        return
+
+    dispatcher = OutboxDispatcher.from_config(app, event_bus)
+    app.extensions_data['outbox_dispatcher'] = dispatcher
+
+    # Started on the first request rather than here, so that CLI commands
+    # (flask db upgrade, flask outbox-worker, ...) never spawn dispatcher threads
+    @app.before_request
+    def _start_outbox_dispatcher():
+        if dispatcher.running:
+            return
+        # Handlers are only subscribed when their service is built; build them
+        # all first so the dispatcher never sees an event without subscribers
+        subscribe_event_handlers()
+        dispatcher.start()
+
     
     
 
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+@dataclass
+class ChangeUserAccessCommand:
+    """Command for changing a user's role or active state, or revoking their tokens"""
+    user_id: UUID
+    is_admin: Optional[bool] = None
+    is_active: Optional[bool] = None
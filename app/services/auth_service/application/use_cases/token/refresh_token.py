@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from app.services.auth_service.domain.exceptions.auth_errors import InvalidCredentialsError
 from app.services.auth_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.auth_service.infrastructure.query_services.aurh_query_service import AuthQueryService
+from app.services.auth_service.infrastructure.security.authorization import AUTHZ_VERSION_CLAIM
 
 
 @dataclass
@@ -26,6 +27,11 @@ class RefreshTokenUseCase:
         if not user:
             raise InvalidCredentialsError("User not found.")
 
+        # Refresh tokens issued before a role change or revocation are dead too
+        token_version = self._uow.jwt_manager.current_claims().get(AUTHZ_VERSION_CLAIM)
+        if not user.is_active or (token_version is not None and token_version != user.authz_version):
+            raise InvalidCredentialsError("Refresh token has been revoked.")
+
         access_token = self._uow.jwt_manager.create_access_token(user)
         new_refresh_token = self._uow.jwt_manager.create_refresh_token(user)
 
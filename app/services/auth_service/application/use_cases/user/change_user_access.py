@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+from uuid import UUID
+
+from app.services.auth_service.application.commands.user.change_user_access_command import ChangeUserAccessCommand
+from app.services.auth_service.domain.exceptions.auth_errors import UserNotFoundError
+from app.services.auth_service.domain.interfaces.unit_of_work import UnitOfWork
+
+@dataclass
+class ChangeUserAccessOutputDTO:
+    """Output DTO for a user access change"""
+    user_id: UUID
+    is_admin: bool
+    is_active: bool
+    authz_version: int
+
+class ChangeUserAccessUseCase:
+    def __init__(self, uow: UnitOfWork, on_changed: Optional[Callable[[UUID], None]] = None):
+        self._uow = uow
+        # Lets the authorizer drop its cached principal once the change is committed
+        self._on_changed = on_changed
+
+    def execute(self, command: ChangeUserAccessCommand) -> ChangeUserAccessOutputDTO:
+        """
+        Apply a role/active change and bump the user's authorization version.
+
+        With neither flag set this only revokes the user's existing tokens.
+        """
+        if not self._uow.user.update_access(command.user_id, command.is_admin, command.is_active):
+            raise UserNotFoundError(f"User with id {command.user_id} does not exist.")
+        self._uow.commit()
+
+        if self._on_changed:
+            self._on_changed(command.user_id)
+
+        is_active, is_admin, authz_version = self._uow.user.get_access_state(command.user_id)
+        return ChangeUserAccessOutputDTO(
+            user_id=command.user_id,
+            is_admin=is_admin,
+            is_active=is_active,
+            authz_version=authz_version
+        )
@@ -19,6 +19,9 @@ class UserEntity:
     is_active: bool = True
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Bumped whenever the user's role or access changes; tokens carry the
+    # version they were issued under and older ones stop being accepted
+    authz_version: int = 0
 
     def verify_password(self, plain_password: str) -> bool:
         """Verify if the provided password matches the user's password"""        
@@ -40,7 +43,8 @@ class UserEntity:
             health_care_center_id=self.health_care_center_id,
             is_active=False,
             created_at=self.created_at,
-            updated_at=datetime.now(UTC)
+            updated_at=datetime.now(UTC),
+            authz_version=self.authz_version
         )
     
     def update(self, **kwargs):
@@ -56,5 +60,6 @@ class UserEntity:
             health_care_center_id=kwargs.get('health_care_center_id', self.health_care_center_id),
             is_active=kwargs.get('is_active', self.is_active),
             created_at=self.created_at,
-            updated_at=datetime.now(UTC)
+            updated_at=datetime.now(UTC),
+            authz_version=kwargs.get('authz_version', self.authz_version)
         ) 
\ No newline at end of file
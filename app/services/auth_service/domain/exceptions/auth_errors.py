@@ -34,3 +34,7 @@ class UserNotFoundError(BaseAPIException):
 
 
 
+
+class AuthorizationError(BaseAPIException):
+    status_code = HTTPStatus.FORBIDDEN
+    error_code = "AUTHORIZATION_ERROR"
@@ -14,6 +14,7 @@ class UserModel(db.Model):
     phone = Column(String, nullable=False)
     is_admin = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
+    authz_version = Column(Integer, nullable=False, default=0, server_default='0')
     created_at = Column(DateTime(timezone=True), default=datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=datetime.now(timezone.utc), onupdate=lambda:datetime.now(timezone.utc))
     health_care_center_id = Column(UUID(as_uuid=True),  ForeignKey('health_care_centers.id'),nullable=True)
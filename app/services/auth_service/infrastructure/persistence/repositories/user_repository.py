@@ -52,6 +52,32 @@ class UserRepository:
         user_model.health_care_center_id=user.health_care_center_id
         self._session.flush()
 
+    def get_access_state(self, user_id: UUID) -> Optional[tuple]:
+        """(is_active, is_admin, authz_version) of a user, without loading the full row"""
+        row = (
+            self._session.query(UserModel.is_active, UserModel.is_admin, UserModel.authz_version)
+            .filter(UserModel.id == user_id)
+            .first()
+        )
+        return tuple(row) if row else None
+
+    def update_access(self, user_id: UUID, is_admin: Optional[bool] = None, is_active: Optional[bool] = None) -> bool:
+        """
+        Change a user's role or active flag and bump their authorization version,
+        which revokes every token issued before the change.
+        """
+        values = {UserModel.authz_version: UserModel.authz_version + 1}
+        if is_admin is not None:
+            values[UserModel.is_admin] = is_admin
+        if is_active is not None:
+            values[UserModel.is_active] = is_active
+        updated = (
+            self._session.query(UserModel)
+            .filter(UserModel.id == user_id)
+            .update(values, synchronize_session=False)
+        )
+        return updated > 0
+
 
 
     def _to_entity(self, model: UserModel) -> UserEntity:
@@ -66,5 +92,6 @@ class UserRepository:
             is_active=model.is_active,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            health_care_center_id=model.health_care_center_id
+            health_care_center_id=model.health_care_center_id,
+            authz_version=model.authz_version or 0
         )
\ No newline at end of file
@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from uuid import UUID
+
+from app.services.auth_service.domain.exceptions.auth_errors import AuthenticationError, AuthorizationError
+
+logger = logging.getLogger(__name__)
+
+# Claim carrying the user's authorization version at token issue time
+AUTHZ_VERSION_CLAIM = "authz_version"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authorization-relevant state of a user."""
+    user_id: UUID
+    is_active: bool
+    is_admin: bool
+    authz_version: int
+
+
+class PrincipalCache:
+    """
+    Per-worker TTL cache of principals, keyed by user ID.
+
+    Entries written through another worker are only seen here once they
+    expire, which bounds how long a revoked admin token stays usable on
+    the other workers.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 10000):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: Dict[UUID, Tuple[float, Principal]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, user_id: UUID) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(user_id, None)
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry[1]
+
+    def put(self, principal: Principal) -> None:
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                # Principals are tiny and short-lived; starting over is simpler than LRU
+                self._entries.clear()
+            self._entries[principal.user_id] = (time.monotonic() + self._ttl, principal)
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "entries": len(self._entries)}
+
+
+class ClaimsAuthorizer:
+    """
+    Authorizes requests from verified JWT claims.
+
+    A token without the ``is_admin`` claim is refused without touching the
+    database, since claims can only ever narrow what the stored user may
+    do. Admin tokens are checked against the cached principal: the user
+    must still be an active admin, and the token's ``authz_version`` must
+    match the user's current one, so bumping the version (role change,
+    deactivation, revocation) invalidates every token issued before it.
+    """
+
+    def __init__(self, principal_loader: Callable[[UUID], Optional[Principal]], cache: Optional[PrincipalCache] = None):
+        self._load_principal = principal_loader
+        self._cache = cache or PrincipalCache()
+
+    def authorize_admin(self, identity: Any, claims: Mapping[str, Any]) -> Principal:
+        """
+        Check that a verified token belongs to a current administrator.
+
+        Args:
+            identity: The token's subject (user ID)
+            claims: The token's verified claims
+
+        Returns:
+            The administrator's principal
+
+        Raises:
+            AuthorizationError: If the token or the user is not an admin
+            AuthenticationError: If the user is gone, inactive, or the token was revoked
+        """
+        if not claims.get("is_admin"):
+            raise AuthorizationError("Admin privileges required")
+
+        principal = self.get_principal(UUID(str(identity)), claims.get(AUTHZ_VERSION_CLAIM))
+
+        if principal is None or not principal.is_active:
+            raise AuthenticationError("Authentication required")
+
+        token_version = claims.get(AUTHZ_VERSION_CLAIM)
+        # Tokens issued before versioning existed carry no version; they are
+        # still checked against the stored admin flag below
+        if token_version is not None and token_version != principal.authz_version:
+            raise AuthenticationError("Token has been revoked")
+
+        if not principal.is_admin:
+            raise AuthorizationError("Admin privileges required")
+
+        return principal
+
+    def get_principal(self, user_id: UUID, min_version: Optional[int] = None) -> Optional[Principal]:
+        """
+        Cached principal lookup.
+
+        A cached entry older than ``min_version`` (the token was issued after
+        a version bump this worker has not seen yet) is reloaded.
+        """
+        principal = self._cache.get(user_id)
+        if principal is not None and (min_version is None or principal.authz_version >= min_version):
+            return principal
+
+        principal = self._load_principal(user_id)
+        if principal is not None:
+            self._cache.put(principal)
+        return principal
+
+    def invalidate(self, user_id: UUID) -> None:
+        """Forget this worker's cached principal for a user."""
+        self._cache.invalidate(user_id)
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
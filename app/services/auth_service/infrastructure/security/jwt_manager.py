@@ -1,6 +1,7 @@
 from datetime import timedelta
-from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended import create_access_token, create_refresh_token, get_jwt, get_jwt_identity, verify_jwt_in_request
 from app.services.auth_service.domain.entities import UserEntity
+from app.services.auth_service.infrastructure.security.authorization import AUTHZ_VERSION_CLAIM
 from flask import request
 from flask_jwt_extended.exceptions import NoAuthorizationError
 import logging
@@ -20,7 +21,8 @@ class JWTManager:
             expires_delta=False,
             additional_claims={
                 "username": user.username,
-                "is_admin": user.is_admin
+                "is_admin": user.is_admin,
+                AUTHZ_VERSION_CLAIM: user.authz_version
             }
         )
 
@@ -28,7 +30,8 @@ class JWTManager:
         """Create a new refresh token for a user"""
         return create_refresh_token(
             identity=str(user.id),
-            expires_delta=self._refresh_expires
+            expires_delta=self._refresh_expires,
+            additional_claims={AUTHZ_VERSION_CLAIM: user.authz_version}
         )
         
     def decode_refresh_token(self) -> str:
@@ -55,6 +58,10 @@ class JWTManager:
             logger.error(f"Error decoding refresh token: {str(e)}")
             return None
             
+    def current_claims(self) -> dict:
+        """Claims of the token verified for the current request"""
+        return get_jwt()
+            
     def get_token_from_header(self) -> str:
         """
         Extract the JWT token from the Authorization header
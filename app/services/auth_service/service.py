@@ -1,3 +1,5 @@
+from typing import Optional
+
 from app.services.auth_service.application.commands import LoginCommand,RegisterUserCommand,AdminRegistrationCommand,GenerateAccessCodeCommand
 from app.services.auth_service.application.commands.health_care_center import create_center_command
 from app.services.auth_service.application.commands.health_care_center.update_center_command import UpdateHealthCareCenterCommand
@@ -19,6 +21,9 @@ from app.services.auth_service.application.use_cases.health_care_center.create_c
 from app.services.auth_service.application.use_cases.health_care_center.update_center import UpdateHealthCareCenterUseCase
 from app.services.auth_service.application.use_cases.health_care_center.get_center_by_id import GetHealthCareCenterByIdUseCase
 from app.services.auth_service.application.use_cases.health_care_center.delete_center import DeleteHealthCareCenterUseCase
+from app.services.auth_service.application.use_cases.user.change_user_access import ChangeUserAccessUseCase
+from app.services.auth_service.application.commands.user.change_user_access_command import ChangeUserAccessCommand
+from app.services.auth_service.infrastructure.security.authorization import ClaimsAuthorizer, Principal, PrincipalCache
 from app.services.auth_service.infrastructure.query_services.access_code_query_service import AccessCodeQueryService
 from app.services.auth_service.infrastructure.query_services.health_care_center_query_service import HealthCareCenterQueryService
 from app.shared.domain.exceptions.common_errors import InitializeComponentsError
@@ -53,6 +58,10 @@ class AuthService:
             self._refresh_token_use_case= RefreshTokenUseCase(self._uow, self._auth_query_service)
             self._register_user_use_case = RegisterUserUseCase(self._uow, self._access_code_query_service)
             
+            # Authorization
+            self._authorizer = ClaimsAuthorizer(self._load_principal, PrincipalCache())
+            self._change_user_access_use_case = ChangeUserAccessUseCase(self._uow, self._authorizer.invalidate)
+            
             # Access code related use cases
             self._generate_access_code_use_case = GenerateAccessCodeUseCase(self._uow)
             self._validate_access_code_use_case = ValidateAccessCodeUseCase(self._uow, self._access_code_query_service)
@@ -71,6 +80,39 @@ class AuthService:
     def auth_query_service(self):
         return self._auth_query_service
         
+    def configure_authorization(self, cache_ttl: float):
+        """Set how long this worker trusts a cached principal"""
+        self._authorizer = ClaimsAuthorizer(self._load_principal, PrincipalCache(ttl=cache_ttl))
+        self._change_user_access_use_case = ChangeUserAccessUseCase(self._uow, self._authorizer.invalidate)
+        
+    def authorize_admin(self, identity, claims) -> Principal:
+        """Authorize an admin request from its verified token claims"""
+        return self._authorizer.authorize_admin(identity, claims)
+        
+    def change_user_access(self, command: ChangeUserAccessCommand):
+        """Change a user's role or active state (or only revoke their tokens)"""
+        try:
+            return self._change_user_access_use_case.execute(command)
+        except Exception as e:
+            self._uow.rollback()
+            raise e
+        
+    def get_authorization_stats(self):
+        """Hit and miss counters of the principal cache"""
+        return self._authorizer.stats()
+        
+    def _load_principal(self, user_id) -> Optional[Principal]:
+        state = self._uow.user.get_access_state(user_id)
+        if state is None:
+            return None
+        is_active, is_admin, authz_version = state
+        return Principal(
+            user_id=user_id,
+            is_active=bool(is_active),
+            is_admin=bool(is_admin),
+            authz_version=authz_version or 0
+        )
+        
     def register_admin(self, command: AdminRegistrationCommand):
         try:        
             return self._admin_register_use_case.execute(command)
@@ -1,11 +1,14 @@
 from uuid import uuid4
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from datetime import datetime
 from app.dataBase import db
 from app.shared.database_types import UUID
 
 class Category(db.Model):
     __tablename__ = 'categories'
+    __table_args__ = (
+        Index('ix_categories_parent_id', 'parent_id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(100), nullable=False)
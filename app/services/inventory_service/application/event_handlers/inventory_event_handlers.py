@@ -8,17 +8,21 @@ from app.services.inventory_service.application.events.inventory_update_requeste
 from app.services.inventory_service.application.events.stock_received_event import StockReceived
 from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
 from app.services.inventory_service.application.use_cases.record_movement.record_movement import RecordMovementUseCase
+from app.services.inventory_service.application.use_cases.reserve_stock import ReserveStockUseCase
 from app.services.inventory_service.domain.entities.inventory_entity import InventoryEntity
 from app.services.inventory_service.domain.enums.movement_type import MovementType
 from app.services.inventory_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.shared.contracts.inventory.stock_check import StockItemValidationContract
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.contracts.inventory.stock_reservation import StockReservationItemContract, StockReservationRequestContract
 
         
 logger = logging.getLogger(__name__)
 
 class InventoryEventHandler:
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, reserve_stock: ReserveStockUseCase):
         self._uow = uow
+        self._reserve_stock = reserve_stock
         
     def handle_stock_received(self, event: StockReceived):
         pass
@@ -29,6 +33,7 @@ class InventoryEventHandler:
         inventory_data = event.model_dump()  # Assuming event has a method to serialize its data
         inventory_entity = InventoryEntity(**inventory_data)  # Create an InventoryEntity from the event data      
         self._uow.inventory_repository.add(inventory_entity)  # Add the inventory entity to the unit of work
+        self._uow.publish(CatalogChangedEvent(product_ids=[inventory_entity.product_id]))
         logger.info(f"Inventory created successfully for product ID: {inventory_entity.product_id}")
     def handle_inventory_update_requested(self,event:InventoryUpdateRequestedEvent):
         inventory_data = event.model_dump()  
@@ -36,114 +41,45 @@ class InventoryEventHandler:
         inventory_entity = InventoryEntity(**inventory_data)
         
         self._uow.inventory_repository.update(inventory_entity)
+        self._uow.publish(CatalogChangedEvent(product_ids=[inventory_entity.product_id]))
         logger.info(f"Inventory updated successfully for product ID: {inventory_entity.product_id}")
             
     def handle_stock_release_requested(self, event: StockReleaseRequestedEvent):
         """
         Handle stock release request from order service.
-        Process each item to check stock availability and release if possible.
-        Publishes a result event indicating success or failure.
+        Takes the stock for all items at once with conditional updates;
+        if any item is short, nothing is taken.
         
         Args:
             event: StockReleaseRequestedEvent containing order_id and items
         """
         order_id = event.order_id
-        all_items_processed = True
-        processed_items = []
         try:
-                
-            # with self._uow:
-                for item in event.items:
-                    product_id = item['product_id']
-                    quantity = item['quantity']
-                    item_result = self._process_stock_release_item(product_id, quantity, order_id)
-                    processed_items.append(item_result)
-                    
-                    # if not item_result['success']:
-                    #     all_items_processed = False
-               
-                
+            result = self._reserve_stock.execute(StockReservationRequestContract(
+                order_id=order_id,
+                items=[StockReservationItemContract(
+                    product_id=item['product_id'],
+                    quantity=item['quantity']
+                ) for item in event.items]
+            ))
 
-                # If any item failed, we need to rollback any already processed items
-                if not all_items_processed:
-                    
-                    self._uow.rollback()
-                    # Publish failure event
-                    # self._uow.publish_event(StockReleaseProcessedEvent(
-                    #     order_id=order_id,
-                    #     success=False,
-                    #     items=processed_items
-                    # ))
-                else:
-                    self._uow.commit()
-                    # Publish success event
-                    # self._uow.publish_event(StockReleaseProcessedEvent(
-                    #     order_id=order_id,
-                    #     success=True,
-                    #     items=processed_items
-                    # ))
+            if not result.success:
+                self._uow.rollback()
+                logger.warning(f"Stock release for order {order_id} failed: {result.message}")
+                # Publish failure event
+                # self._uow.publish_event(StockReleaseProcessedEvent(
+                #     order_id=order_id,
+                #     success=False,
+                #     items=result.shortages
+                # ))
+            else:
+                self._uow.commit()
+                # Publish success event
+                # self._uow.publish_event(StockReleaseProcessedEvent(
+                #     order_id=order_id,
+                #     success=True,
+                #     items=result.reserved_items
+                # ))
         except Exception as e:
             self._uow.rollback()
-            # Publish failure event with error
-            # self._uow.publish_event(StockReleaseProcessedEvent(
-            #     order_id=order_id,
-            #     success=False,
-            #     items=[{
-            #         'product_id': item['product_id'],
-            #         'quantity': item['quantity'],
-            #         'success': False,
-            #         'message': str(e)
-            #     } for item in event.items]
-            # ))
-            
-    def _process_stock_release_item(self, product_id: UUID, quantity: int, order_id: str) -> dict:
-        """
-        Process a single item from the stock release request.
-        
-        Args:
-            product_id: The ID of the product
-            quantity: The quantity to release
-            order_id: The ID of the related order
-            
-        Returns:
-            Dictionary with processing result
-        """
-        try:
-            # Get inventory item for the product
-            inventory_item = self._uow.inventory_repository.get_by_product_id(
-                UUID(product_id))
-            
-            inventory_item.quantity = inventory_item.quantity-quantity
-
-            self._uow.inventory_repository.update(
-                inventory_item
-            )            
-            
-            # # Create movement command
-            # command = RecordMovementCommand(
-            #     inventory_id=str(inventory_item.id),
-            #     quantity=quantity,
-            #     movement_type=MovementType.OUT.value,
-            #     reference_id=order_id,
-            #     reference_type="order",
-            #     notes=f"Stock release for order {order_id}"
-            # )
-            
-            # # Record the movement using the use case
-            # movement_use_case = RecordMovementUseCase(self._uow)
-            # movement_use_case.execute(command)
-            
-            return {
-                'product_id': product_id,
-                'quantity': quantity,
-                'success': True,
-                'message': 'Stock released successfully'
-            }
-            
-        except Exception as e:
-            return {
-                'product_id': product_id,
-                'quantity': quantity,
-                'success': False,
-                'message': str(e)
-            }
\ No newline at end of file
+            logger.error(f"Stock release for order {order_id} failed: {str(e)}", exc_info=True)
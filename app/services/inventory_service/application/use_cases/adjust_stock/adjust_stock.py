@@ -6,6 +6,7 @@ from app.services.inventory_service.application.use_cases.adjust_stock.output_dt
 from app.services.inventory_service.domain.entities.inventory_entity import InventoryEntity
 from app.services.inventory_service.domain.exceptions.inventory_errors import InventoryNotFoundError
 from app.services.inventory_service.infrastructure.persistence.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from app.shared.contracts.product.product_events import CatalogChangedEvent
 
 
 class AdjustStockUseCase:
@@ -72,6 +73,7 @@ class AdjustStockUseCase:
                     self._create_movement_entity(movement_command)
                 )
                 
+                self._uow.publish(CatalogChangedEvent(product_ids=[inventory.product_id]))
                 self._uow.commit()
                 
                 # Return the result
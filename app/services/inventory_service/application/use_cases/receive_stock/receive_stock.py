@@ -5,6 +5,7 @@ from app.services.inventory_service.application.use_cases.receive_stock.output_d
 from app.services.inventory_service.domain.entities.inventory_entity import InventoryEntity
 from app.services.inventory_service.domain.exceptions.inventory_errors import InventoryNotFoundError
 from app.services.inventory_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.shared.contracts.product.product_events import CatalogChangedEvent
 class ReceiveStockUseCase :
     def __init__(self,uow:UnitOfWork):
         self._uow=uow
@@ -64,5 +65,6 @@ class ReceiveStockUseCase :
         return inventory
     def update_inventory(self, entity):
         entity=self._uow.inventory_repository.update(entity)
+        self._uow.publish(CatalogChangedEvent(product_ids=[entity.product_id]))
         self._uow.commit()
         return entity
@@ -0,0 +1,72 @@
+import logging
+from collections import defaultdict
+from typing import Dict
+from uuid import UUID
+
+from app.services.inventory_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.contracts.inventory.stock_reservation import (
+    StockReservationItemContract,
+    StockReservationRequestContract,
+    StockReservationResponseContract,
+    StockShortageContract
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReserveStockUseCase:
+    """
+    Takes the stock for all lines of an order in one all-or-nothing step.
+
+    The decrement joins the caller's transaction (order creation shares the
+    request session) and is not committed here, so the order and its stock
+    are committed or rolled back together. The catalog cache entries of
+    the reserved products are invalidated when it commits.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self._uow = uow
+
+    def execute(self, request: StockReservationRequestContract) -> StockReservationResponseContract:
+        quantities = self._merge_lines(request)
+        invalid = [product_id for product_id, quantity in quantities.items() if quantity <= 0]
+        if invalid:
+            return StockReservationResponseContract(
+                success=False,
+                message=f"Quantities must be positive for products: {', '.join(map(str, invalid))}"
+            )
+
+        shortages = self._uow.inventory_repository.reserve_stock(quantities)
+        if shortages:
+            logger.info(f"Stock reservation for order {request.order_id} failed for {len(shortages)} products")
+            return StockReservationResponseContract(
+                success=False,
+                message=f"Insufficient stock for {len(shortages)} of {len(quantities)} products",
+                shortages=[
+                    StockShortageContract(
+                        product_id=product_id,
+                        requested_quantity=quantities[product_id],
+                        available_quantity=available
+                    ) for product_id, available in shortages.items()
+                ]
+            )
+
+        # Cached catalog entries show the old stock until this commits
+        self._uow.publish(CatalogChangedEvent(product_ids=list(quantities)))
+        return StockReservationResponseContract(
+            success=True,
+            message="Stock reserved successfully",
+            reserved_items=[
+                StockReservationItemContract(product_id=product_id, quantity=quantity)
+                for product_id, quantity in quantities.items()
+            ]
+        )
+
+    @staticmethod
+    def _merge_lines(request: StockReservationRequestContract) -> Dict[UUID, int]:
+        """One quantity per product, so repeated lines are checked against their total"""
+        quantities: Dict[UUID, int] = defaultdict(int)
+        for item in request.items:
+            quantities[item.product_id] += item.quantity
+        return dict(quantities)
@@ -59,10 +59,15 @@ class StockCheckUseCase:
         errors = []
         results = []
         
+        # Fetch every line's inventory in one round trip, then validate in memory
+        inventories = self._uow.inventory_repository.get_by_product_ids(
+            item.product_id for item in request.items
+        )
+        
         for item in request.items:
             try:
                 # Get inventory and product data
-                inventory = self._get_inventory_or_raise(item.product_id)
+                inventory = self._get_inventory_or_raise(item.product_id, inventories)
                 # product = self._get_product_or_raise(item.product_id)
 
                 # Check product status - highest priority
@@ -113,12 +118,17 @@ class StockCheckUseCase:
         return results, errors
     
     
-    def _get_inventory_or_raise(self, product_id: UUID) -> InventoryEntity:
+    def _get_inventory_or_raise(
+        self, 
+        product_id: UUID, 
+        inventories: Dict[UUID, InventoryEntity]
+    ) -> InventoryEntity:
         """
-        Get inventory or raise appropriate error.
+        Get inventory from the prefetched batch or raise appropriate error.
         
         Args:
             product_id: The product ID to look up
+            inventories: Inventory entities keyed by product ID
             
         Returns:
             The inventory entity if found
@@ -126,7 +136,7 @@ class StockCheckUseCase:
         Raises:
             InventoryNotFoundError: If inventory not found for product
         """
-        inventory = self._uow.inventory_repository.get_by_product_id(product_id)
+        inventory = inventories.get(product_id)
         if not inventory:
             raise InventoryNotFoundError(
                 f"Inventory for product {product_id} not found",
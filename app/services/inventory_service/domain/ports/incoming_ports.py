@@ -3,9 +3,19 @@ from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
     StockCheckResponseContract
 )
+from app.shared.contracts.inventory.stock_reservation import (
+    StockReservationRequestContract,
+    StockReservationResponseContract
+)
 
 class StockCheckPort(ABC):
     """Primary/Incoming port for stock checking"""
     @abstractmethod
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract:
-        pass 
\ No newline at end of file
+        pass 
+
+class StockReservationPort(ABC):
+    """Primary/Incoming port for taking stock for an order"""
+    @abstractmethod
+    def reserve_stock(self, request: StockReservationRequestContract) -> StockReservationResponseContract:
+        pass
@@ -0,0 +1,14 @@
+from app.services.inventory_service.domain.ports.incoming_ports import StockReservationPort
+from app.shared.contracts.inventory.stock_reservation import (
+    StockReservationRequestContract,
+    StockReservationResponseContract
+)
+
+
+class StockReservationAdapter(StockReservationPort):
+    """Incoming adapter for stock reservations from other services"""
+    def __init__(self, reserve_stock_use_case):
+        self._use_case = reserve_stock_use_case
+
+    def reserve_stock(self, request: StockReservationRequestContract) -> StockReservationResponseContract:
+        return self._use_case.execute(request)
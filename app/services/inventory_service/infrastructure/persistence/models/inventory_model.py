@@ -1,12 +1,17 @@
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Float, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Float, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.shared.database_types import UUID
 from app.dataBase import db
 
 class InventoryModel(db.Model):
     __tablename__ = 'inventory'
+    __table_args__ = (
+        # One inventory row per product; also serves every product_id lookup
+        UniqueConstraint('product_id', name='uq_inventory_product_id'),
+        Index('ix_inventory_expiry_date', 'expiry_date'),
+    )
     
     id = Column(UUID(as_uuid=True), default=uuid.uuid4, primary_key=True)
     product_id = Column(UUID(as_uuid=True), ForeignKey('products.id'))
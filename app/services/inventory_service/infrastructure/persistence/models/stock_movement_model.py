@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.dataBase import db
@@ -16,6 +16,10 @@ class StockMovementModel(db.Model):
     enabling detailed reporting and analysis of inventory operations.
     """
     __tablename__ = 'stock_movements'
+    __table_args__ = (
+        Index('ix_stock_movements_inventory_id_created_at', 'inventory_id', 'created_at'),
+        Index('ix_stock_movements_reference_id', 'reference_id'),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     inventory_id = Column(UUID(as_uuid=True), ForeignKey('inventory.id'), nullable=False)
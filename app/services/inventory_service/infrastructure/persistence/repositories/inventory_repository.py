@@ -1,5 +1,6 @@
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta, timezone
 
@@ -10,6 +11,9 @@ from app.shared.infrastructure.persistence.repositories.repository import SQLAlc
 
 class InventoryRepository(SQLAlchemyRepository):
     """SQLAlchemy implementation of inventory repository."""
+
+    # Reservations retried when a shortfall disappears before it can be reported
+    RESERVE_ATTEMPTS = 3
     
     def __init__(self, session: Session):
         super().__init__(session)
@@ -34,6 +38,14 @@ class InventoryRepository(SQLAlchemyRepository):
         model = self._session.query(InventoryModel).filter(InventoryModel.product_id == product_id).first()
         return self._to_entity(model) if model else None
     
+    def get_by_product_ids(self, product_ids: Iterable[UUID]) -> Dict[UUID, InventoryEntity]:
+        """Get inventory for several products in a single query, keyed by product ID"""
+        ids = list(dict.fromkeys(product_ids))
+        if not ids:
+            return {}
+        models = self._session.query(InventoryModel).filter(InventoryModel.product_id.in_(ids)).all()
+        return {model.product_id: self._to_entity(model) for model in models}
+    
     def get_all(self) -> List[InventoryEntity]:
         """Get all inventory items"""
         models = self._session.query(InventoryModel).all()
@@ -85,6 +97,86 @@ class InventoryRepository(SQLAlchemyRepository):
         
         return [self._to_entity(model) for model in models]
     
+    def reserve_stock(self, quantities: Dict[UUID, int]) -> Dict[UUID, Optional[int]]:
+        """
+        Take stock for several products, all or nothing.
+
+        Every line is a conditional ``UPDATE inventory SET quantity =
+        quantity - :q WHERE product_id = :p AND quantity >= :q`` sent as one
+        executemany, so two orders racing for the last units cannot both
+        succeed and no line costs a read before the write. Lines are applied
+        in product_id order: concurrent reservations then lock shared rows
+        in the same order and cannot deadlock each other. The statements run
+        in a savepoint that is rolled back if any line falls short.
+
+        Args:
+            quantities: Quantity to take per product ID
+
+        Returns:
+            The lines that could not be reserved, mapped to the quantity
+            currently available (None without an inventory record); empty
+            when every line was reserved
+        """
+        lines = sorted((product_id, quantity) for product_id, quantity in quantities.items())
+        if not lines:
+            return {}
+
+        table = InventoryModel.__table__
+        stmt = update(table).where(
+            table.c.product_id == bindparam('_product_id'),
+            table.c.quantity >= bindparam('_quantity')
+        ).values(
+            quantity=table.c.quantity - bindparam('_quantity'),
+            last_updated_at=datetime.now(timezone.utc)
+        )
+        params = [{'_product_id': product_id, '_quantity': quantity} for product_id, quantity in lines]
+
+        for _ in range(self.RESERVE_ATTEMPTS):
+            if self._apply_all_or_nothing(stmt, params):
+                self._expire_quantities(quantities)
+                return {}
+
+            available = dict(self._session.execute(
+                select(table.c.product_id, table.c.quantity).where(table.c.product_id.in_(list(quantities)))
+            ).all())
+            shortages = {
+                product_id: available.get(product_id)
+                for product_id, quantity in lines
+                if available.get(product_id) is None or available[product_id] < quantity
+            }
+            if shortages:
+                return shortages
+            # Restocked between the UPDATE and the read; try again
+
+        return {product_id: None for product_id, _ in lines}
+
+    def _apply_all_or_nothing(self, stmt, params: List[dict]) -> bool:
+        """Run the executemany in a savepoint, keeping it only if every row matched"""
+        savepoint = self._session.begin_nested()
+        try:
+            connection = self._session.connection()
+            if connection.dialect.supports_sane_multi_rowcount:
+                matched = connection.execute(stmt, params).rowcount
+            else:
+                # The driver cannot report rows per executemany; count them one by one
+                matched = sum(connection.execute(stmt, line).rowcount for line in params)
+        except Exception:
+            savepoint.rollback()
+            raise
+
+        if matched == len(params):
+            savepoint.commit()
+            return True
+        savepoint.rollback()
+        return False
+
+    def _expire_quantities(self, product_ids: Iterable[UUID]) -> None:
+        """Drop quantities cached in the session for rows changed by a bulk UPDATE"""
+        ids = set(product_ids)
+        for model in list(self._session.identity_map.values()):
+            if isinstance(model, InventoryModel) and model.product_id in ids:
+                self._session.expire(model, ['quantity', 'last_updated_at'])
+
     def update(self, entity: InventoryEntity) -> InventoryEntity:
         # model = self._session.query(InventoryModel).filter(InventoryModel.id == entity.id).first()
         model = self._session.query(InventoryModel).filter(InventoryModel.product_id == entity.product_id).first()
@@ -14,14 +14,17 @@ from app.services.inventory_service.application.events.stock_release_requested_e
 from app.services.inventory_service.application.use_cases.adjust_stock.adjust_stock import AdjustStockUseCase
 from app.services.inventory_service.application.use_cases.receive_stock.receive_stock import ReceiveStockUseCase
 from app.services.inventory_service.application.use_cases.record_movement.record_movement import RecordMovementUseCase
+from app.services.inventory_service.application.use_cases.reserve_stock import ReserveStockUseCase
 from app.services.inventory_service.application.use_cases.stock_check import StockCheckUseCase
 from app.services.inventory_service.domain.entities.stock_movement_entity import StockMovementEntity
 from app.services.inventory_service.infrastructure.adapters.incoming.get_inventory_by_id import GetInventoryAdapter
 from app.services.inventory_service.infrastructure.adapters.incoming.stock_check_adapter import StockCheckAdapter
+from app.services.inventory_service.infrastructure.adapters.incoming.stock_reservation_adapter import StockReservationAdapter
 from app.services.inventory_service.infrastructure.persistence.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from app.services.inventory_service.infrastructure.query_services.inventory_query_service import InventoryQueryService
 from app.shared.application.events.event_bus import EventBus
 from app.shared.contracts.inventory.stock_check import StockCheckRequestContract, StockCheckResponseContract
+from app.shared.contracts.inventory.stock_reservation import StockReservationRequestContract, StockReservationResponseContract
 from app.shared.acl.unified_acl import UnifiedACL, ServiceContext, ServiceResponse
 from app.shared.domain.enums.enums import ServiceType
 # from app.services.inventory_service.infrastructure.errors.database_error_handler import DatabaseErrorHandler
@@ -43,11 +46,13 @@ class InventoryService:
     def _init_resources(self):
         self._uow = SQLAlchemyUnitOfWork(self._db_session,self._event_bus)
         self._stock_check_adapter = StockCheckAdapter(StockCheckUseCase(self._uow))
+        self._reserve_stock_use_case = ReserveStockUseCase(self._uow)
+        self._stock_reservation_adapter = StockReservationAdapter(self._reserve_stock_use_case)
         self._inventory_query_service = InventoryQueryService(self._db_session,self._uow)
         self._receive_stock_use_case = ReceiveStockUseCase(self._uow)
         self._record_movement_use_case = RecordMovementUseCase(self._uow)
         self._adjust_stock_use_case = AdjustStockUseCase(self._uow)
-        self._event_handler = InventoryEventHandler(self._uow)
+        self._event_handler = InventoryEventHandler(self._uow, self._reserve_stock_use_case)
         self._get_inventory_adapter = GetInventoryAdapter(self._inventory_query_service)
 
     def _register_event_handlers(self):
@@ -62,6 +67,10 @@ class InventoryService:
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract:
         return self._stock_check_adapter.stock_check(request) #stock check in api or external service inventory service
     
+    def reserve_stock(self, request: StockReservationRequestContract) -> StockReservationResponseContract:
+        """Take stock for every line of an order in the caller's transaction, all or nothing"""
+        return self._stock_reservation_adapter.reserve_stock(request)
+
     def get_inventory_by_id(self,request):
         return self._get_inventory_adapter.get_inventory_by_id(request)
     
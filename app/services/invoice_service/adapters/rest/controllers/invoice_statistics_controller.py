@@ -5,7 +5,7 @@ from flask_restful import Resource
 import logging
 
 from app.services.invoice_service.application.use_cases.get_invoice_statistics_use_case import GetInvoiceStatisticsUseCase
-from app.services.invoice_service.domain.repositories.invoice_repository import InvoiceRepository
+from app.services.invoice_service.infrastructure.query_services.invoice_statistics_query_service import InvoiceStatisticsQueryService
 from app.shared.error_handling import handle_exceptions
 
 logger = logging.getLogger(__name__)
@@ -13,8 +13,8 @@ logger = logging.getLogger(__name__)
 class InvoiceStatisticsResource(Resource):
     """Resource for fetching invoice statistics data."""
     
-    def __init__(self, invoice_repository: InvoiceRepository):
-        self.use_case = GetInvoiceStatisticsUseCase(invoice_repository)
+    def __init__(self, statistics_query_service: InvoiceStatisticsQueryService):
+        self.use_case = GetInvoiceStatisticsUseCase(statistics_query_service)
     
     def get(self, stats_type: Optional[str] = "summary") -> Dict[str, Any]:
         """
@@ -63,8 +63,8 @@ class InvoiceStatisticsResource(Resource):
 class CustomerInvoiceStatisticsResource(Resource):
     """Resource for fetching invoice statistics data for a specific customer."""
     
-    def __init__(self, invoice_repository: InvoiceRepository):
-        self.use_case = GetInvoiceStatisticsUseCase(invoice_repository)
+    def __init__(self, statistics_query_service: InvoiceStatisticsQueryService):
+        self.use_case = GetInvoiceStatisticsUseCase(statistics_query_service)
     
     def get(self, customer_id: str) -> Dict[str, Any]:
         """
@@ -111,8 +111,9 @@ class InvoiceListDTO:
     items: List[InvoiceDTO]
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: Optional[int]
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 @dataclass
 class CreateInvoiceItemDTO:
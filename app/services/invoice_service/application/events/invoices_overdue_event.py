@@ -0,0 +1,11 @@
+from datetime import date
+from typing import List
+
+from pydantic import BaseModel
+
+
+class InvoicesOverdueEvent(BaseModel):
+    """A batch of pending invoices that passed their due date and were marked OVERDUE."""
+    invoice_ids: List[str]
+    as_of: date
+    count: int
@@ -22,4 +22,7 @@ class GetInvoicesByFilterQuery(BaseModel):
     sort_by: str = "created_at"
     sort_direction: str = "desc"
     page: int = 1
-    page_size: int = 20 
\ No newline at end of file
+    page_size: int = 20
+    cursor: Optional[str] = None
+    use_cursor: bool = False
+    include_total: bool = True 
\ No newline at end of file
@@ -1,14 +1,9 @@
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from uuid import UUID
 
-from app.services.invoice_service.domain.entities.invoice import Invoice
-from app.services.invoice_service.application.queries.list_invoices_query import ListInvoicesQuery
-from app.services.invoice_service.application.dtos.invoice_dto import InvoiceDTO, InvoiceItemDTO, InvoiceListDTO
-from app.services.invoice_service.application.dtos.converters import invoice_to_dto
-from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.application.queries.get_invoices_by_filter_query import GetInvoicesByFilterQuery
+from app.services.invoice_service.application.dtos.invoice_dto import InvoiceListDTO
 from app.services.invoice_service.infrastructure.unit_of_work.unit_of_work import SQLAlchemyUnitOfWork
+from app.services.invoice_service.infrastructure.query_services.invoice_query_builder import InvoiceQueryBuilder, invoice_model_to_dto
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +12,12 @@ class ListInvoicesUseCase:
     Use case for listing invoices with pagination and filtering.
     """
     
-    def __init__(self, uow: SQLAlchemyUnitOfWork):
+    def __init__(self, uow: SQLAlchemyUnitOfWork, query_builder: InvoiceQueryBuilder):
         self._uow = uow
+        self._query_builder = query_builder
         logger.info("ListInvoicesUseCase initialized")
     
-    def execute(self, query: ListInvoicesQuery) -> InvoiceListDTO:
+    def execute(self, query: GetInvoicesByFilterQuery) -> InvoiceListDTO:
         """
         List invoices with filtering and pagination.
         
@@ -36,26 +32,29 @@ class ListInvoicesUseCase:
         try:
             with self._uow:
                 # Extract query parameters
-                filters = query.filters or {}
+                filters = InvoiceQueryBuilder.collect_filters(query)
                 page = query.page or 1
                 page_size = query.page_size or 20
                 
-                # Apply filters
-                invoices = self._apply_filters(filters)
-                
-                # Get total count for pagination
-                total_count = len(invoices)
+                # Filter, sort and paginate in the database
+                models, total_count, next_cursor = self._query_builder.paginate(
+                    filters,
+                    page=page,
+                    page_size=page_size,
+                    sort_by=query.sort_by,
+                    sort_direction=query.sort_direction,
+                    cursor=query.cursor,
+                    use_cursor=query.use_cursor,
+                    include_total=query.include_total
+                )
                 
                 # Calculate pagination metadata
-                total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
-                start_index = (page - 1) * page_size
-                end_index = min(start_index + page_size, total_count)
-                
-                # Get paginated results
-                paginated_invoices = invoices[start_index:end_index] if total_count > 0 else []
+                total_pages = None
+                if total_count is not None:
+                    total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 1
                 
                 # Convert to DTOs
-                invoice_dtos = [invoice_to_dto(invoice) for invoice in paginated_invoices]
+                invoice_dtos = [invoice_model_to_dto(model) for model in models]
                 
                 # Create list DTO with pagination metadata
                 result = InvoiceListDTO(
@@ -63,7 +62,8 @@ class ListInvoicesUseCase:
                     page=page,
                     page_size=page_size,
                     total_items=total_count,
-                    total_pages=total_pages
+                    total_pages=total_pages,
+                    next_cursor=next_cursor
                 )
                 
                 logger.info(f"Found {total_count} invoices, returning page {page} of {total_pages}")
@@ -79,54 +79,3 @@ class ListInvoicesUseCase:
                 total_items=0,
                 total_pages=1
             )
-    
-    def _apply_filters(self, filters: Dict[str, Any]) -> List[Invoice]:
-        """
-        Apply filters to the invoice repository query.
-        
-        Args:
-            filters: Dictionary of filter criteria
-            
-        Returns:
-            List of filtered invoices
-        """
-        # Start with all invoices
-        invoices = self._uow.invoices.get_all()
-        
-        # Apply specific filters
-        if "user_id" in filters:
-            user_id = filters["user_id"]
-            invoices = [inv for inv in invoices if inv.user_id == user_id]
-        
-        if "order_id" in filters:
-            order_id = filters["order_id"]
-            invoices = [inv for inv in invoices if inv.order_id == order_id]
-        
-        if "status" in filters:
-            status = filters["status"]
-            invoices = [inv for inv in invoices if inv.status == status]
-        
-        if "due_date_before" in filters:
-            date = filters["due_date_before"]
-            invoices = [inv for inv in invoices if inv.due_date.date() <= date]
-        
-        if "due_date_after" in filters:
-            date = filters["due_date_after"]
-            invoices = [inv for inv in invoices if inv.due_date.date() >= date]
-        
-        if "created_at_after" in filters:
-            date = filters["created_at_after"]
-            invoices = [inv for inv in invoices if inv.created_at.date() >= date]
-        
-        if "search" in filters:
-            search_term = filters["search"].lower()
-            invoices = [
-                inv for inv in invoices if (
-                    search_term in str(inv.id).lower() or
-                    search_term in str(inv.order_id).lower() or
-                    search_term in str(inv.user_id).lower() or
-                    (inv.notes and search_term in inv.notes.lower())
-                )
-            ]
-        
-        return invoices
\ No newline at end of file
@@ -1,11 +1,17 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Text, Enum
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
 from app.dataBase import db
 class InvoiceModel(db.Model):
     """SQLAlchemy model for invoices."""
     __tablename__ = 'invoices'
+    __table_args__ = (
+        # Overdue sweeps filter on status and due_date together
+        Index('ix_invoices_status_due_date', 'status', 'due_date'),
+        Index('ix_invoices_due_date', 'due_date'),
+        Index('ix_invoices_created_at', 'created_at'),
+    )
     
     invoice_id = Column(String(36), primary_key=True)
     order_id = Column(String(36), nullable=False, index=True)
@@ -32,6 +38,9 @@ class InvoiceModel(db.Model):
 class InvoiceItemModel(db.Model):
     """SQLAlchemy model for invoice items."""
     __tablename__ = 'invoice_items'
+    __table_args__ = (
+        Index('ix_invoice_items_invoice_id', 'invoice_id'),
+    )
     
     item_id = Column(String(36), primary_key=True)
     invoice_id = Column(String(36), ForeignKey('invoices.invoice_id'), nullable=False)
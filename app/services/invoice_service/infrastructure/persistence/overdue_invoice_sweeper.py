@@ -0,0 +1,91 @@
+import logging
+from datetime import date, datetime, time
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.services.invoice_service.application.events.invoices_overdue_event import InvoicesOverdueEvent
+from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.infrastructure.persistence.models import InvoiceModel
+from app.shared.application.events.event_bus import EventBus
+
+logger = logging.getLogger(__name__)
+
+
+class OverdueInvoiceSweeper:
+    """
+    Marks pending invoices past their due date as OVERDUE.
+
+    Each batch is a single ``UPDATE ... WHERE invoice_id IN (SELECT ...
+    LIMIT n) RETURNING invoice_id`` using the (status, due_date) index,
+    committed together with one InvoicesOverdueEvent listing the batch, so
+    with the outbox enabled the event is delivered exactly when the status
+    change is. On PostgreSQL the selected rows are locked with SKIP LOCKED,
+    leaving invoices that are being paid right now to the next sweep.
+    """
+
+    def __init__(self, session: Session, event_bus: Optional[EventBus] = None, batch_size: int = 500):
+        self._session = session
+        self._event_bus = event_bus
+        self._batch_size = max(batch_size, 1)
+
+    def sweep(self, as_of: Optional[date] = None) -> int:
+        """
+        Mark every invoice due before ``as_of`` (default today) as overdue.
+
+        Returns:
+            Number of invoices marked overdue
+        """
+        as_of = as_of or datetime.now().date()
+        total = 0
+
+        while True:
+            try:
+                invoice_ids = self._mark_batch(as_of)
+                if invoice_ids and self._event_bus is not None:
+                    self._event_bus.publish(InvoicesOverdueEvent(
+                        invoice_ids=invoice_ids,
+                        as_of=as_of,
+                        count=len(invoice_ids)
+                    ))
+                self._session.commit()
+            except Exception:
+                self._session.rollback()
+                raise
+
+            total += len(invoice_ids)
+            if len(invoice_ids) < self._batch_size:
+                break
+
+        logger.info(f"Marked {total} invoices overdue as of {as_of.isoformat()}")
+        return total
+
+    def _mark_batch(self, as_of: date) -> List[str]:
+        due = select(InvoiceModel.invoice_id).where(
+            InvoiceModel.status == InvoiceStatus.PENDING,
+            # due_date is a naive DATETIME; anything before the start of as_of is overdue
+            InvoiceModel.due_date < datetime.combine(as_of, time.min)
+        ).order_by(InvoiceModel.due_date).limit(self._batch_size).with_for_update(skip_locked=True)
+
+        if not self._session.get_bind().dialect.update_returning:
+            # No RETURNING (e.g. SQLite before 3.35): pick the batch first
+            invoice_ids = list(self._session.execute(due).scalars())
+            if invoice_ids:
+                self._session.execute(self._mark(InvoiceModel.invoice_id.in_(invoice_ids)))
+            return invoice_ids
+
+        return list(self._session.execute(
+            self._mark(InvoiceModel.invoice_id.in_(due)).returning(InvoiceModel.invoice_id)
+        ).scalars())
+
+    @staticmethod
+    def _mark(condition):
+        return update(InvoiceModel).where(
+            condition,
+            # Re-checked so a row paid between the SELECT and the UPDATE is left alone
+            InvoiceModel.status == InvoiceStatus.PENDING
+        ).values(
+            status=InvoiceStatus.OVERDUE,
+            updated_at=datetime.now()
+        ).execution_options(synchronize_session=False)
@@ -0,0 +1,269 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Query, Session, selectinload
+
+from app.services.invoice_service.application.dtos.invoice_dto import InvoiceDTO, InvoiceItemDTO, PaymentDetailsDTO
+from app.services.invoice_service.application.queries.get_invoices_by_filter_query import GetInvoicesByFilterQuery
+from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.infrastructure.persistence.models import InvoiceModel
+from app.shared.infrastructure.persistence.pagination import paginate_keyset
+
+logger = logging.getLogger(__name__)
+
+# Sortable fields exposed through GetInvoicesByFilterQuery.sort_by
+SORTABLE_COLUMNS = {
+    "id": InvoiceModel.invoice_id,
+    "invoice_id": InvoiceModel.invoice_id,
+    "order_id": InvoiceModel.order_id,
+    "user_id": InvoiceModel.user_id,
+    "total_amount": InvoiceModel.total_amount,
+    "due_date": InvoiceModel.due_date,
+    "status": InvoiceModel.status,
+    "created_at": InvoiceModel.created_at,
+}
+
+
+class InvoiceQueryBuilder:
+    """
+    Translates invoice filter criteria into SQL on the invoices table.
+
+    Filtering, sorting and pagination all run in the database, so listing a
+    page only loads that page's rows plus a separate COUNT(*) for the total.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    @staticmethod
+    def collect_filters(query: GetInvoicesByFilterQuery) -> Dict[str, Any]:
+        """
+        Merge the explicit query fields into the free-form filters dict.
+
+        Args:
+            query: The filter query
+
+        Returns:
+            Dictionary of filter criteria understood by build()
+        """
+        filters = dict(query.filters or {})
+        for name in (
+            "user_id", "order_id", "status", "is_paid",
+            "created_at_after", "created_at_before",
+            "due_date_after", "due_date_before",
+            "min_amount", "max_amount", "search"
+        ):
+            value = getattr(query, name)
+            if value is not None:
+                filters[name] = value
+        return filters
+
+    def build(self, filters: Dict[str, Any]) -> Query:
+        """
+        Build the filtered invoice query.
+
+        Args:
+            filters: Dictionary of filter criteria
+
+        Returns:
+            Unordered, unpaginated query over InvoiceModel
+        """
+        query = self._session.query(InvoiceModel)
+
+        if filters.get("user_id"):
+            query = query.filter(InvoiceModel.user_id == str(filters["user_id"]))
+
+        if filters.get("order_id"):
+            query = query.filter(InvoiceModel.order_id == str(filters["order_id"]))
+
+        if filters.get("status"):
+            query = query.filter(InvoiceModel.status == InvoiceStatus(filters["status"]))
+
+        if filters.get("is_paid") is not None:
+            if filters["is_paid"]:
+                query = query.filter(InvoiceModel.status == InvoiceStatus.PAID)
+            else:
+                query = query.filter(InvoiceModel.status != InvoiceStatus.PAID)
+
+        # Date filters are inclusive of the whole day when a date is given
+        if filters.get("created_at_after"):
+            query = query.filter(InvoiceModel.created_at >= self._lower_bound(filters["created_at_after"]))
+
+        if filters.get("created_at_before"):
+            query = query.filter(self._upper_bound(InvoiceModel.created_at, filters["created_at_before"]))
+
+        if filters.get("due_date_after"):
+            query = query.filter(InvoiceModel.due_date >= self._lower_bound(filters["due_date_after"]))
+
+        if filters.get("due_date_before"):
+            query = query.filter(self._upper_bound(InvoiceModel.due_date, filters["due_date_before"]))
+
+        # Amount filters
+        if filters.get("min_amount") is not None:
+            query = query.filter(InvoiceModel.total_amount >= filters["min_amount"])
+
+        if filters.get("max_amount") is not None:
+            query = query.filter(InvoiceModel.total_amount <= filters["max_amount"])
+
+        # Search filter
+        if filters.get("search"):
+            pattern = f"%{filters['search']}%"
+            query = query.filter(or_(
+                InvoiceModel.invoice_id.ilike(pattern),
+                InvoiceModel.order_id.ilike(pattern),
+                InvoiceModel.user_id.ilike(pattern),
+                InvoiceModel.notes.ilike(pattern)
+            ))
+
+        return query
+
+    def apply_sorting(self, query: Query, sort_by: str, sort_direction: str) -> Query:
+        """
+        Apply ORDER BY to a query, defaulting to created_at.
+
+        Args:
+            query: The query to sort
+            sort_by: Field to sort by
+            sort_direction: Direction of sort (asc or desc)
+
+        Returns:
+            Sorted query with invoice_id as a stable tie-breaker
+        """
+        column = SORTABLE_COLUMNS.get(sort_by, InvoiceModel.created_at)
+        if (sort_direction or "desc").lower() == "desc":
+            return query.order_by(column.desc(), InvoiceModel.invoice_id.desc())
+        return query.order_by(column.asc(), InvoiceModel.invoice_id.asc())
+
+    def paginate(
+        self,
+        filters: Dict[str, Any],
+        page: int = 1,
+        page_size: int = 20,
+        sort_by: str = "created_at",
+        sort_direction: str = "desc",
+        cursor: Optional[str] = None,
+        use_cursor: bool = False,
+        include_total: bool = True
+    ) -> Tuple[List[InvoiceModel], Optional[int], Optional[str]]:
+        """
+        Fetch one page of invoices and the total number of matches.
+
+        In cursor mode (a cursor is given or use_cursor is set) the page is
+        located by seeking past (sort column, invoice_id) instead of OFFSET,
+        and the COUNT(*) can be skipped with include_total=False.
+
+        Args:
+            filters: Dictionary of filter criteria
+            page: Page number (1-indexed), ignored in cursor mode
+            page_size: Number of items per page
+            sort_by: Field to sort by
+            sort_direction: Direction of sort (asc or desc)
+            cursor: Cursor returned with the previous page
+            use_cursor: Start cursor pagination from the first page
+            include_total: Whether to count all matches in cursor mode
+
+        Returns:
+            Tuple of the page's invoice models, the total count (None if
+            skipped) and the cursor for the next page (None outside cursor
+            mode or on the last page)
+        """
+        query = self.build(filters)
+        cursor_mode = bool(cursor) or use_cursor
+
+        total_count = None
+        if not cursor_mode or include_total:
+            total_count = query.with_entities(func.count(InvoiceModel.invoice_id)).scalar() or 0
+            if total_count == 0:
+                return [], 0, None
+
+        query = query.options(
+            selectinload(InvoiceModel.items),
+            selectinload(InvoiceModel.payment_details)
+        )
+
+        if cursor_mode:
+            models, next_cursor = paginate_keyset(
+                query,
+                self._keyset(sort_by, sort_direction),
+                page_size,
+                cursor
+            )
+            return models, total_count, next_cursor
+
+        page = max(page, 1)
+        models = (
+            self.apply_sorting(query, sort_by, sort_direction)
+            .limit(page_size)
+            .offset((page - 1) * page_size)
+            .all()
+        )
+        return models, total_count, None
+
+    @staticmethod
+    def _keyset(sort_by: str, sort_direction: str):
+        column = SORTABLE_COLUMNS.get(sort_by, InvoiceModel.created_at)
+        direction = "desc" if (sort_direction or "desc").lower() == "desc" else "asc"
+        if column is InvoiceModel.invoice_id:
+            return ((InvoiceModel.invoice_id, direction),)
+        return ((column, direction), (InvoiceModel.invoice_id, direction))
+
+    @staticmethod
+    def _lower_bound(value):
+        if isinstance(value, datetime):
+            return value
+        return datetime.combine(value, datetime.min.time())
+
+    @staticmethod
+    def _upper_bound(column, value):
+        if isinstance(value, datetime):
+            return column <= value
+        # A plain date includes everything up to the end of that day
+        return column < datetime.combine(value + timedelta(days=1), datetime.min.time())
+
+
+def invoice_model_to_dto(model: InvoiceModel) -> InvoiceDTO:
+    """
+    Convert an invoice model row to a DTO.
+
+    Args:
+        model: The invoice model to convert
+
+    Returns:
+        Invoice DTO
+    """
+    payment = model.payment_details
+    return InvoiceDTO(
+        invoice_id=model.invoice_id,
+        order_id=model.order_id,
+        user_id=model.user_id,
+        status=model.status.value if model.status else None,
+        items=[
+            InvoiceItemDTO(
+                product_id=item.product_id,
+                description=item.description,
+                quantity=item.quantity,
+                unit_price=item.unit_price,
+                subtotal=item.subtotal,
+                item_id=item.item_id
+            )
+            for item in model.items
+        ],
+        total_amount=model.total_amount,
+        subtotal=model.subtotal,
+        tax_amount=model.tax_amount,
+        discount_amount=model.discount_amount,
+        due_date=model.due_date,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+        paid_at=model.paid_at,
+        payment_details=PaymentDetailsDTO(
+            payment_method=payment.payment_method,
+            transaction_id=payment.transaction_id,
+            payment_date=payment.payment_date,
+            payer_name=payment.payer_name,
+            payment_reference=payment.payment_reference
+        ) if payment else None,
+        notes=model.notes
+    )
@@ -0,0 +1,246 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.infrastructure.persistence.models import InvoiceModel
+from app.services.invoice_service.infrastructure.query_services.invoice_query_builder import InvoiceQueryBuilder
+from app.shared.infrastructure.persistence.date_buckets import (
+    bucket_expression,
+    iter_buckets,
+    next_bucket_start,
+    to_bucket_date,
+    validate_bucket
+)
+
+logger = logging.getLogger(__name__)
+
+# (min days past due, max days past due, label); None means unbounded
+AGING_BUCKETS = [
+    (0, 30, "0-30 days"),
+    (31, 60, "31-60 days"),
+    (61, 90, "61-90 days"),
+    (91, None, "90+ days")
+]
+
+# Upper bound used for the open-ended aging bucket, as before
+_OPEN_ENDED_AGING_DAYS = 36500
+
+
+class InvoiceStatisticsQueryService:
+    """
+    Invoice statistics computed with aggregates in the database.
+
+    Each statistic is one query returning a handful of rows (one per status
+    or period, or a single summary row), so nothing scales with the number
+    of invoices loaded into Python.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+        self._query_builder = InvoiceQueryBuilder(session)
+
+    def status_totals(self, filters: Optional[Dict[str, Any]] = None) -> Dict[InvoiceStatus, Tuple[int, float]]:
+        """
+        Count and total amount of invoices per status.
+
+        Args:
+            filters: Optional filter criteria understood by InvoiceQueryBuilder
+
+        Returns:
+            Dictionary mapping every InvoiceStatus to (count, amount)
+        """
+        rows = (
+            self._query_builder.build(filters or {})
+            .with_entities(
+                InvoiceModel.status,
+                func.count(InvoiceModel.invoice_id),
+                func.coalesce(func.sum(InvoiceModel.total_amount), 0)
+            )
+            .group_by(InvoiceModel.status)
+            .all()
+        )
+        totals = {status: (count, float(amount)) for status, count, amount in rows}
+        return {status: totals.get(status, (0, 0.0)) for status in InvoiceStatus}
+
+    def summary(self, start_date: datetime, end_date: datetime, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summary metrics for invoices created in the given range.
+
+        Returns:
+            Dictionary with total invoices and value, average value and the
+            count, value and percentage of paid, overdue and pending invoices
+        """
+        query = self._query_builder.build(self._with_created_range(filters, start_date, end_date))
+        row = query.with_entities(
+            func.count(InvoiceModel.invoice_id),
+            func.coalesce(func.sum(InvoiceModel.total_amount), 0),
+            *self._status_aggregates(InvoiceStatus.PAID),
+            *self._status_aggregates(InvoiceStatus.OVERDUE),
+            *self._status_aggregates(InvoiceStatus.PENDING)
+        ).one()
+
+        total_count, total_value, paid_count, paid_value, overdue_count, overdue_value, pending_count, pending_value = row
+        total_value = float(total_value)
+
+        avg_value = total_value / total_count if total_count > 0 else 0
+        paid_percentage = (paid_count / total_count * 100) if total_count > 0 else 0
+        overdue_percentage = (overdue_count / total_count * 100) if total_count > 0 else 0
+
+        return {
+            "total_invoices": total_count,
+            "total_value": total_value,
+            "average_value": avg_value,
+            "paid_invoices": {
+                "count": paid_count,
+                "value": float(paid_value),
+                "percentage": paid_percentage
+            },
+            "overdue_invoices": {
+                "count": overdue_count,
+                "value": float(overdue_value),
+                "percentage": overdue_percentage
+            },
+            "pending_invoices": {
+                "count": pending_count,
+                "value": float(pending_value),
+                "percentage": 100 - paid_percentage - overdue_percentage
+            },
+            "time_period": {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat()
+            }
+        }
+
+    def time_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+        filters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Invoice count and value per day, week, month, quarter or year.
+
+        Returns:
+            Dictionary with one data point per period in the range, empty
+            periods included
+        """
+        interval = validate_bucket(interval)
+        dialect_name = self._session.get_bind().dialect.name
+        period = bucket_expression(InvoiceModel.created_at, interval, dialect_name).label("period")
+
+        rows = (
+            self._query_builder.build(self._with_created_range(filters, start_date, end_date))
+            .with_entities(
+                period,
+                func.count(InvoiceModel.invoice_id),
+                func.coalesce(func.sum(InvoiceModel.total_amount), 0),
+                *self._status_aggregates(InvoiceStatus.PAID)
+            )
+            .group_by(period)
+            .all()
+        )
+        totals = {to_bucket_date(row[0]): row[1:] for row in rows}
+
+        result = {
+            "interval": interval,
+            "time_period": {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat()
+            },
+            "data_points": []
+        }
+
+        for bucket in iter_buckets(start_date, end_date, interval):
+            period_start = max(datetime.combine(bucket, datetime.min.time()), start_date)
+            period_end = min(datetime.combine(next_bucket_start(bucket, interval), datetime.min.time()), end_date)
+            if period_start >= period_end:
+                continue
+
+            total_count, total_value, paid_count, paid_value = totals.get(bucket, (0, 0, 0, 0))
+            result["data_points"].append({
+                "period": self._period_label(bucket, interval),
+                "start_date": period_start.isoformat(),
+                "end_date": period_end.isoformat(),
+                "invoice_count": total_count,
+                "total_value": float(total_value),
+                "paid_count": paid_count,
+                "paid_value": float(paid_value)
+            })
+
+        return result
+
+    def aging(self, reference_date: datetime, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Outstanding invoices grouped by how far past their due date they are.
+
+        Returns:
+            Dictionary with the outstanding total and one entry per aging bucket
+        """
+        query = self._query_builder.build(filters)
+        if not filters.get("status"):
+            query = query.filter(InvoiceModel.status.in_([InvoiceStatus.PENDING, InvoiceStatus.OVERDUE]))
+
+        aggregates = [
+            func.count(InvoiceModel.invoice_id),
+            func.coalesce(func.sum(InvoiceModel.total_amount), 0)
+        ]
+        for min_days, max_days, _ in AGING_BUCKETS:
+            min_date = reference_date - timedelta(days=max_days if max_days is not None else _OPEN_ENDED_AGING_DAYS)
+            max_date = reference_date - timedelta(days=min_days)
+            in_bucket = (InvoiceModel.due_date >= min_date) & (InvoiceModel.due_date < max_date)
+            aggregates.append(func.sum(case((in_bucket, 1), else_=0)))
+            aggregates.append(func.sum(case((in_bucket, InvoiceModel.total_amount), else_=0)))
+
+        row = query.with_entities(*aggregates).one()
+        total_count, total_value = row[0], float(row[1])
+
+        result = {
+            "reference_date": reference_date.isoformat(),
+            "total_outstanding": {
+                "count": total_count,
+                "value": total_value
+            },
+            "aging_buckets": []
+        }
+
+        for index, (_, _, label) in enumerate(AGING_BUCKETS):
+            bucket_count = row[2 + index * 2] or 0
+            bucket_value = float(row[3 + index * 2] or 0)
+            result["aging_buckets"].append({
+                "range": label,
+                "count": bucket_count,
+                "value": bucket_value,
+                "percentage": (bucket_value / total_value * 100) if total_value > 0 else 0
+            })
+
+        return result
+
+    @staticmethod
+    def _status_aggregates(status: InvoiceStatus):
+        is_status = InvoiceModel.status == status
+        return (
+            func.coalesce(func.sum(case((is_status, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((is_status, InvoiceModel.total_amount), else_=0)), 0)
+        )
+
+    @staticmethod
+    def _with_created_range(filters: Dict[str, Any], start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        return {**filters, "created_at_after": start_date, "created_at_before": end_date}
+
+    @staticmethod
+    def _period_label(bucket, interval: str) -> str:
+        if interval == "week":
+            week_end = next_bucket_start(bucket, interval) - timedelta(days=1)
+            return f"{bucket.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}"
+        if interval == "month":
+            return bucket.strftime("%Y-%m")
+        if interval == "quarter":
+            return f"{bucket.year} Q{(bucket.month - 1) // 3 + 1}"
+        if interval == "year":
+            return str(bucket.year)
+        return bucket.strftime("%Y-%m-%d")
@@ -16,6 +16,7 @@ from app.services.invoice_service.application.use_cases.process_payment import P
 from app.services.invoice_service.application.use_cases.cancel_invoice import CancelInvoiceUseCase
 from app.services.invoice_service.application.use_cases.get_invoice import GetInvoiceUseCase
 from app.services.invoice_service.application.use_cases.list_invoices import ListInvoicesUseCase
+from app.services.invoice_service.application.use_cases.get_invoice_statistics_use_case import GetInvoiceStatisticsUseCase
 from app.services.invoice_service.application.dtos.invoice_dto import InvoiceDTO, InvoiceListDTO
 from app.services.invoice_service.domain.value_objects.payment_details import PaymentDetails
 from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
@@ -27,7 +28,10 @@ from app.services.invoice_service.domain.exceptions.invoice_exceptions import (
 )
 from app.services.invoice_service.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from app.services.invoice_service.infrastructure.query_services.invoice_query_service import InvoiceQueryService
+from app.services.invoice_service.infrastructure.query_services.invoice_query_builder import InvoiceQueryBuilder
+from app.services.invoice_service.infrastructure.query_services.invoice_statistics_query_service import InvoiceStatisticsQueryService
 from app.services.invoice_service.infrastructure.adapters.invoice_event_adapter import InvoiceEventAdapter
+from app.services.invoice_service.infrastructure.persistence.overdue_invoice_sweeper import OverdueInvoiceSweeper
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.application.events.event_bus import EventBus
 
@@ -68,7 +72,12 @@ class InvoiceService:
         self._update_invoice_use_case = UpdateInvoiceUseCase(self._uow)
         self._process_payment_use_case = ProcessPaymentUseCase(self._uow)
         self._cancel_invoice_use_case = CancelInvoiceUseCase(self._uow)
-        self._list_invoices_use_case = ListInvoicesUseCase(self._uow)
+        self._list_invoices_use_case = ListInvoicesUseCase(
+            self._uow, 
+            InvoiceQueryBuilder(self._db_session)
+        )
+        self._statistics_query_service = InvoiceStatisticsQueryService(self._db_session)
+        self._get_invoice_statistics_use_case = GetInvoiceStatisticsUseCase(self._statistics_query_service)
     
     def create_invoice(self, command: CreateInvoiceCommand) -> InvoiceDTO:
         """
@@ -411,10 +420,17 @@ class InvoiceService:
             logger.error(f"Error getting overdue invoices: {str(e)}", exc_info=True)
             raise InvoiceServiceException(f"Failed to get overdue invoices: {str(e)}")
     
-    def check_and_update_overdue_invoices(self) -> int:
+    def check_and_update_overdue_invoices(self, batch_size: int = 500) -> int:
         """
         Check for overdue invoices and update their status.
         
+        Pending invoices past their due date are marked OVERDUE with batched
+        UPDATE statements, each committed with one InvoicesOverdueEvent for
+        the whole batch, rather than through update_invoice one at a time.
+        
+        Args:
+            batch_size: Invoices marked per statement and transaction
+            
         Returns:
             Number of invoices updated
             
@@ -423,36 +439,9 @@ class InvoiceService:
         """
         logger.info("Checking for overdue invoices")
         try:
-            current_date = datetime.now().date()
-            
-            # Get pending invoices with due dates in the past
-            filters = {
-                "status": InvoiceStatus.PENDING,
-                "due_date_before": current_date
-            }
-            
-            query = GetInvoicesByFilterQuery(filters=filters)
-            overdue_invoices = self._query_service.list(query)
-            
-            update_count = 0
-            update_errors = 0
-            
-            for invoice in overdue_invoices.items:
-                try:
-                    # Update to overdue status
-                    update_command = UpdateInvoiceCommand(
-                        id=invoice.id,
-                        invoice_fields={"status": InvoiceStatus.OVERDUE}
-                    )
-                    
-                    self.update_invoice(update_command)
-                    update_count += 1
-                except Exception as e:
-                    # Log error but continue with other invoices
-                    logger.error(f"Error updating invoice {invoice.id} to overdue: {str(e)}")
-                    update_errors += 1
-                
-            logger.info(f"Updated {update_count} invoices to overdue status. Failed: {update_errors}")
+            sweeper = OverdueInvoiceSweeper(self._db_session, self._event_bus, batch_size)
+            update_count = sweeper.sweep()
+            logger.info(f"Updated {update_count} invoices to overdue status")
             return update_count
         except Exception as e:
             logger.error(f"Error checking overdue invoices: {str(e)}", exc_info=True)
@@ -705,22 +694,13 @@ class InvoiceService:
         """
         logger.info("Getting invoice statistics")
         try:
-            # Get counts by status - use pagination to limit memory usage while still getting all records
-            pending_invoices = self.get_invoices_by_status(InvoiceStatus.PENDING, page_size=1000)
-            paid_invoices = self.get_invoices_by_status(InvoiceStatus.PAID, page_size=1000)
-            overdue_invoices = self.get_invoices_by_status(InvoiceStatus.OVERDUE, page_size=1000)
-            cancelled_invoices = self.get_invoices_by_status(InvoiceStatus.CANCELLED, page_size=1000)
-            
-            pending_count = pending_invoices.total_items
-            paid_count = paid_invoices.total_items
-            overdue_count = overdue_invoices.total_items
-            cancelled_count = cancelled_invoices.total_items
+            # Counts and amounts per status in a single GROUP BY
+            totals = self._statistics_query_service.status_totals()
+            pending_count, pending_amount = totals[InvoiceStatus.PENDING]
+            paid_count, paid_amount = totals[InvoiceStatus.PAID]
+            overdue_count, overdue_amount = totals[InvoiceStatus.OVERDUE]
+            cancelled_count, _ = totals[InvoiceStatus.CANCELLED]
             total_count = pending_count + paid_count + overdue_count + cancelled_count
-            
-            # Calculate amounts
-            pending_amount = sum(invoice.total_amount for invoice in pending_invoices.items)
-            paid_amount = sum(invoice.total_amount for invoice in paid_invoices.items)
-            overdue_amount = sum(invoice.total_amount for invoice in overdue_invoices.items)
             total_amount = pending_amount + paid_amount + overdue_amount
             
             return {
@@ -742,4 +722,44 @@ class InvoiceService:
             }
         except Exception as e:
             logger.error(f"Error getting invoice statistics: {str(e)}", exc_info=True)
+            raise InvoiceServiceException(f"Failed to get invoice statistics: {str(e)}")
+
+    def get_invoice_statistics_report(
+        self,
+        stats_type: str = "summary",
+        customer_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        interval: str = "month",
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get summary, time series or aging statistics computed in the database.
+        
+        Args:
+            stats_type: Type of statistics (summary, time_series, aging)
+            customer_id: Optional customer (user) ID to restrict the statistics to
+            start_date: Optional start of the time range
+            end_date: Optional end of the time range
+            interval: Time series interval (day, week, month, quarter, year)
+            filters: Additional invoice filters
+            
+        Returns:
+            Dictionary containing the requested statistics
+            
+        Raises:
+            InvoiceServiceException: If retrieval fails
+        """
+        logger.info(f"Getting {stats_type} invoice statistics")
+        try:
+            return self._get_invoice_statistics_use_case.execute(
+                stats_type=stats_type,
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+                interval=interval,
+                filters=filters
+            )
+        except Exception as e:
+            logger.error(f"Error getting {stats_type} invoice statistics: {str(e)}", exc_info=True)
             raise InvoiceServiceException(f"Failed to get invoice statistics: {str(e)}")
\ No newline at end of file
@@ -52,18 +52,36 @@ class OrderSummaryDTO:
     items_count: int
     created_at: datetime
 @dataclass
+class OrderListItemDTO:
+    product_id: UUID
+    quantity: int
+    price: float
+
+@dataclass
+class OrderListEntryDTO:
+    """An order of the filtered order list, shaped and typed as OrderSchema dumps it"""
+    status: OrderStatus
+    total_amount: float
+    items: List[OrderListItemDTO]
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime]
+
+@dataclass
 class OrderFilterPaginationDTO:
     page: int
     per_page: int
-    pages:int
-    total:int
+    pages: Optional[int]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 
 
 @dataclass
 class OrderFilterResponseDTO:
-    orders: List[OrderSummaryDTO]
+    orders: List[OrderListEntryDTO]
     pagination: OrderFilterPaginationDTO
                
 
@@ -76,4 +94,7 @@ class OrderFilterDTO:
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     min_amount: Optional[Decimal] = None
-    max_amount: Optional[Decimal] = None 
\ No newline at end of file
+    max_amount: Optional[Decimal] = None
+    cursor: Optional[str] = None
+    use_cursor: bool = False
+    include_total: bool = True 
\ No newline at end of file
@@ -12,4 +12,7 @@ class OrderFilterQuery:
     min_amount: Optional[float] = None
     max_amount: Optional[float] = None
     page: int = 1
-    per_page: int = 10
\ No newline at end of file
+    per_page: int = 10
+    cursor: Optional[str] = None
+    use_cursor: bool = False
+    include_total: bool = True
\ No newline at end of file
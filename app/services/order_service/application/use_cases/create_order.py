@@ -16,6 +16,7 @@ from app.services.order_service.domain.value_objects.order_status import OrderSt
 from app.services.order_service.domain.value_objects.money import Money
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
 from app.shared.contracts.inventory.stock_check import StockCheckItemContract, StockCheckRequestContract
+from app.shared.contracts.inventory.stock_reservation import StockReservationItemContract, StockReservationRequestContract
 from decimal import Decimal
 
 @dataclass
@@ -50,6 +51,9 @@ class CreateOrderUseCase:
         
             # Check stock availability before creating order
         self._check_stock_level(command)
+
+            # Take the stock; fails instead of overselling when another order got there first
+        self._reserve_stock(command)
             
             # Create order items and calculate total
         
@@ -174,6 +178,26 @@ class CreateOrderUseCase:
                 errors=stock_check_result.model_dump()
             )
         
+    def _reserve_stock(self, command: CreateOrderCommand):
+        """Decrement stock for all items in this transaction, or for none of them"""
+        adapter_service = self.uow.order_adapter_service
+
+        reservation = adapter_service.reserve_stock(
+            StockReservationRequestContract(items=[
+                StockReservationItemContract(
+                    product_id=item.product_id,
+                    quantity=item.quantity
+                ) for item in command.items
+            ])
+        )
+
+        if not reservation.success:
+            self.uow.rollback()
+            raise OrderCreationError(
+                message=reservation.message,
+                errors=reservation.model_dump()
+            )
+        
     def _order_item_list(self, command: CreateOrderCommand):
         """Convert command items to order items"""
         return [
@@ -7,6 +7,10 @@ from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
     StockCheckResponseContract
 )
+from app.shared.contracts.inventory.stock_reservation import (
+    StockReservationRequestContract,
+    StockReservationResponseContract
+)
 
 # @dataclass
 # class StockCheckItem:
@@ -29,6 +33,10 @@ class InventoryServicePort(ABC):
     @abstractmethod
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract:
         pass
+
+    @abstractmethod
+    def reserve_stock(self, request: StockReservationRequestContract) -> StockReservationResponseContract:
+        pass
    
 
 
@@ -1,6 +1,7 @@
 from app.services.order_service.infrastructure.adapters.outgoing.inventory_adapter import InventoryServiceAdapter
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.contracts.inventory.stock_check import StockCheckRequestContract
+from app.shared.contracts.inventory.stock_reservation import StockReservationRequestContract
 
 
 class OrderAdapterService:
@@ -9,4 +10,7 @@ class OrderAdapterService:
         self._stock_check_adapter = InventoryServiceAdapter(self._acl)
 
     def stock_check(self, request: StockCheckRequestContract):
-        return self._stock_check_adapter.stock_check(request)
\ No newline at end of file
+        return self._stock_check_adapter.stock_check(request)
+
+    def reserve_stock(self, request: StockReservationRequestContract):
+        return self._stock_check_adapter.reserve_stock(request)
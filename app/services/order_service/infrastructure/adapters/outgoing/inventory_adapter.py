@@ -5,6 +5,10 @@ from app.shared.contracts.inventory.stock_check import (
     StockCheckItemContract,
     StockCheckResponseContract
 )
+from app.shared.contracts.inventory.stock_reservation import (
+    StockReservationRequestContract,
+    StockReservationResponseContract
+)
 from app.services.order_service.domain.enums.stock_status import OrderStockStatus
 
 class InventoryServiceAdapter(InventoryServicePort):
@@ -32,6 +36,29 @@ class InventoryServiceAdapter(InventoryServicePort):
         
             
         return result.data
+
+    def reserve_stock(self, request: StockReservationRequestContract) -> StockReservationResponseContract:
+        dict_data = request.model_dump()
+
+        result = self._acl.execute_service_operation(
+            ServiceContext(
+                service_type=ServiceType.INVENTORY,
+                operation="RESERVE_STOCK",
+                data={
+                    "order_id": dict_data.get("order_id"),
+                    "items": [
+                        {
+                            "product_id": item.get("product_id"),
+                            "quantity": item.get("quantity")
+                        } for item in dict_data.get("items")
+                    ]
+                }
+            )
+        )
+
+        if not result.success:
+            return StockReservationResponseContract(success=False, message=result.error or "Stock reservation failed")
+        return result.data
     # def check_inventory(self, order_data: Dict[str, Any]) -> ServiceResponse:
     #     """Check inventory availability for order"""
     #     translated_data = self.translate_request(
@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+import zlib
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, List, Tuple
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+
+EXPORT_MEDIA_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+CSV_HEADERS = ["Order ID", "User ID", "Status", "Total Amount", "Items Count", "Created At"]
+
+OrderBatch = List[Tuple[Any, List[Any]]]
+
+
+def write_orders(batches: Iterable[OrderBatch], fmt: str) -> Iterator[str]:
+    """
+    Render batches from OrderQueryService.iter_orders_for_export as text.
+
+    One chunk is produced per batch, so memory is bounded by the batch size
+    whatever the number of orders.
+    """
+    if fmt == 'csv':
+        return _write_csv(batches)
+    if fmt == 'ndjson':
+        return _write_ndjson(batches)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def gzip_chunks(chunks: Iterable[str], level: int = 6) -> Iterator[bytes]:
+    """Incrementally gzip-encode text chunks as UTF-8."""
+    # wbits=31 writes a gzip header and trailer rather than a raw zlib stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _write_csv(batches: Iterable[OrderBatch]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADERS)
+    for batch in batches:
+        for order, items in batch:
+            writer.writerow([
+                str(order.id),
+                str(order.user_id) if order.user_id else "",
+                _value(order.status),
+                str(order.total_amount),
+                len(items),
+                order.created_at.isoformat() if order.created_at else ""
+            ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header only, when nothing matched
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _write_ndjson(batches: Iterable[OrderBatch]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(
+            json.dumps({
+                "id": order.id,
+                "user_id": order.user_id,
+                "status": order.status,
+                "total_amount": order.total_amount,
+                "notes": order.notes,
+                "created_at": order.created_at,
+                "updated_at": order.updated_at,
+                "completed_at": order.completed_at,
+                "items": [{
+                    "id": item.id,
+                    "product_id": item.product_id,
+                    "quantity": item.quantity,
+                    "price": item.price
+                } for item in items]
+            }, default=_json_default) + "\n"
+            for order, items in batch
+        )
+
+
+def _value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
@@ -1,6 +1,10 @@
 from .order import OrderModel, OrderItemModel
+from .order_archive import ArchivedOrderModel, ArchivedOrderItemModel, OrderArchiveCheckpointModel
 
 __all__ = [
     'OrderModel',
-    'OrderItemModel'
-]
\ No newline at end of file
+    'OrderItemModel',
+    'ArchivedOrderModel',
+    'ArchivedOrderItemModel',
+    'OrderArchiveCheckpointModel'
+]
@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Numeric, String, Table
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Table
 from sqlalchemy.orm import relationship
 
 from app.dataBase import db
@@ -10,6 +10,12 @@ from datetime import UTC
 
 class OrderModel(db.Model):
     __tablename__ = 'orders'
+    __table_args__ = (
+        # Default listing order (created_at DESC, id DESC) and its filtered variants
+        Index('ix_orders_created_at_id', 'created_at', 'id'),
+        Index('ix_orders_user_id_created_at', 'user_id', 'created_at'),
+        Index('ix_orders_status_created_at', 'status', 'created_at'),
+    )
 
     id = Column(UUID(as_uuid=True),default=uuid.uuid4, primary_key=True)
     user_id = Column(UUID(as_uuid=True), nullable=True)
@@ -38,6 +44,9 @@ class OrderModel(db.Model):
 
 class OrderItemModel(db.Model):
     __tablename__ = 'order_items'
+    __table_args__ = (
+        Index('ix_order_items_order_id', 'order_id'),
+    )
 
     id = Column(UUID(as_uuid=True),default=uuid.uuid4, primary_key=True)
     order_id = Column(UUID(as_uuid=True), ForeignKey('orders.id'), nullable=False)
@@ -0,0 +1,69 @@
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, Numeric, String
+from sqlalchemy.orm import relationship
+
+from app.dataBase import db
+from app.shared.database_types import UUID
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+
+
+class ArchivedOrderModel(db.Model):
+    """
+    An order moved out of ``orders`` by the archival job.
+
+    Columns mirror OrderModel (so rows can be copied with INSERT ... SELECT
+    and read through the same mapper), plus the time the row was archived.
+    """
+    __tablename__ = 'orders_archive'
+    __table_args__ = (
+        Index('ix_orders_archive_user_id_created_at', 'user_id', 'created_at'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    status = Column(Enum(OrderStatus), nullable=False)
+    total_amount = Column(Numeric(10, 2), nullable=False)
+    notes = Column(String)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), nullable=False)
+
+    # No foreign key: archived items are only ever written together with their order
+    items = relationship(
+        "ArchivedOrderItemModel",
+        primaryjoin="ArchivedOrderModel.id == foreign(ArchivedOrderItemModel.order_id)",
+        viewonly=True
+    )
+
+
+class ArchivedOrderItemModel(db.Model):
+    __tablename__ = 'order_items_archive'
+    __table_args__ = (
+        Index('ix_order_items_archive_order_id', 'order_id'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    order_id = Column(UUID(as_uuid=True), nullable=False)
+    product_id = Column(UUID(as_uuid=True), nullable=False)
+    quantity = Column(Integer, nullable=False)
+    price = Column(Numeric(10, 2), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class OrderArchiveCheckpointModel(db.Model):
+    """
+    Progress of an archival run, so an interrupted run resumes with the same
+    cutoff from the last archived (created_at, id) instead of starting over.
+    """
+    __tablename__ = 'order_archive_checkpoints'
+
+    job = Column(String(64), primary_key=True)
+    cutoff = Column(DateTime(timezone=True), nullable=False)
+    last_created_at = Column(DateTime(timezone=True), nullable=True)
+    last_id = Column(UUID(as_uuid=True), nullable=True)
+    archived_orders = Column(Integer, nullable=False, default=0)
+    archived_items = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
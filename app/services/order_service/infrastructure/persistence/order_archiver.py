@@ -0,0 +1,193 @@
+import logging
+from datetime import datetime, UTC
+from typing import Any, Dict, Optional
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import DateTime, and_, delete, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel, OrderItemModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import (
+    ArchivedOrderItemModel,
+    ArchivedOrderModel,
+    OrderArchiveCheckpointModel
+)
+
+logger = logging.getLogger(__name__)
+
+ORDER_COLUMNS = [column.name for column in OrderModel.__table__.columns]
+ITEM_COLUMNS = [column.name for column in OrderItemModel.__table__.columns]
+
+# Orders that can no longer change; open orders stay in the hot tables however old
+ARCHIVABLE_STATUSES = (OrderStatus.COMPLETED, OrderStatus.CANCELLED, OrderStatus.FAILED)
+
+
+class OrderArchiver:
+    """
+    Moves finished orders (completed, cancelled or failed) created before
+    a cutoff, with their items, into the archive tables.
+
+    Each batch copies up to ``batch_size`` orders and their items with
+    INSERT ... SELECT, deletes them from the hot tables and advances the
+    checkpoint, all in one transaction, so a crash loses at most the batch
+    in flight and never leaves an order in both places or in neither.
+    Batches walk (created_at, id) upwards from the checkpoint, which keeps
+    each batch an index range scan instead of re-reading the dead rows
+    left by earlier deletes.
+
+    On PostgreSQL the batch's orders are locked with SKIP LOCKED, so orders
+    being modified right now are left for the next run.
+    """
+
+    def __init__(self, session: Session, job: str = "default"):
+        self._session = session
+        self._job = job
+
+    def run(self, cutoff: datetime, batch_size: int = 1000, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Archive finished orders created before ``cutoff``.
+
+        An unfinished run of the same job is resumed with its original
+        cutoff; ``cutoff`` only applies to a new run.
+
+        Args:
+            cutoff: Orders created before this instant are archived
+            batch_size: Orders moved per transaction
+            max_batches: Stop after this many batches (the run can be resumed later)
+
+        Returns:
+            Checkpoint summary: cutoff, orders and items archived, and whether the run completed
+        """
+        checkpoint = self._start(cutoff)
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            moved = self._archive_batch(checkpoint, batch_size)
+            batches += 1
+            if not moved:
+                break
+
+        logger.info(
+            f"Order archival '{self._job}': {checkpoint.archived_orders} orders and "
+            f"{checkpoint.archived_items} items archived before {checkpoint.cutoff.isoformat()}"
+            f"{'' if checkpoint.completed_at else ' so far, run not finished'}"
+        )
+        return self._summary(checkpoint)
+
+    def _start(self, cutoff: datetime) -> OrderArchiveCheckpointModel:
+        now = datetime.now(UTC)
+        checkpoint = self._session.get(OrderArchiveCheckpointModel, self._job)
+
+        if checkpoint is not None and checkpoint.completed_at is None:
+            logger.info(f"Resuming order archival '{self._job}' with cutoff {checkpoint.cutoff.isoformat()}")
+            return checkpoint
+
+        if checkpoint is None:
+            checkpoint = OrderArchiveCheckpointModel(job=self._job)
+            self._session.add(checkpoint)
+        checkpoint.cutoff = cutoff
+        checkpoint.last_created_at = None
+        checkpoint.last_id = None
+        checkpoint.archived_orders = 0
+        checkpoint.archived_items = 0
+        checkpoint.started_at = now
+        checkpoint.updated_at = now
+        checkpoint.completed_at = None
+        self._session.commit()
+        return checkpoint
+
+    def _archive_batch(self, checkpoint: OrderArchiveCheckpointModel, batch_size: int) -> int:
+        """Move one batch; returns the number of orders moved (0 once the run is complete)."""
+        try:
+            batch = self._session.execute(self._next_batch(checkpoint, batch_size)).all()
+            now = datetime.now(UTC)
+
+            if not batch:
+                checkpoint.completed_at = now
+                checkpoint.updated_at = now
+                self._session.commit()
+                return 0
+
+            order_ids = [row.id for row in batch]
+            archived_at = literal(now, DateTime(timezone=True))
+
+            self._session.execute(
+                insert(ArchivedOrderModel).from_select(
+                    ORDER_COLUMNS + ['archived_at'],
+                    select(*OrderModel.__table__.columns, archived_at).where(OrderModel.id.in_(order_ids))
+                )
+            )
+            items = self._session.execute(
+                insert(ArchivedOrderItemModel).from_select(
+                    ITEM_COLUMNS,
+                    select(*OrderItemModel.__table__.columns).where(OrderItemModel.order_id.in_(order_ids))
+                )
+            ).rowcount
+            self._session.execute(
+                delete(OrderItemModel).where(OrderItemModel.order_id.in_(order_ids)).execution_options(synchronize_session=False)
+            )
+            self._session.execute(
+                delete(OrderModel).where(OrderModel.id.in_(order_ids)).execution_options(synchronize_session=False)
+            )
+
+            checkpoint.last_created_at = batch[-1].created_at
+            checkpoint.last_id = batch[-1].id
+            checkpoint.archived_orders += len(order_ids)
+            checkpoint.archived_items += max(items, 0)
+            checkpoint.updated_at = now
+            self._session.commit()
+
+            logger.debug(f"Archived {len(order_ids)} orders and {items} items")
+            return len(order_ids)
+        except Exception:
+            self._session.rollback()
+            raise
+
+    def _next_batch(self, checkpoint: OrderArchiveCheckpointModel, batch_size: int):
+        stmt = select(OrderModel.id, OrderModel.created_at).where(
+            OrderModel.created_at < checkpoint.cutoff,
+            OrderModel.status.in_(ARCHIVABLE_STATUSES)
+        )
+
+        if checkpoint.last_created_at is not None:
+            stmt = stmt.where(or_(
+                OrderModel.created_at > checkpoint.last_created_at,
+                and_(OrderModel.created_at == checkpoint.last_created_at, OrderModel.id > checkpoint.last_id)
+            ))
+
+        return stmt.order_by(OrderModel.created_at, OrderModel.id) \
+            .limit(batch_size) \
+            .with_for_update(skip_locked=True)
+
+    @staticmethod
+    def _summary(checkpoint: OrderArchiveCheckpointModel) -> Dict[str, Any]:
+        return {
+            "cutoff": checkpoint.cutoff.isoformat(),
+            "archived_orders": checkpoint.archived_orders,
+            "archived_items": checkpoint.archived_items,
+            "completed": checkpoint.completed_at is not None
+        }
+
+
+@click.command("archive-orders")
+@click.option("--days", type=int, default=None, help="Archive orders older than this many days (default ORDER_ARCHIVE_AFTER_DAYS)")
+@click.option("--batch-size", type=int, default=None, help="Orders moved per transaction (default ORDER_ARCHIVE_BATCH_SIZE)")
+@click.option("--max-batches", type=int, default=None, help="Stop after this many batches; the next run resumes")
+@with_appcontext
+def archive_orders_command(days, batch_size, max_batches):
+    """Move old finished orders and their items into the archive tables."""
+    from app.extensions import container
+
+    result = container.order_service().archive_orders(
+        days=days if days is not None else current_app.config.get('ORDER_ARCHIVE_AFTER_DAYS', 90),
+        batch_size=batch_size or current_app.config.get('ORDER_ARCHIVE_BATCH_SIZE', 1000),
+        max_batches=max_batches
+    )
+    status = "complete" if result['completed'] else "interrupted, run again to resume"
+    click.echo(
+        f"Archived {result['archived_orders']} orders and {result['archived_items']} items "
+        f"created before {result['cutoff']} ({status})"
+    )
@@ -10,6 +10,7 @@ from app.services.order_service.domain.interfaces.order_repository import OrderR
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
 from app.services.order_service.infrastructure.persistence.mappers.order_mapper import OrderMapper
 from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.shared.database_types import uuid_text
 
 class SQLAlchemyOrderRepository(OrderRepository):
     def __init__(self, session: Session):
@@ -126,8 +127,8 @@ class SQLAlchemyOrderRepository(OrderRepository):
     ) -> List[OrderEntity]:
         db_query = self._session.query(OrderModel).filter(
             or_(
-                OrderModel.id.ilike(f"%{query}%"),
-                OrderModel.user_id.ilike(f"%{query}%"),
+                uuid_text(OrderModel.id).ilike(f"%{query}%"),
+                uuid_text(OrderModel.user_id).ilike(f"%{query}%"),
                 OrderModel.notes.ilike(f"%{query}%")
             )
         )
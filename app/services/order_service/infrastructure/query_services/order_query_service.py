@@ -1,9 +1,10 @@
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict, Any
+from typing import Iterator, List, Optional, Tuple, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import and_, or_, desc, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, desc, func, select, text
+from sqlalchemy.orm import Session, joinedload, selectinload
 # from functools import lru_cache
 
 from app.services.order_service.application.dtos.order_dto import (
@@ -11,12 +12,20 @@ from app.services.order_service.application.dtos.order_dto import (
     OrderFilterPaginationDTO,
     OrderFilterResponseDTO,
     OrderItemDTO,
+    OrderListEntryDTO,
+    OrderListItemDTO,
     OrderSummaryDTO,
     OrderFilterDTO
 )
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
 from app.services.order_service.infrastructure.persistence.mappers.order_mapper import OrderMapper
 from app.services.order_service.infrastructure.persistence.models.order import OrderModel, OrderItemModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import ArchivedOrderModel
+from app.shared.infrastructure.persistence.date_buckets import bucket_expression, iter_buckets, to_bucket_date
+from app.shared.infrastructure.persistence.pagination import paginate_keyset
+
+# Newest first, with the primary key as a unique tie-breaker
+ORDER_KEYSET = ((OrderModel.created_at, "desc"), (OrderModel.id, "desc"))
 
 class OrderQueryService:
     def __init__(self, session: Session):
@@ -39,6 +48,14 @@ class OrderQueryService:
             OrderModel.id == order_id
         ).first()
         
+        if order is None:
+            # Old orders are moved out by the archival job; they read the same way
+            order = self._session.query(ArchivedOrderModel).options(
+                selectinload(ArchivedOrderModel.items)
+            ).filter(
+                ArchivedOrderModel.id == order_id
+            ).first()
+        
         # self._add_to_cache(cache_key, order)
         return order
 
@@ -82,30 +99,33 @@ class OrderQueryService:
         ).order_by(desc(OrderModel.created_at))
 
         # Apply filters
-        if filter_dto.user_id:
-            query = query.filter(OrderModel.user_id == filter_dto.user_id)
-        if filter_dto.status:
-            query = query.filter(OrderModel.status == OrderStatus(filter_dto.status))
-        if filter_dto.start_date:
-            query = query.filter(OrderModel.created_at >= filter_dto.start_date)
-        if filter_dto.end_date:
-            query = query.filter(OrderModel.created_at <= filter_dto.end_date)
-        if filter_dto.min_amount:
-            query = query.filter(OrderModel.total_amount >= filter_dto.min_amount)
-        if filter_dto.max_amount:
-            query = query.filter(OrderModel.total_amount <= filter_dto.max_amount)
+        query = self._apply_filters(query, filter_dto)
 
-        # Get total count for pagination info
-        total = query.count()
-        pages = (total + filter_dto.per_page - 1) // filter_dto.per_page
+        cursor = getattr(filter_dto, 'cursor', None)
+        cursor_mode = bool(cursor) or getattr(filter_dto, 'use_cursor', False)
 
-        # Apply pagination
-        orders = query.order_by(desc(OrderModel.created_at)) \
-            .offset((filter_dto.page - 1) * filter_dto.per_page) \
-            .limit(filter_dto.per_page) \
-            .all()
+        # Get total count for pagination info (optional in cursor mode)
+        total = pages = None
+        if not cursor_mode or getattr(filter_dto, 'include_total', True):
+            total = query.order_by(None).count()
+            pages = (total + filter_dto.per_page - 1) // filter_dto.per_page
 
-        result = [self._to_summary_dto(order) for order in orders]
+        # Apply pagination: seek past the cursor, or fall back to OFFSET
+        next_cursor = None
+        if cursor_mode:
+            orders, next_cursor = paginate_keyset(
+                query.order_by(None),
+                ORDER_KEYSET,
+                filter_dto.per_page,
+                cursor
+            )
+        else:
+            orders = query.order_by(desc(OrderModel.created_at)) \
+                .offset((filter_dto.page - 1) * filter_dto.per_page) \
+                .limit(filter_dto.per_page) \
+                .all()
+
+        result = [self._to_list_entry_dto(order) for order in orders]
         # self._add_to_cache(cache_key, result)
         return OrderFilterResponseDTO(
             orders=result,
@@ -114,10 +134,84 @@ class OrderQueryService:
                 page=filter_dto.page,
                 pages=pages,
                 per_page=filter_dto.per_page,
+                next_cursor=next_cursor,
             )
         )
 
 
+    def iter_orders_for_export(
+        self,
+        filter_dto: OrderFilterDTO,
+        batch_size: int = 500,
+        include_items: bool = True
+    ) -> Iterator[List[Tuple[Any, List[Any]]]]:
+        """
+        Stream every order matching the filter, newest first, in batches.
+        
+        Orders are read as plain rows through a server-side cursor
+        (``yield_per``), so neither the ORM identity map nor the result set
+        grows with the number of orders; each batch's items are fetched with
+        a single IN query.
+        
+        Args:
+            filter_dto: Filter criteria; paging fields are ignored
+            batch_size: Rows fetched per round trip
+            include_items: Whether to load each order's items
+            
+        Yields:
+            Lists of (order row, item rows) pairs
+        """
+        if self._session.get_bind().dialect.name == 'postgresql':
+            # The client paces the reads; a slow download must not look like
+            # an abandoned transaction to the server
+            self._session.execute(text("SET LOCAL idle_in_transaction_session_timeout = 0"))
+        
+        stmt = self._apply_filters(
+            select(
+                OrderModel.id,
+                OrderModel.user_id,
+                OrderModel.status,
+                OrderModel.total_amount,
+                OrderModel.notes,
+                OrderModel.created_at,
+                OrderModel.updated_at,
+                OrderModel.completed_at
+            ),
+            filter_dto
+        ).order_by(desc(OrderModel.created_at), desc(OrderModel.id)).execution_options(yield_per=batch_size)
+        
+        for rows in self._session.execute(stmt).partitions():
+            items_by_order: Dict[UUID, List[Any]] = defaultdict(list)
+            if include_items:
+                item_rows = self._session.execute(
+                    select(
+                        OrderItemModel.order_id,
+                        OrderItemModel.id,
+                        OrderItemModel.product_id,
+                        OrderItemModel.quantity,
+                        OrderItemModel.price
+                    ).where(OrderItemModel.order_id.in_([row.id for row in rows]))
+                )
+                for item in item_rows:
+                    items_by_order[item.order_id].append(item)
+            yield [(row, items_by_order.get(row.id, [])) for row in rows]
+
+    def _apply_filters(self, query, filter_dto: OrderFilterDTO):
+        """Apply the filter criteria to an ORM query or a select()"""
+        if filter_dto.user_id:
+            query = query.filter(OrderModel.user_id == filter_dto.user_id)
+        if filter_dto.status:
+            query = query.filter(OrderModel.status == OrderStatus(filter_dto.status))
+        if filter_dto.start_date:
+            query = query.filter(OrderModel.created_at >= filter_dto.start_date)
+        if filter_dto.end_date:
+            query = query.filter(OrderModel.created_at <= filter_dto.end_date)
+        if filter_dto.min_amount:
+            query = query.filter(OrderModel.total_amount >= filter_dto.min_amount)
+        if filter_dto.max_amount:
+            query = query.filter(OrderModel.total_amount <= filter_dto.max_amount)
+        return query
+
     # @lru_cache(maxsize=128)
     def get_user_order_stats(self, user_id: UUID) -> dict:
         """Get order statistics for a user (cached with LRU cache for better performance)"""
@@ -145,6 +239,58 @@ class OrderQueryService:
             'status_counts': status_counts
         }
 
+    def get_order_stats_by_period(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        bucket: str = "day"
+    ) -> List[Dict[str, Any]]:
+        """
+        Order count and revenue per day, week or month in a single GROUP BY.
+        
+        Args:
+            start_date: Start of the period (inclusive)
+            end_date: End of the period (inclusive)
+            bucket: "day", "week" (ISO, starting Monday) or "month"
+            
+        Returns:
+            One entry per bucket in the period, oldest first, with empty
+            buckets reported as zero
+        """
+        dialect_name = self._session.get_bind().dialect.name
+        period = bucket_expression(OrderModel.created_at, bucket, dialect_name).label('period')
+        
+        rows = self._session.query(
+            period,
+            func.count(OrderModel.id).label('order_count'),
+            func.coalesce(func.sum(OrderModel.total_amount), 0).label('total_revenue')
+        ).filter(
+            OrderModel.created_at >= start_date,
+            OrderModel.created_at <= end_date
+        ).group_by(period).all()
+        
+        totals = {to_bucket_date(row.period): row for row in rows}
+        
+        stats = []
+        for period_start in iter_buckets(start_date, end_date, bucket):
+            row = totals.get(period_start)
+            stats.append({
+                "date": period_start.strftime("%Y-%m-%d"),
+                "order_count": row.order_count if row else 0,
+                "total_revenue": float(row.total_revenue) if row else 0.0
+            })
+        return stats
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Number of orders per status, including statuses with no orders"""
+        counts = dict(
+            self._session.query(
+                OrderModel.status,
+                func.count(OrderModel.id)
+            ).group_by(OrderModel.status).all()
+        )
+        return {status.value: counts.get(status, 0) for status in OrderStatus}
+
     def get_order_history(
         self,
         user_id: UUID,
@@ -223,6 +369,27 @@ class OrderQueryService:
             
         )
         
+    def _to_list_entry_dto(self, model: OrderModel) -> OrderListEntryDTO:
+        """
+        Convert OrderModel to the order list entry.
+
+        Amounts are floats, as OrderSchema dumps them, so the list reads the
+        same whether it is serialized directly or through the schema.
+        """
+        return OrderListEntryDTO(
+            status=model.status,
+            total_amount=float(model.total_amount),
+            items=[OrderListItemDTO(
+                product_id=item.product_id,
+                quantity=item.quantity,
+                price=float(item.price)
+            ) for item in model.items],
+            notes=model.notes,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            completed_at=model.completed_at
+        )
+        
     def _get_from_cache(self, key: str) -> Any:
         """Get value from cache if it exists and is not expired"""
         if key in self._cache:
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict, Any
+from datetime import datetime, timedelta, UTC
+from typing import Iterator, List, Optional, Tuple, Dict, Any
 from uuid import UUID
 import logging
 
@@ -32,7 +32,9 @@ from app.services.order_service.domain.exceptions.order_errors import (
 )
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
 from app.services.order_service.infrastructure.persistence.mappers.order_mapper import OrderMapper
+from app.services.order_service.infrastructure.persistence.order_archiver import OrderArchiver
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.services.order_service.infrastructure.export.order_export_writer import write_orders
 from app.services.order_service.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.application.events.event_bus import EventBus
@@ -221,53 +223,23 @@ class OrderService:
     def get_order_status_summary(self) -> Dict[str, int]:
         """Get a summary count of orders by status"""
         try:
-            result = {}
-            for status in OrderStatus:
-                filter_dto = OrderFilterDTO(status=status.value)
-                orders, count = self._query_service.get_orders_by_filter(filter_dto)
-                result[status.value] = count
-            return result
+            return self._query_service.get_status_counts()
         except Exception as e:
             logger.error(f"Error getting order status summary: {str(e)}")
             raise e
             
-    def get_daily_order_stats(self, days: int = 30) -> List[Dict]:
-        """Get daily order statistics for the last N days"""
+    def get_daily_order_stats(self, days: int = 30, bucket: str = "day") -> List[Dict]:
+        """
+        Get order count and revenue for the last N days.
+        
+        Args:
+            days: Number of days to cover, ending now
+            bucket: Group by "day", "week" or "month"
+        """
         try:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
-            
-            daily_stats = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                next_date = current_date + timedelta(days=1)
-                
-                # Create filter for this day
-                filter_dto = OrderFilterDTO(
-                    start_date=current_date,
-                    end_date=next_date,
-                    page=1,
-                    per_page=1000
-                )
-                
-                # Get orders for this day
-                orders, total = self._query_service.get_orders_by_filter(filter_dto)
-                
-                # Calculate total revenue
-                total_revenue = sum(order.total_amount for order in orders) if orders else 0
-                
-                # Add stats for this day
-                daily_stats.append({
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "order_count": total,
-                    "total_revenue": float(total_revenue)
-                })
-                
-                # Move to next day
-                current_date = next_date
-                
-            return daily_stats
+            return self._query_service.get_order_stats_by_period(start_date, end_date, bucket)
         except Exception as e:
             logger.error(f"Error generating daily order stats: {str(e)}")
             raise e
@@ -307,6 +279,23 @@ class OrderService:
             logger.error(f"Error exporting orders: {str(e)}")
             raise e
             
+    def stream_orders_export(self, filter_dto: OrderFilterDTO, format: str = "csv", batch_size: int = 500) -> Iterator[str]:
+        """
+        Export every order matching the filter as CSV or NDJSON text chunks.
+        
+        Unlike export_orders this is neither paginated nor materialized: rows
+        are read through a server-side cursor and rendered batch by batch, so
+        it is meant to feed a streaming response directly.
+        """
+        logger.info(f"Streaming {format} order export in batches of {batch_size}")
+        try:
+            batches = self._query_service.iter_orders_for_export(filter_dto, batch_size=batch_size)
+            yield from write_orders(batches, format)
+            logger.info("Order export completed")
+        except Exception as e:
+            logger.error(f"Order export failed: {str(e)}", exc_info=True)
+            raise
+            
     def duplicate_order(self, order_id: UUID, user_id: UUID = None) -> CreateOrderResponse:
         """Create a duplicate of an existing order"""
         try:
@@ -339,38 +328,30 @@ class OrderService:
                 raise e
             raise OrderCreationError(message=f"Failed to duplicate order: {str(e)}")
     
-    def archive_orders(self, days: int = 90) -> int:
-        """Archive orders older than specified days"""
-        try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            
-            # Get orders older than cutoff date
-            filter_dto = OrderFilterDTO(
-                end_date=cutoff_date,
-                per_page=1000  # Process in chunks
-            )
-            
-            orders, total = self._query_service.get_orders_by_filter(filter_dto)
-            archived_count = 0
+    def archive_orders(self, days: int = 90, batch_size: int = 1000, max_batches: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Move finished orders older than the given number of days into the
+        archive tables.
+        
+        Only completed, cancelled and failed orders are moved, in set-based
+        batches (see OrderArchiver) without publishing OrderUpdatedEvent;
+        archived orders remain readable through get_order but no longer
+        count in the status summary or the period statistics. An
+        interrupted run is resumed with its original cutoff.
+        
+        Args:
+            days: Archive orders created more than this many days ago
+            batch_size: Orders moved per transaction
+            max_batches: Stop after this many batches
             
-            # For each order, mark as archived
-            for order in orders:
-                try:
-                    # In a real implementation, you would move these to an archive table
-                    # or set an "archived" flag. This is just an example.
-                    command = UpdateOrderCommand(
-                        id=order.id,
-                        status=OrderStatus.ARCHIVED if hasattr(OrderStatus, "ARCHIVED") else OrderStatus.COMPLETED,
-                        notes=f"Archived automatically on {datetime.now().isoformat()}"
-                    )
-                    self.update_order_status(command)
-                    archived_count += 1
-                except Exception as e:
-                    logger.error(f"Error archiving order {order.id}: {str(e)}")
-                    continue
-                    
-            logger.info(f"Archived {archived_count} orders older than {days} days")
-            return archived_count
+        Returns:
+            Archival summary with the cutoff and the orders and items archived
+        """
+        try:
+            cutoff_date = datetime.now(UTC) - timedelta(days=days)
+            result = OrderArchiver(self._db_session).run(cutoff_date, batch_size, max_batches)
+            logger.info(f"Archived {result['archived_orders']} orders older than {days} days")
+            return result
         except Exception as e:
             logger.error(f"Error archiving old orders: {str(e)}")
             raise e
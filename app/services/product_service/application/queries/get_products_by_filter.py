@@ -14,4 +14,7 @@ class GetProductsByFilterQuery(BaseModel):
     sort_by: str = "name"
     sort_direction: str = "asc"
     page: int = 1
-    items_per_page: int = 20
\ No newline at end of file
+    items_per_page: int = 20
+    cursor: Optional[str] = None
+    use_cursor: bool = False
+    include_total: bool = True
\ No newline at end of file
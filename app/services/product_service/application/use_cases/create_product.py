@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from uuid import UUID
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from pydantic import BaseModel
 
@@ -11,6 +11,8 @@ from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWo
 from app.shared.application.events.event_bus import EventBus
 from app.services.inventory_service.application.events.inventory_create_requested_event import InventoryCreateRequestedEvent
 from app.services.product_service.application.dtos.product_dto import ProductFieldsDto, InventoryFieldsDto
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.infrastructure.cache import CatalogCache
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -33,8 +35,9 @@ class CreateProductUseCase:
     4. Returning a comprehensive response with both product and inventory data
     """
     
-    def __init__(self, uow: UnitOfWork):        
+    def __init__(self, uow: UnitOfWork, cache: Optional[CatalogCache] = None):        
         self._uow = uow
+        self._cache = cache or CatalogCache()
     
     def execute(self, command: CreateProductCommand) -> CreateProductResponseDTO:        
         logger.info(f"Creating product with name: {command.product_fields.name}")
@@ -47,9 +50,13 @@ class CreateProductUseCase:
             
         # Publish event to create inventory
         self._publish_inventory_event(inventory_data)
+        self._uow.publish(CatalogChangedEvent())
             
         # Commit the transaction
         self._uow.commit()
+        
+        # Cached list and search pages do not contain the new product yet
+        self._cache.invalidate_listings()
             
         # Prepare response
         response = self._create_product_response_dto(product_entity, inventory_data)
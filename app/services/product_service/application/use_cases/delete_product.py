@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from uuid import UUID
+from typing import Optional
 import logging
 
 from pydantic import BaseModel
@@ -7,6 +8,8 @@ from pydantic import BaseModel
 from app.services.product_service.application.commands.delete_product_command import DeleteProductCommand
 from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.infrastructure.cache import CatalogCache
 
 class DeleteProductResponseDTO(BaseModel):
     id: UUID
@@ -21,8 +24,9 @@ class DeleteProductUseCase:
     Use case for deleting a product.
     """
     
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, cache: Optional[CatalogCache] = None):
         self._uow = uow
+        self._cache = cache or CatalogCache()
     
     def execute(self, command: DeleteProductCommand) -> DeleteProductResponseDTO:
         logger.info(f"Deleting product with ID: {command.id}")       
@@ -32,9 +36,13 @@ class DeleteProductUseCase:
         
         # Delete product
         success = self._delete_product(command.id)
+        
+        # The other workers drop their cached copies once this commits
+        self._uow.publish(CatalogChangedEvent(product_ids=[product.id]))
                 
         # Commit the transaction
         self._uow.commit()
+        self._cache.invalidate_product(product.id)
         
         # Create response
         response = self._create_response_dto(product.id, success)
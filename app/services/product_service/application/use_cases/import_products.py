@@ -0,0 +1,163 @@
+import logging
+import uuid
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.services.product_service.application.commands.create_product_command import CreateProductCommand
+from app.services.product_service.application.dtos.product_dto import InventoryFieldsDto, ProductFieldsDto
+from app.services.product_service.application.use_cases.create_product import CreateProductResponseDTO
+from app.services.product_service.domain.enums.product_status import ProductStatus
+from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.infrastructure.cache import CatalogCache
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportRow:
+    """One input record: its 1-based row number and either its data or why it could not be read."""
+    number: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class ImportRowErrorDTO(BaseModel):
+    row: int
+    error: str
+
+
+class ImportProductsReportDTO(BaseModel):
+    total_rows: int = 0
+    total_created: int = 0
+    total_errors: int = 0
+    chunks_committed: int = 0
+    # Filled only when requested, for callers that answer with the products
+    created: List[CreateProductResponseDTO] = []
+    errors: List[ImportRowErrorDTO] = []
+    # True when more errors occurred than are listed in ``errors``
+    errors_truncated: bool = False
+
+
+class ImportProductsUseCase:
+    """
+    Use case for importing large product catalogs.
+
+    Rows are validated with the same command as single product creation,
+    then every chunk of valid rows is written with one multi-row INSERT for
+    products and one for their inventory, and committed on its own, so the
+    connection is released between chunks and a bad row never costs more
+    than its chunk. A chunk the database rejects is retried row by row to
+    find the offending rows.
+
+    Unlike CreateProductUseCase, no InventoryCreateRequestedEvent is
+    published; the inventory rows are inserted with the products. Each
+    chunk publishes a CatalogChangedEvent for the other workers' caches.
+    """
+
+    def __init__(self, uow: UnitOfWork, cache: Optional[CatalogCache] = None,
+                 chunk_size: int = 500, max_errors: int = 1000):
+        self._uow = uow
+        self._cache = cache or CatalogCache()
+        self._chunk_size = max(chunk_size, 1)
+        self._max_errors = max_errors
+
+    def execute(self, rows: Iterable[ImportRow], collect_created: bool = False) -> ImportProductsReportDTO:
+        report = ImportProductsReportDTO()
+        rows = iter(rows)
+
+        for chunk in iter(lambda: list(islice(rows, self._chunk_size)), []):
+            report.total_rows += len(chunk)
+            valid = self._validate_chunk(chunk, report)
+            if not valid:
+                continue
+
+            created = self._insert_chunk(valid, report)
+            if created:
+                report.total_created += len(created)
+                report.chunks_committed += 1
+                if collect_created:
+                    report.created.extend(self._to_response_dto(product, inventory) for product, inventory in created)
+                # Cached list and search pages do not contain the new products yet
+                self._cache.invalidate_listings()
+
+            logger.info(f"Imported {report.total_created} of {report.total_rows} product rows so far")
+
+        logger.info(
+            f"Product import completed: {report.total_created} created, "
+            f"{report.total_errors} errors out of {report.total_rows} rows"
+        )
+        return report
+
+    def _validate_chunk(self, chunk: List[ImportRow], report: ImportProductsReportDTO) -> List[Tuple[int, CreateProductCommand]]:
+        valid = []
+        for row in chunk:
+            if row.error:
+                self._record_error(report, row.number, row.error)
+                continue
+            try:
+                valid.append((row.number, CreateProductCommand(**row.data)))
+            except Exception as e:
+                self._record_error(report, row.number, self._describe(e))
+        return valid
+
+    def _insert_chunk(
+        self, commands: List[Tuple[int, CreateProductCommand]], report: ImportProductsReportDTO
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Insert and commit the rows; returns the product and inventory values of those created."""
+        products, inventories = self._to_rows(commands)
+        try:
+            self._uow.product_repository.bulk_insert(products, inventories)
+            self._uow.publish(CatalogChangedEvent())
+            self._uow.commit()
+            return list(zip(products, inventories))
+        except Exception as e:
+            self._uow.rollback()
+            if len(commands) == 1:
+                self._record_error(report, commands[0][0], self._describe(e))
+                return []
+            logger.warning(f"Chunk of {len(commands)} product rows rejected, retrying row by row: {str(e)}")
+
+        created = []
+        for command in commands:
+            created.extend(self._insert_chunk([command], report))
+        return created
+
+    def _to_rows(self, commands: List[Tuple[int, CreateProductCommand]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Column values for both tables; every row carries the same keys, as executemany requires."""
+        products, inventories = [], []
+        for _, command in commands:
+            product = command.product_fields.model_dump()
+            product['id'] = product.get('id') or uuid.uuid4()
+            product['status'] = product.get('status') or ProductStatus.ACTIVE
+            inventory = command.inventory_fields.model_dump()
+            inventory['product_id'] = product['id']
+            products.append(product)
+            inventories.append(inventory)
+        return products, inventories
+
+    @staticmethod
+    def _to_response_dto(product: Dict[str, Any], inventory: Dict[str, Any]) -> CreateProductResponseDTO:
+        """The same response CreateProductUseCase gives for a single product"""
+        return CreateProductResponseDTO(
+            id=product['id'],
+            product_fields=ProductFieldsDto(**product),
+            inventory_fields=InventoryFieldsDto(**inventory)
+        )
+
+    def _record_error(self, report: ImportProductsReportDTO, row: int, error: str) -> None:
+        report.total_errors += 1
+        if len(report.errors) < self._max_errors:
+            report.errors.append(ImportRowErrorDTO(row=row, error=error))
+        else:
+            report.errors_truncated = True
+
+    @staticmethod
+    def _describe(error: Exception) -> str:
+        message = getattr(error, 'message', None) or str(error)
+        # Driver errors repeat the whole statement and parameters; the first line says what failed
+        return message.splitlines()[0] if message else type(error).__name__
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from uuid import UUID
+from typing import Optional
 import logging
 
 from pydantic import BaseModel
@@ -10,6 +11,8 @@ from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWo
 from app.shared.application.events.event_bus import EventBus
 from app.services.inventory_service.application.events.inventory_update_requested_event import InventoryUpdateRequestedEvent
 from app.services.product_service.application.dtos.product_dto import ProductFieldsDto, InventoryFieldsDto
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.infrastructure.cache import CatalogCache
 
 class UpdateProductResponseDTO(BaseModel):
     id: UUID
@@ -24,15 +27,19 @@ class UpdateProductUseCase:
     Use case for updating an existing product.
     """
     
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, cache: Optional[CatalogCache] = None):
         self._uow = uow
+        self._cache = cache or CatalogCache()
     
     def execute(self, command: UpdateProductCommand) -> UpdateProductResponseDTO:
         logger.info(f"Updating product with ID: {command.id}")       
         product_fields_entity = self._update_product(command)
         inventory_fields_dict = self._update_inventory_dict(command, product_fields_entity)   
         self._publish_inventory_event(inventory_fields_dict)
+        # The other workers drop their cached copies once this commits
+        self._uow.publish(CatalogChangedEvent(product_ids=[product_fields_entity.id]))
         self._uow.commit()
+        self._cache.invalidate_product(product_fields_entity.id)
         response = self._create_product_response_dto(product_fields_entity, inventory_fields_dict)
         logger.info(f"Product updated successfully: {response.product_fields.id}")
         return response
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 
 from app.services.product_service.domain.entities.product_entity import ProductEntity
@@ -79,6 +79,23 @@ class ProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def list_after(self, filters: Optional[Dict[str, Any]] = None,
+                   cursor: Optional[str] = None,
+                   page_size: int = 20) -> Tuple[List[ProductEntity], Optional[str]]:
+        """
+        List products after a keyset cursor, without OFFSET.
+        
+        Args:
+            filters: Optional dictionary of filter criteria
+            cursor: Opaque cursor returned with the previous page, or None for the first page
+            page_size: Number of items per page
+            
+        Returns:
+            Tuple of product entities and the cursor for the next page
+        """
+        pass
+    
     @abstractmethod
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
@@ -90,4 +107,18 @@ class ProductRepository(ABC):
         Returns:
             Count of products matching the criteria
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def bulk_insert(self, products: List[Dict[str, Any]], inventories: List[Dict[str, Any]]) -> int:
+        """
+        Insert many products and their inventory rows in one round trip each.
+        
+        Args:
+            products: Product column values, each including its pre-generated ID
+            inventories: Inventory column values referencing those product IDs
+            
+        Returns:
+            Number of products inserted
+        """
+        pass
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+import logging
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+from app.services.product_service.application.dtos.product_dto import InventoryFieldsDto, ProductFieldsDto
+from app.services.product_service.application.use_cases.import_products import ImportRow
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ('csv', 'jsonl')
+
+_PRODUCT_FIELDS = set(ProductFieldsDto.model_fields)
+_INVENTORY_FIELDS = set(InventoryFieldsDto.model_fields) - {'product_id'}
+
+
+def detect_import_format(content_type: Optional[str], filename: Optional[str] = None) -> Optional[str]:
+    """Guess 'csv' or 'jsonl' from a MIME type or file extension."""
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in ('text/csv', 'application/csv'):
+        return 'csv'
+    if content_type in ('application/x-ndjson', 'application/jsonl', 'application/x-jsonlines'):
+        return 'jsonl'
+
+    extension = (filename or '').rsplit('.', 1)[-1].lower()
+    if extension == 'csv':
+        return 'csv'
+    if extension in ('jsonl', 'ndjson'):
+        return 'jsonl'
+    return None
+
+
+def read_product_rows(stream: BinaryIO, fmt: str) -> Iterator[ImportRow]:
+    """
+    Lazily read product rows from an uploaded CSV or JSON Lines stream.
+
+    Records may be flat (``name``, ``price``, ``quantity``, ... as CSV columns
+    or JSON keys) or nested under ``product_fields``/``inventory_fields`` like
+    the create product payload. Empty CSV cells are treated as missing.
+    A record that cannot be parsed is yielded with its error so the import
+    can report it and carry on.
+    """
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+    # utf-8-sig drops the BOM spreadsheet exports like to start with
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='' if fmt == 'csv' else None)
+    if fmt == 'csv':
+        yield from _read_csv(text)
+    else:
+        yield from _read_jsonl(text)
+
+
+def _read_csv(text: io.TextIOBase) -> Iterator[ImportRow]:
+    reader = csv.DictReader(text)
+    # Row 1 is the header
+    for number, record in enumerate(reader, start=2):
+        if None in record:
+            yield ImportRow(number, error=f"Expected {len(reader.fieldnames)} columns, got more")
+            continue
+        yield ImportRow(number, data=_nest({
+            key.strip(): value.strip() for key, value in record.items()
+            if key and value is not None and value.strip() != ''
+        }))
+
+
+def _read_jsonl(text: io.TextIOBase) -> Iterator[ImportRow]:
+    for number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield ImportRow(number, error=f"Invalid JSON: {str(e)}")
+            continue
+        if not isinstance(record, dict):
+            yield ImportRow(number, error="Expected a JSON object")
+            continue
+        yield ImportRow(number, data=_nest(record))
+
+
+def _nest(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Split a flat record into the product_fields/inventory_fields shape of CreateProductCommand."""
+    if 'product_fields' in record or 'inventory_fields' in record:
+        return {
+            'product_fields': record.get('product_fields') or {},
+            'inventory_fields': record.get('inventory_fields') or {},
+        }
+    return {
+        'product_fields': {key: value for key, value in record.items() if key in _PRODUCT_FIELDS},
+        'inventory_fields': {key: value for key, value in record.items() if key in _INVENTORY_FIELDS},
+    }
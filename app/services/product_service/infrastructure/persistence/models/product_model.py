@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Enum, String, DateTime
+from sqlalchemy import Column, Enum, Index, String, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.dataBase import db
@@ -8,6 +8,11 @@ from app.services.product_service.domain.enums.product_status import ProductStat
 
 class ProductModel(db.Model):
     __tablename__ = 'products'
+    __table_args__ = (
+        # Listing order (name, id) used by both OFFSET and keyset pagination
+        Index('ix_products_name_id', 'name', 'id'),
+        Index('ix_products_category_id', 'category_id'),
+    )
     id = Column(UUID(as_uuid=True), default=uuid.uuid4, primary_key=True)
     category_id = Column(UUID(as_uuid=True), nullable=True)
     name = Column(String(255), nullable=False)
@@ -2,16 +2,22 @@ from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
-from sqlalchemy import or_, and_, desc, asc, func
+from sqlalchemy import or_, and_, desc, asc, func, insert
 import logging
 
 from app.services.product_service.domain.entities.product_entity import ProductEntity
 from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
 from app.services.product_service.domain.interfaces.repository import ProductRepository as ProductRepositoryInterface
+from app.services.product_service.infrastructure.search.product_search import product_search_for
+from app.shared.infrastructure.persistence.pagination import paginate_keyset
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Alphabetical, with the primary key as a unique tie-breaker
+PRODUCT_KEYSET = ((ProductModel.name, "asc"), (ProductModel.id, "asc"))
+
 class ProductRepository(ProductRepositoryInterface):
     def __init__(self, session: Session):
         self._session = session
@@ -105,6 +111,51 @@ class ProductRepository(ProductRepositoryInterface):
         logger.info(f"Product deleted successfully: {product_id}")
         return True
 
+    def bulk_insert(self, products: List[Dict[str, Any]], inventories: List[Dict[str, Any]]) -> int:
+        """
+        Insert products and their inventory rows as two executemany statements.
+        
+        The inventory rows are written here, in the same transaction, instead
+        of one InventoryCreateRequestedEvent per product; column defaults
+        (created_at, inventory id, ...) are still applied by SQLAlchemy.
+        """
+        if not products:
+            return 0
+        
+        self._session.execute(insert(ProductModel), products)
+        if inventories:
+            self._session.execute(insert(InventoryModel), inventories)
+        logger.info(f"Bulk inserted {len(products)} products and {len(inventories)} inventory rows")
+        return len(products)
+
+    def _filtered_query(self, query, filters: Optional[Dict[str, Any]] = None):
+        """Apply the shared list/count filter criteria to a query"""
+        if not filters:
+            return query
+        
+        filter_conditions = []
+        
+        # Apply filters
+        if 'name' in filters:
+            filter_conditions.append(ProductModel.name.ilike(f"%{filters['name']}%"))
+        
+        if 'brand' in filters:
+            filter_conditions.append(ProductModel.brand.ilike(f"%{filters['brand']}%"))
+        
+        if 'category_id' in filters:
+            filter_conditions.append(ProductModel.category_id == filters['category_id'])
+        
+        if 'status' in filters:
+            filter_conditions.append(ProductModel.status == filters['status'])
+        
+        if 'search' in filters:
+            filter_conditions.append(product_search_for(self._session).condition(filters['search']))
+        
+        if filter_conditions:
+            query = query.filter(and_(*filter_conditions))
+        
+        return query
+
     def list(self, filters: Optional[Dict[str, Any]] = None, 
              page: int = 1, 
              page_size: int = 20) -> List[ProductEntity]:
@@ -121,40 +172,7 @@ class ProductRepository(ProductRepositoryInterface):
         """
         logger.info(f"Listing products with filters: {filters}, page: {page}, page_size: {page_size}")
         try:
-            query = self._session.query(ProductModel)
-            
-            if filters:
-                filter_conditions = []
-                
-                # Apply filters
-                if 'name' in filters:
-                    filter_conditions.append(ProductModel.name.ilike(f"%{filters['name']}%"))
-                
-                if 'brand' in filters:
-                    filter_conditions.append(ProductModel.brand.ilike(f"%{filters['brand']}%"))
-                
-                if 'category_id' in filters:
-                    filter_conditions.append(ProductModel.category_id == filters['category_id'])
-                
-                if 'status' in filters:
-                    filter_conditions.append(ProductModel.status == filters['status'])
-                
-                if 'search' in filters:
-                    search_term = f"%{filters['search']}%"
-                    filter_conditions.append(
-                        or_(
-                            ProductModel.name.ilike(search_term),
-                            ProductModel.description.ilike(search_term),
-                            ProductModel.brand.ilike(search_term),
-                            ProductModel.dosage_form.ilike(search_term)
-                        )
-                    )
-                
-                if filter_conditions:
-                    query = query.filter(and_(*filter_conditions))
-            
-            # Get total items count before pagination for metadata
-            total_items = query.count()
+            query = self._filtered_query(self._session.query(ProductModel), filters)
             
             # Apply pagination
             offset = (page - 1) * page_size
@@ -163,13 +181,40 @@ class ProductRepository(ProductRepositoryInterface):
             # Convert models to entities
             results = [self._to_domain(model) for model in query.all()]
             
-            logger.info(f"Listed {len(results)} products (page {page}, page_size {page_size}, total items: {total_items})")
+            logger.info(f"Listed {len(results)} products (page {page}, page_size {page_size})")
             return results
             
         except Exception as e:
             logger.error(f"Error listing products: {str(e)}", exc_info=True)
             raise
 
+    def list_after(self, filters: Optional[Dict[str, Any]] = None,
+                   cursor: Optional[str] = None,
+                   page_size: int = 20) -> Tuple[List[ProductEntity], Optional[str]]:
+        """
+        List products after a keyset cursor, ordered by (name, id).
+        
+        Args:
+            filters: Optional dictionary of filter criteria
+            cursor: Cursor returned with the previous page, or None for the first page
+            page_size: Number of items per page
+            
+        Returns:
+            Tuple of product entities and the cursor for the next page (None on the last page)
+        """
+        logger.info(f"Listing products with filters: {filters}, after cursor, page_size: {page_size}")
+        try:
+            query = self._filtered_query(self._session.query(ProductModel), filters)
+            models, next_cursor = paginate_keyset(query, PRODUCT_KEYSET, page_size, cursor)
+            
+            results = [self._to_domain(model) for model in models]
+            logger.info(f"Listed {len(results)} products after cursor (page_size {page_size})")
+            return results, next_cursor
+            
+        except Exception as e:
+            logger.error(f"Error listing products: {str(e)}", exc_info=True)
+            raise
+
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count products matching the specified filters.
@@ -182,37 +227,7 @@ class ProductRepository(ProductRepositoryInterface):
         """
         logger.info(f"Counting products with filters: {filters}")
         try:
-            query = self._session.query(func.count(ProductModel.id))
-            
-            if filters:
-                filter_conditions = []
-                
-                # Apply the same filters as list method
-                if 'name' in filters:
-                    filter_conditions.append(ProductModel.name.ilike(f"%{filters['name']}%"))
-                
-                if 'brand' in filters:
-                    filter_conditions.append(ProductModel.brand.ilike(f"%{filters['brand']}%"))
-                
-                if 'category_id' in filters:
-                    filter_conditions.append(ProductModel.category_id == filters['category_id'])
-                
-                if 'status' in filters:
-                    filter_conditions.append(ProductModel.status == filters['status'])
-                
-                if 'search' in filters:
-                    search_term = f"%{filters['search']}%"
-                    filter_conditions.append(
-                        or_(
-                            ProductModel.name.ilike(search_term),
-                            ProductModel.description.ilike(search_term),
-                            ProductModel.brand.ilike(search_term),
-                            ProductModel.dosage_form.ilike(search_term)
-                        )
-                    )
-                
-                if filter_conditions:
-                    query = query.filter(and_(*filter_conditions))
+            query = self._filtered_query(self._session.query(func.count(ProductModel.id)), filters)
             
             count = query.scalar()
             logger.info(f"Counted {count} products matching filters")
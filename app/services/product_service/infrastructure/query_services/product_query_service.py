@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from sqlalchemy import or_, and_, func, text
 from math import ceil
 import logging
@@ -13,32 +13,50 @@ from app.services.product_service.application.use_cases.get_product import GetPr
 from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
 from app.services.product_service.application.dtos.product_dto import ProductFieldsDto, InventoryFieldsDto
+from app.services.product_service.infrastructure.search.product_search import product_search_for
+from app.shared.infrastructure.cache import CatalogCache
+from app.shared.infrastructure.persistence.pagination import paginate_keyset
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Alphabetical, with the primary key as a unique tie-breaker
+PRODUCT_KEYSET = ((ProductModel.name, "asc"), (ProductModel.id, "asc"))
+
 class ProductQueryService:
     """
     Query service for optimized product read operations with advanced filtering and analytics.
     """
     
-    def __init__(self, session: Session, uow: UnitOfWork):
+    def __init__(self, session: Session, uow: UnitOfWork, cache: Optional[CatalogCache] = None):
         """
         Initialize the query service with a database session.
         
         Args:
             session: SQLAlchemy database session
             uow: Unit of Work for transaction management
+            cache: Catalog cache in front of get_by_id, list and search
         """
         self._session = session
         self._uow = uow
+        self._cache = cache or CatalogCache()
         self._get_product_use_case = GetProductUseCase(self._uow)
     
-    def get_by_id(self, query: GetProductByIdQuery) -> GetProductResponseDTO:
+    def get_by_id(self, query: GetProductByIdQuery) -> Optional[GetProductResponseDTO]:
         """Get a single product by ID with inventory data"""
+        return self._cache.get_product(query.id, lambda: self._load_by_id(query))
+    
+    def _load_by_id(self, query: GetProductByIdQuery) -> Optional[GetProductResponseDTO]:
         product_fields = self._get_product_use_case.execute(query)
+        if product_fields is None:
+            return None
         # Get inventory information if available
-        product_model = self._session.query(ProductModel).filter(ProductModel.id == product_fields.id).first()
+        product_model = (
+            self._session.query(ProductModel)
+            .options(joinedload(ProductModel.inventory))
+            .filter(ProductModel.id == product_fields.id)
+            .first()
+        )
         inventory_data = self._get_inventory_data(product_model)
         # Create response DTO
         response = GetProductResponseDTO(
@@ -50,40 +68,20 @@ class ProductQueryService:
     
     def list(self, filters: GetProductsByFilterQuery) -> Dict[str, Any]:
         """List products with advanced filtering and pagination"""
+        return self._cache.get_listing("list", filters, lambda: self._load_list(filters))
+    
+    def _load_list(self, filters: GetProductsByFilterQuery) -> Dict[str, Any]:
         logger.info(f"Query service listing products with filters")
-        # Build the query with filters
-        query = self._session.query(ProductModel)
+        # Build the query with filters, loading inventory in the same SELECT
+        query = self._with_inventory()
         
         query = self._apply_filters(query, filters)
         
-        # Get total count for pagination
-        total_count = query.count()
-        
-        # Apply pagination
-        offset = (filters.page - 1) * filters.items_per_page
-        products = query.order_by(ProductModel.name).offset(offset).limit(filters.items_per_page).all()
-        
-        # Calculate pagination metadata
-        total_pages = ceil(total_count / filters.items_per_page) if total_count > 0 else 1
+        # Count and paginate (OFFSET or keyset)
+        products, total_count, total_pages, next_cursor = self._paginate(query, filters)
         
         # Convert to DTOs
-        items = [{           
-            "id": str(product.id),
-            "name": product.name,
-            "description": product.description,
-            "price": self._get_inventory_data(product).price if self._get_inventory_data(product) else 0.0,
-            "imageUrl": product.image_url,
-            "inStock": self._get_inventory_data(product).quantity > 0 if self._get_inventory_data(product) else False,
-            "stockQuantity": self._get_inventory_data(product).quantity if self._get_inventory_data(product) else 0,
-            "category": "category",
-            "manufacturer": product.brand,
-            "metadata": {
-              "prescription": False,
-              "dosage": product.strength,
-              "form": product.dosage_form,
-            },
-            }     
-                 for product in products]
+        items = [self._to_list_item(product) for product in products]
         
         # Build response
         result = {
@@ -91,7 +89,8 @@ class ProductQueryService:
             "total_items": total_count,
             "page": filters.page,
             "page_size": filters.items_per_page,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
         }
         
         logger.info(f"Query service found {total_count} products (page {filters.page} of {total_pages})")
@@ -107,21 +106,24 @@ class ProductQueryService:
         Returns:
             Dictionary with search results and pagination information
         """
+        return self._cache.get_listing("search", query, lambda: self._load_search(query))
+    
+    def _load_search(self, query: GetProductsByFilterQuery) -> Dict[str, Any]:
         logger.info(f"Query service searching products with advanced criteria")
         
-        # Build the query with search filters
-        sql_query = self._session.query(ProductModel)
+        # Build the query with search filters, loading inventory in the same SELECT
+        sql_query = self._with_inventory()
         sql_query = self._apply_search_filters(sql_query, query)
         
-        # Get total count for pagination
-        total_count = sql_query.count()
+        # Full-text match; offset pages are ordered by relevance first, while
+        # cursor pages keep the (name, id) order their keyset relies on
+        if query.name:
+            sql_query, rank = product_search_for(self._session).ranked(sql_query, query.name)
+            if rank is not None and not (query.cursor or query.use_cursor):
+                sql_query = sql_query.order_by(rank.desc())
         
-        # Apply pagination
-        offset = (query.page - 1) * query.items_per_page
-        products = sql_query.order_by(ProductModel.name).offset(offset).limit(query.items_per_page).all()
-        
-        # Calculate pagination metadata
-        total_pages = ceil(total_count / query.items_per_page) if total_count > 0 else 1
+        # Count and paginate (OFFSET or keyset)
+        products, total_count, total_pages, next_cursor = self._paginate(sql_query, query)
         
         # Convert to DTOs
         items = [self._to_dto(product) for product in products]
@@ -132,7 +134,8 @@ class ProductQueryService:
             "total_items": total_count,
             "page": query.page,
             "page_size": query.items_per_page,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
         }
         
         logger.info(f"Search found {total_count} products (page {query.page} of {total_pages})")
@@ -156,6 +159,7 @@ class ProductQueryService:
         query = (
             self._session.query(ProductModel)
             .join(InventoryModel, ProductModel.id == InventoryModel.product_id)
+            .options(contains_eager(ProductModel.inventory))
             .filter(
                 InventoryModel.quantity <= InventoryModel.min_stock * threshold_percentage / 100
             )
@@ -221,6 +225,7 @@ class ProductQueryService:
         query = (
             self._session.query(ProductModel)
             .join(InventoryModel, ProductModel.id == InventoryModel.product_id)
+            .options(contains_eager(ProductModel.inventory))
             .filter(
                 InventoryModel.expiry_date.isnot(None),
                 InventoryModel.expiry_date <= expiry_cutoff,
@@ -246,7 +251,11 @@ class ProductQueryService:
             inventory = product.inventory
             item = self._to_dto(product)
             if inventory and inventory.expiry_date:
-                days_until_expiry = (inventory.expiry_date - today).days
+                # expiry_date is a DATETIME column; count whole days from today
+                expiry_date = inventory.expiry_date
+                if isinstance(expiry_date, datetime):
+                    expiry_date = expiry_date.date()
+                days_until_expiry = (expiry_date - today).days
                 item['expiry_info'] = {
                     "expiry_date": inventory.expiry_date.isoformat(),
                     "days_until_expiry": days_until_expiry,
@@ -432,6 +441,33 @@ class ProductQueryService:
         logger.info(f"Availability validation completed for product: {product_id}")
         return validation_result
     
+    def _paginate(self, query, filters: GetProductsByFilterQuery):
+        """
+        Count and fetch one page of products ordered by name.
+        
+        Cursor mode seeks past (name, id) of the previous page's last row
+        instead of using OFFSET, and may skip the total count.
+        
+        Returns:
+            Tuple of (products, total_count, total_pages, next_cursor);
+            the totals are None when the count was skipped
+        """
+        page_size = filters.items_per_page
+        cursor_mode = bool(filters.cursor) or filters.use_cursor
+        
+        total_count = total_pages = None
+        if not cursor_mode or filters.include_total:
+            total_count = query.count()
+            total_pages = ceil(total_count / page_size) if total_count > 0 else 1
+        
+        if cursor_mode:
+            products, next_cursor = paginate_keyset(query, PRODUCT_KEYSET, page_size, filters.cursor)
+            return products, total_count, total_pages, next_cursor
+        
+        offset = (filters.page - 1) * page_size
+        products = query.order_by(ProductModel.name).offset(offset).limit(page_size).all()
+        return products, total_count, total_pages, None
+    
     def _apply_filters(self, query, filters: GetProductsByFilterQuery):
         """Apply basic filters to a query"""
         filter_conditions = []
@@ -462,18 +498,7 @@ class ProductQueryService:
         """Apply advanced search filters to a query"""
         filter_conditions = []
         
-        # Text search across multiple fields
-        if search_query.name:
-            search_term = f"%{search_query.name}%"
-            filter_conditions.append(
-                or_(
-                    ProductModel.name.ilike(search_term),
-                    ProductModel.description.ilike(search_term),
-                    ProductModel.brand.ilike(search_term),
-                    ProductModel.dosage_form.ilike(search_term),
-                    ProductModel.strength.ilike(search_term)
-                )
-            )
+        # The text term (search_query.name) is matched by the search backend in search()
         
         # Category filter
         if search_query.category_id:
@@ -487,22 +512,15 @@ class ProductQueryService:
         if hasattr(search_query, 'status') and search_query.status:
             filter_conditions.append(ProductModel.status == search_query.status)
         
-        # Price filters (requires joining with inventory)
-        if hasattr(search_query, 'min_price') or hasattr(search_query, 'max_price'):
-            query = query.join(InventoryModel, ProductModel.id == InventoryModel.product_id)
-            
-            if hasattr(search_query, 'min_price') and search_query.min_price:
-                filter_conditions.append(InventoryModel.price >= search_query.min_price)
-            
-            if hasattr(search_query, 'max_price') and search_query.max_price:
-                filter_conditions.append(InventoryModel.price <= search_query.max_price)
+        # Price filters (inventory is already joined by _with_inventory)
+        if getattr(search_query, 'min_price', None):
+            filter_conditions.append(InventoryModel.price >= search_query.min_price)
+        
+        if getattr(search_query, 'max_price', None):
+            filter_conditions.append(InventoryModel.price <= search_query.max_price)
         
         # In stock only filter
-        if hasattr(search_query, 'in_stock_only') and search_query.in_stock_only:
-            # Check if we already joined inventory table
-            joined_tables = [mapper.class_ for mapper in query.column_descriptions if hasattr(mapper, 'class_')]
-            if InventoryModel not in joined_tables:
-                query = query.join(InventoryModel, ProductModel.id == InventoryModel.product_id)
+        if getattr(search_query, 'in_stock_only', False):
             filter_conditions.append(InventoryModel.quantity > 0)
         
         # Apply all filters
@@ -511,6 +529,34 @@ class ProductQueryService:
         
         return query
     
+    def _with_inventory(self):
+        """Product query with its inventory row fetched in the same SELECT"""
+        return (
+            self._session.query(ProductModel)
+            .outerjoin(ProductModel.inventory)
+            .options(contains_eager(ProductModel.inventory))
+        )
+    
+    def _to_list_item(self, product: ProductModel) -> Dict[str, Any]:
+        """Convert a product model to the storefront list item shape"""
+        inventory = self._get_inventory_data(product)
+        return {
+            "id": str(product.id),
+            "name": product.name,
+            "description": product.description,
+            "price": inventory.price if inventory else 0.0,
+            "imageUrl": product.image_url,
+            "inStock": inventory.quantity > 0 if inventory else False,
+            "stockQuantity": inventory.quantity if inventory else 0,
+            "category": "category",
+            "manufacturer": product.brand,
+            "metadata": {
+                "prescription": False,
+                "dosage": product.strength,
+                "form": product.dosage_form,
+            },
+        }
+    
     def _to_dto(self, product_model) -> Dict[str, Any]:
         """Convert a product model to a DTO"""
         product_fields = ProductFieldsDto(
@@ -0,0 +1,210 @@
+import logging
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.orm import Session
+
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Weighted document searched on PostgreSQL. The GIN index created by the
+# migration is on this exact expression (unqualified), so the planner only
+# uses it when queries build the vector the same way.
+_PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce({p}name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce({p}brand, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce({p}description, '') || ' ' || "
+    "coalesce({p}dosage_form, '') || ' ' || coalesce({p}strength, '')), 'C')"
+)
+
+# FTS5 column weights for bm25(), in products_fts column order:
+# name, brand, description, dosage_form, strength
+_FTS5_WEIGHTS = (10.0, 5.0, 1.0, 1.0, 1.0)
+
+
+def search_tokens(term: Optional[str]) -> List[str]:
+    """Split a user search term into word tokens safe to embed in a query string."""
+    return re.findall(r"\w+", term or "")
+
+
+class ProductSearchBackend:
+    """
+    Full-text matching and relevance ranking of products.
+
+    ``condition`` is a plain WHERE clause for callers that keep their own
+    ordering; ``ranked`` also returns a relevance expression (higher is
+    better) to order by.
+    """
+
+    name = "base"
+
+    def condition(self, term: str):
+        raise NotImplementedError
+
+    def ranked(self, query, term: str) -> Tuple[object, Optional[object]]:
+        """
+        Restrict a product query to matches of ``term``.
+
+        Returns:
+            Tuple of the filtered query and its relevance expression (None
+            when the backend cannot rank)
+        """
+        raise NotImplementedError
+
+
+class LikeProductSearch(ProductSearchBackend):
+    """Unindexed ILIKE matching, used until the search migration has run."""
+
+    name = "like"
+
+    def condition(self, term: str):
+        pattern = f"%{term}%"
+        return or_(
+            ProductModel.name.ilike(pattern),
+            ProductModel.description.ilike(pattern),
+            ProductModel.brand.ilike(pattern),
+            ProductModel.dosage_form.ilike(pattern),
+            ProductModel.strength.ilike(pattern)
+        )
+
+    def ranked(self, query, term: str):
+        return query.filter(self.condition(term)), None
+
+
+class PostgresProductSearch(ProductSearchBackend):
+    """
+    ``tsvector`` matching on a weighted document (name > brand > the rest)
+    with prefix queries, plus a pg_trgm-indexed substring match on the name
+    for partial words the tokenizer would miss.
+    """
+
+    name = "postgresql"
+
+    def __init__(self, has_trigram: bool = True):
+        self._has_trigram = has_trigram
+        self._vector = literal_column(_PG_SEARCH_VECTOR.format(p="products."))
+
+    def _tsquery(self, term: str):
+        # Every token must match, each as a prefix ("parac" finds "paracetamol")
+        tokens = search_tokens(term)
+        return func.to_tsquery(literal_column("'simple'"), " & ".join(f"{token}:*" for token in tokens))
+
+    def condition(self, term: str):
+        if not search_tokens(term):
+            return ProductModel.name.ilike(f"%{term}%")
+        matches = self._vector.op("@@")(self._tsquery(term))
+        if self._has_trigram:
+            return or_(matches, ProductModel.name.ilike(f"%{term}%"))
+        return matches
+
+    def ranked(self, query, term: str):
+        if not search_tokens(term):
+            return query.filter(self.condition(term)), None
+        rank = func.ts_rank_cd(self._vector, self._tsquery(term))
+        if self._has_trigram:
+            rank = rank + func.similarity(ProductModel.name, term)
+        return query.filter(self.condition(term)), rank
+
+
+class SqliteProductSearch(ProductSearchBackend):
+    """
+    FTS5 matching through the external-content ``products_fts`` table,
+    which triggers keep in sync with ``products`` by rowid and which is
+    ranked with bm25().
+
+    SQLite may renumber rowids on VACUUM for tables without an INTEGER
+    PRIMARY KEY, so run ``rebuild_index`` after vacuuming the database.
+    """
+
+    name = "sqlite-fts5"
+
+    _fts = table("products_fts", column("rowid"))
+
+    def _match_query(self, term: str) -> str:
+        # Quoted prefix tokens, implicitly ANDed: "parac"* "500"*
+        return " ".join(f'"{token}"*' for token in search_tokens(term))
+
+    def _matches(self, term: str, with_rank: bool = False):
+        columns = [self._fts.c.rowid.label("rowid")]
+        if with_rank:
+            # bm25() is lower for better matches; negate so higher is better
+            columns.append((-func.bm25(literal_column("products_fts"), *_FTS5_WEIGHTS)).label("rank"))
+        return (
+            select(*columns)
+            .select_from(self._fts)
+            .where(text("products_fts MATCH :fts_query").bindparams(fts_query=self._match_query(term)))
+        )
+
+    def condition(self, term: str):
+        if not search_tokens(term):
+            return ProductModel.name.ilike(f"%{term}%")
+        return literal_column("products.rowid").in_(self._matches(term))
+
+    def ranked(self, query, term: str):
+        if not search_tokens(term):
+            return query.filter(self.condition(term)), None
+        matches = self._matches(term, with_rank=True).subquery("fts_matches")
+        query = query.join(matches, matches.c.rowid == literal_column("products.rowid"))
+        return query, matches.c.rank
+
+    @staticmethod
+    def rebuild_index(connection) -> None:
+        """Re-read every product into products_fts."""
+        connection.execute(text("INSERT INTO products_fts(products_fts) VALUES ('rebuild')"))
+
+
+_backends: Dict[str, ProductSearchBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def product_search_for(session: Session) -> ProductSearchBackend:
+    """
+    Search backend for the session's database, detected once per engine.
+
+    Falls back to ILIKE matching where the search migration has not been
+    applied yet (no products_fts table on SQLite, no pg_trgm on PostgreSQL
+    still gets tsvector search).
+    """
+    bind = session.get_bind()
+    key = str(bind.url)
+    backend = _backends.get(key)
+    if backend is not None:
+        return backend
+
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = _detect_backend(bind)
+            _backends[key] = backend
+            logger.info(f"Product search backend: {backend.name}")
+    return backend
+
+
+def _detect_backend(bind) -> ProductSearchBackend:
+    dialect_name = bind.dialect.name
+    with bind.connect() as connection:
+        if dialect_name == "postgresql":
+            has_trigram = connection.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).first() is not None
+            return PostgresProductSearch(has_trigram=has_trigram)
+
+        if dialect_name == "sqlite":
+            has_fts = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'products_fts'")
+            ).first() is not None
+            if has_fts:
+                return SqliteProductSearch()
+            # Tables made by create_all (SCHEMA_AUTO_CREATE) have no FTS index
+            logger.warning(
+                "products_fts is missing, product search falls back to unindexed ILIKE; "
+                "run `flask migrate-db` to create the full-text index"
+            )
+            return LikeProductSearch()
+
+    logger.warning(f"No full-text product search for {dialect_name}, falling back to unindexed ILIKE")
+    return LikeProductSearch()
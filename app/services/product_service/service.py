@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, List, Dict, Any, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 import logging
@@ -15,11 +15,15 @@ from app.services.product_service.application.use_cases.update_product import Up
 from app.services.product_service.application.use_cases.delete_product import DeleteProductUseCase
 from app.services.product_service.application.use_cases.get_product import GetProductUseCase
 from app.services.product_service.application.use_cases.list_products import ListProductsUseCase
+from app.services.product_service.application.use_cases.import_products import ImportProductsUseCase, ImportProductsReportDTO, ImportRow
 from app.services.product_service.infrastructure.persistence.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from app.services.product_service.infrastructure.query_services.product_query_service import ProductQueryService
 from app.services.product_service.infrastructure.adapters.product_event_adapter import ProductEventAdapter
+from app.services.product_service.infrastructure.importers.product_import_reader import read_product_rows
+from app.shared.contracts.product.product_events import CatalogChangedEvent
 from app.shared.acl.unified_acl import UnifiedACL
-from app.shared.application.events.event_bus import EventBus
+from app.shared.application.events.event_bus import EventBus, EventPriority
+from app.shared.infrastructure.cache import CacheBackend, CatalogCache
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -34,6 +38,7 @@ class ProductService:
         self._acl = acl
         self._event_bus = event_bus
         self._init_resources()
+        self._register_event_handlers()
         logger.info("Product service initialized")
         
     def _init_resources(self):
@@ -44,12 +49,37 @@ class ProductService:
             self._event_bus, 
             self._acl
         )
-        self._query_service = ProductQueryService(self._db_session,self._uow)
-        self._create_product_use_case = CreateProductUseCase(self._uow)
-        self._update_product_use_case = UpdateProductUseCase(self._uow)
-        self._delete_product_use_case = DeleteProductUseCase(self._uow)        
+        # Disabled until configure_catalog_cache() is called with a backend
+        self._catalog_cache = CatalogCache()
+        self._query_service = ProductQueryService(self._db_session,self._uow, self._catalog_cache)
+        self._create_product_use_case = CreateProductUseCase(self._uow, self._catalog_cache)
+        self._update_product_use_case = UpdateProductUseCase(self._uow, self._catalog_cache)
+        self._delete_product_use_case = DeleteProductUseCase(self._uow, self._catalog_cache)        
         self._list_products_use_case = ListProductsUseCase(self._uow)
         
+    def _register_event_handlers(self):
+        """Register event handlers with the event bus."""
+        if self._event_bus:
+            # Fanout so every worker drops its own cached copy
+            self._event_bus.subscribe(
+                CatalogChangedEvent,
+                self._handle_catalog_changed,
+                priority=EventPriority.LOW,
+                fanout=True
+            )
+    
+    def _handle_catalog_changed(self, event: CatalogChangedEvent):
+        """Drop cached catalog entries showing the products' old data, stock and price"""
+        self._catalog_cache.invalidate_products_after_commit(self._db_session, event.product_ids)
+    
+    def configure_catalog_cache(self, backend: Optional[CacheBackend], ttl: float):
+        """Put the given cache backend in front of product reads (None disables caching)"""
+        self._catalog_cache.configure(backend, ttl)
+    
+    def get_catalog_cache_stats(self) -> Dict[str, Any]:
+        """Hit, miss and eviction counters of the catalog cache"""
+        return self._catalog_cache.stats()
+        
     
     def create_product(self, command: CreateProductCommand):
         """Create a new product with inventory"""
@@ -141,7 +171,10 @@ class ProductService:
                 page=page,
                 items_per_page=page_size,
                 sort_by=search_filters.get('sort_by', 'name'),
-                sort_direction=search_filters.get('sort_direction', 'asc')
+                sort_direction=search_filters.get('sort_direction', 'asc'),
+                cursor=search_filters.get('cursor'),
+                use_cursor=search_filters.get('use_cursor', False),
+                include_total=search_filters.get('include_total', True)
             )
             
             result = self._query_service.search(query)
@@ -159,47 +192,49 @@ class ProductService:
             products_data: List of product data dictionaries
             
         Returns:
-            Dictionary with created products and any errors
+            Dictionary with created product IDs and any errors
         """
         logger.info(f"Creating {len(products_data)} products in bulk")
         
-        created_products = []
-        errors = []
+        report = ImportProductsUseCase(self._uow, self._catalog_cache).execute(
+            (ImportRow(i + 1, data=product_data) for i, product_data in enumerate(products_data)),
+            collect_created=True
+        )
         
-        try:
-            for i, product_data in enumerate(products_data):
-                try:
-                    command = CreateProductCommand(**product_data)
-                    result = self._create_product_use_case.execute(command)
-                    created_products.append(result)
-                    logger.info(f"Bulk product {i+1} created successfully: {result.id}")
-                except Exception as e:
-                    error_info = {
-                        "index": i,
-                        "product_data": product_data,
-                        "error": str(e)
-                    }
-                    errors.append(error_info)
-                    logger.error(f"Failed to create bulk product {i+1}: {str(e)}")
-            
-            # Commit all successful operations
-            if created_products:
-                self._uow.commit()
-            
-            result = {
-                "created": created_products,
-                "errors": errors,
-                "total_attempted": len(products_data),
-                "total_created": len(created_products),
-                "total_errors": len(errors)
-            }
-            
-            logger.info(f"Bulk creation completed: {len(created_products)} created, {len(errors)} errors")
-            return result
+        result = {
+            "created": report.created,
+            "errors": [
+                {"index": error.row - 1, "product_data": products_data[error.row - 1], "error": error.error}
+                for error in report.errors
+            ],
+            "total_attempted": report.total_rows,
+            "total_created": report.total_created,
+            "total_errors": report.total_errors
+        }
+        
+        logger.info(f"Bulk creation completed: {report.total_created} created, {report.total_errors} errors")
+        return result
+
+    def import_products(self, stream: BinaryIO, fmt: str, chunk_size: int = 500, max_errors: int = 1000) -> ImportProductsReportDTO:
+        """
+        Import a product catalog from a CSV or JSON Lines stream.
+        
+        Args:
+            stream: Binary stream of the uploaded file, read lazily
+            fmt: 'csv' or 'jsonl'
+            chunk_size: Rows inserted and committed per transaction
+            max_errors: Maximum number of row errors listed in the report
             
+        Returns:
+            Report with row, created and error counts and the per-row errors
+        """
+        logger.info(f"Importing products from {fmt} in chunks of {chunk_size}")
+        try:
+            use_case = ImportProductsUseCase(self._uow, self._catalog_cache, chunk_size, max_errors)
+            return use_case.execute(read_product_rows(stream, fmt))
         except Exception as e:
             self._uow.rollback()
-            logger.error(f"Bulk product creation failed: {str(e)}")
+            logger.error(f"Product import failed: {str(e)}", exc_info=True)
             raise
 
     def get_low_stock_products(self, threshold_percentage: float = 100, page: int = 1, page_size: int = 20):
@@ -12,6 +12,11 @@ from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
     StockCheckResponseContract
 )
+from app.shared.contracts.inventory.stock_reservation import (
+    StockReservationItemContract,
+    StockReservationRequestContract,
+    StockReservationResponseContract
+)
 from app.shared.contracts.product.product_contract import (
     GetProductRequestContract,
     GetProductsRequestContract,
@@ -36,6 +41,19 @@ class StockCheckTranslator():
     def to_response_format(self, response ) -> StockCheckResponseContract:
         return response
 
+class StockReservationTranslator():
+    def to_service_format(self, data: Dict[str, Any]) -> StockReservationRequestContract:
+        return StockReservationRequestContract(
+            order_id=data.get('order_id'),
+            items=[StockReservationItemContract(
+                product_id=item.get('product_id'),
+                quantity=item.get('quantity')
+            ) for item in data.get('items', [])]
+        )
+
+    def to_response_format(self, response) -> StockReservationResponseContract:
+        return response
+
 class GetInventoryTranslator():
     def to_service_format(self, request: GetInventoryByIdRequest) -> Dict[str,Any]:
 
@@ -106,6 +124,7 @@ class TranslatorFactory:
     def __init__(self):
         self.translators = {
             "STOCK_CHECK": StockCheckTranslator(),
+            "RESERVE_STOCK": StockReservationTranslator(),
             "GET_PRODUCT": GetProductTranslator(),
             "GET_PRODUCTS": GetProductsTranslator(),
             "SEARCH_PRODUCTS": SearchProductsTranslator(),
@@ -0,0 +1,145 @@
+"""Concurrent, priority-aware delivery of events to their handlers."""
+import itertools
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Matches EventPriority values; kept numeric to avoid importing event_bus here
+_LOW = 0
+_CRITICAL = 3
+
+
+class _Job:
+    """One published event and the handlers still running for it."""
+
+    def __init__(self, event: Any, handlers: List[Callable]):
+        self.event = event
+        self.handlers = handlers
+        self.done = threading.Event()
+        self._remaining = len(handlers)
+        self._lock = threading.Lock()
+        if not handlers:
+            self.done.set()
+
+    def handler_finished(self) -> None:
+        with self._lock:
+            self._remaining -= 1
+            finished = self._remaining == 0
+        if finished:
+            self.done.set()
+
+
+class ConcurrentDispatcher:
+    """
+    Runs the handlers of an event concurrently on a bounded thread pool.
+
+    Events wait in a backlog ordered by priority (HIGH before NORMAL before
+    LOW, first-in first-out within a priority), which is fed to the pool only
+    as fast as workers free up. CRITICAL events skip the backlog and go
+    straight to the pool, ahead of anything still waiting there.
+
+    Publishers of LOW events return as soon as the event is queued; other
+    publishers wait until every handler has finished. Each handler runs in
+    its own ``handler_scope`` (e.g. an app context with its own transaction)
+    and a failing handler never affects the others.
+    """
+
+    def __init__(
+        self,
+        run_handler: Callable[[Callable, Any], None],
+        on_error: Callable[[Exception, Any], None],
+        max_workers: int = 4,
+        backlog_size: int = 1000,
+        handler_scope: Optional[Callable[[], ContextManager]] = None
+    ):
+        self._run_handler = run_handler
+        self._on_error = on_error
+        self._handler_scope = handler_scope or nullcontext
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="event-handler")
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._backlog: queue.PriorityQueue = queue.PriorityQueue(maxsize=backlog_size)
+        self._sequence = itertools.count()
+        self._local = threading.local()
+        self._feeder = threading.Thread(target=self._drain_backlog, name="event-backlog", daemon=True)
+        self._feeder.start()
+
+    def dispatch(self, event: Any, handlers: List[Callable], priority: int) -> None:
+        """
+        Deliver an event to its handlers.
+
+        Args:
+            event: The event
+            handlers: Handlers in priority order
+            priority: EventPriority value of the event
+        """
+        if not handlers:
+            return
+
+        # A handler publishing another event must not wait on the pool it
+        # is occupying, so nested events run inline
+        if getattr(self._local, "in_handler", False):
+            for handler in handlers:
+                self._run(handler, event)
+            return
+
+        if priority >= _CRITICAL:
+            wait([self._executor.submit(self._run, handler, event) for handler in handlers])
+            return
+
+        job = _Job(event, handlers)
+        entry = (-priority, next(self._sequence), job)
+
+        if priority <= _LOW:
+            try:
+                self._backlog.put_nowait(entry)
+            except queue.Full:
+                logger.warning(f"Event backlog full, delivering {type(event).__name__} inline")
+                for handler in handlers:
+                    self._run(handler, event)
+            return
+
+        self._backlog.put(entry)
+        job.done.wait()
+
+    def backlog_size(self) -> int:
+        """Number of events waiting for a free worker."""
+        return self._backlog.qsize()
+
+    def shutdown(self, wait_for_handlers: bool = True) -> None:
+        """Stop feeding the pool and shut it down."""
+        self._backlog.put((float("inf"), next(self._sequence), None))
+        self._feeder.join()
+        self._executor.shutdown(wait=wait_for_handlers)
+
+    def _drain_backlog(self) -> None:
+        while True:
+            _, _, job = self._backlog.get()
+            if job is None:
+                return
+            for handler in job.handlers:
+                # Only hand work to the pool when a worker is free, so that
+                # waiting events stay in the priority-ordered backlog
+                self._slots.acquire()
+                future = self._executor.submit(self._run, handler, job.event)
+                future.add_done_callback(lambda _, job=job: self._release(job))
+
+    def _release(self, job: _Job) -> None:
+        self._slots.release()
+        job.handler_finished()
+
+    def _run(self, handler: Callable, event: Any) -> None:
+        nested = getattr(self._local, "in_handler", False)
+        self._local.in_handler = True
+        try:
+            with self._handler_scope():
+                self._run_handler(handler, event)
+        except Exception as e:
+            logger.error(f"Handler {getattr(handler, '__qualname__', handler)} failed for {type(event).__name__}: {str(e)}")
+            self._on_error(e, event)
+        finally:
+            self._local.in_handler = nested
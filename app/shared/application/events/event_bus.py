@@ -1,11 +1,18 @@
 """Event bus implementation."""
-from typing import Dict, List, Type, Callable, Any, Optional
+import logging
+import threading
+import time
+from typing import Dict, List, Type, Callable, Any, Optional, ContextManager, Tuple, Set, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from uuid import uuid4
 from enum import Enum
 from sqlalchemy.orm import Session
 
+from app.shared.application.events.concurrent_dispatcher import ConcurrentDispatcher
+
+logger = logging.getLogger(__name__)
+
 class EventPriority(Enum):
     """Event priority levels"""
     LOW = 0
@@ -26,6 +33,43 @@ class EventMetadata:
     source: str = ""
     user_id: Optional[int] = None
 
+    def to_headers(self) -> Dict[str, str]:
+        """String fields carried next to a serialized event by a message transport"""
+        return {
+            'event_id': self.event_id,
+            'event_type': self.event_type,
+            'timestamp': self.timestamp.isoformat(),
+            'correlation_id': self.correlation_id or '',
+            'causation_id': self.causation_id or '',
+            'version': self.version,
+            'priority': str(self.priority.value),
+            'source': self.source,
+            'user_id': '' if self.user_id is None else str(self.user_id)
+        }
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> 'EventMetadata':
+        """Rebuild metadata written by to_headers()"""
+        return cls(
+            event_id=headers['event_id'],
+            event_type=headers.get('event_type', ''),
+            timestamp=datetime.fromisoformat(headers['timestamp']),
+            correlation_id=headers.get('correlation_id') or None,
+            causation_id=headers.get('causation_id') or None,
+            version=headers.get('version', '1.0'),
+            priority=EventPriority(int(headers.get('priority', EventPriority.NORMAL.value))),
+            source=headers.get('source', ''),
+            user_id=int(headers['user_id']) if headers.get('user_id') else None
+        )
+
+    @classmethod
+    def for_event(cls, event: Any) -> 'EventMetadata':
+        """The event's own metadata, or fresh metadata for events that carry none"""
+        metadata = getattr(event, 'metadata', None)
+        if isinstance(metadata, cls):
+            return metadata
+        return cls(event_type=type(event).__name__)
+
 @dataclass
 class Event:
     """Base event class"""
@@ -55,16 +99,83 @@ class EventBus:
     
     def __init__(self):
         if not self._initialized:
+            # Handlers per event type, highest subscription priority first
             self._handlers: Dict[Type[Event], List[Callable]] = {}
+            self._priorities: Dict[Tuple[Type[Event], Callable], EventPriority] = {}
+            # Handlers that run in every worker rather than once per event
+            self._fanout: Set[Tuple[Type[Event], Callable]] = set()
+            self._handler_stats: Dict[str, Dict[str, float]] = {}
+            self._stats_lock = threading.Lock()
+            self._handler_observers: List[Callable[[str, float, bool], None]] = []
+            self._concurrent: Optional[ConcurrentDispatcher] = None
             self._error_handlers: List[Callable] = []
             self._middlewares: List[Callable] = []
             self._event_history: List[Dict] = []
+            self._outbox = None
+            self._transport = None
             self._initialized = True
     
     def init(self):
         """Initialize event bus."""
         pass
     
+    def set_outbox(self, outbox: Optional[Any]) -> None:
+        """
+        Route published events through a transactional outbox.
+        
+        The outbox must expose ``add(event) -> bool``; it stores the event in
+        the publisher's transaction and a dispatcher delivers it later via
+        dispatch(). Pass None to go back to delivering events inline.
+        """
+        self._outbox = outbox
+    
+    def set_transport(self, transport: Optional[Any]) -> None:
+        """
+        Carry published events to the other workers and hosts.
+        
+        The transport must expose ``send(event, shared) -> bool``. Events
+        sent with ``shared`` run their ordinary handlers in exactly one
+        worker (see deliver()), so the publisher skips them; fanout handlers
+        run in the publisher and in every other worker. send() returns False
+        for events it cannot carry, which are then handled locally. Pass
+        None to keep events inside this process.
+        """
+        self._transport = transport
+    
+    def configure_dispatch(
+        self,
+        concurrent: bool = True,
+        max_workers: int = 4,
+        backlog_size: int = 1000,
+        handler_scope: Optional[Callable[[], ContextManager]] = None
+    ) -> None:
+        """
+        Switch inline delivery between serial and concurrent dispatch.
+        
+        In concurrent mode the handlers of an event run in parallel on a
+        bounded thread pool, each isolated from the others' failures and
+        inside its own ``handler_scope``; events queue by priority and
+        CRITICAL events bypass the queue (see ConcurrentDispatcher).
+        
+        Args:
+            concurrent: False restores serial dispatch in the caller's thread
+            max_workers: Size of the handler thread pool
+            backlog_size: Number of events that may wait for a free worker
+            handler_scope: Factory for the context each handler runs in
+        """
+        if self._concurrent is not None:
+            self._concurrent.shutdown()
+            self._concurrent = None
+        
+        if concurrent:
+            self._concurrent = ConcurrentDispatcher(
+                run_handler=self._run_handler,
+                on_error=lambda error, event: self._handle_error(error, event, None),
+                max_workers=max_workers,
+                backlog_size=backlog_size,
+                handler_scope=handler_scope
+            )
+    
     def publish(self, event: Event, context: Optional[EventHandlerContext] = None) -> None:
         """Publish an event."""
         
@@ -75,6 +186,12 @@ class EventBus:
         for middleware in self._middlewares:
             middleware(event, context)
         
+        # Defer delivery to the outbox dispatcher when one is configured;
+        # events nobody subscribes to are not worth a row
+        if self._outbox is not None and self.has_subscribers(type(event)):
+            if self._outbox.add(event):
+                return
+        
         # Record event in history
         # self._event_history.append({
         #     'event_id': event.metadata.event_id,
@@ -91,18 +208,99 @@ class EventBus:
         # Handle event
         event_type = type(event)
         if event_type in self._handlers:
-            try:
-                for handler in self._handlers[event_type]:
+            handlers = list(self._handlers[event_type])
+            if self._transport is not None:
+                handlers = self._send_to_transport(event, handlers)
+            if self._concurrent is not None:
+                self._concurrent.dispatch(event, handlers, self._event_priority(event).value)
+                return
+            # A failing handler must not keep the remaining ones from running
+            for handler in handlers:
+                try:
                     # handler(event, context)
-                    handler(event)
-            except Exception as e:
-                self._handle_error(e, event, context)
+                    self._run_handler(handler, event)
+                except Exception as e:
+                    self._handle_error(e, event, context)
     
-    def subscribe(self, event_type: Type[Event], handler: Callable, priority: EventPriority = EventPriority.NORMAL) -> None:
-        """Subscribe to an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+    def dispatch(self, event: Any) -> None:
+        """
+        Run the subscribers of an event now.
+        
+        Unlike publish(), handler errors are raised to the caller so that the
+        outbox dispatcher can retry the event.
+        """
+        for handler in list(self._handlers.get(type(event), [])):
+            self._run_handler(handler, event)
+        # Fanout handlers of the other workers still have to see the event
+        if self._transport is not None and self._fanout_handlers(type(event)):
+            self._transport.send(event, shared=False)
+    
+    def deliver(self, event: Any, fanout: bool) -> None:
+        """
+        Run the handlers of an event received from the transport.
+        
+        Args:
+            event: The event
+            fanout: True to run only the fanout handlers (every worker gets
+                the event), False to run only the others (one worker gets it)
+        
+        Errors are raised to the caller so that the event can be redelivered.
+        """
+        event_type = type(event)
+        fanout_handlers = self._fanout_handlers(event_type)
+        for handler in list(self._handlers.get(event_type, [])):
+            if (handler in fanout_handlers) == fanout:
+                self._run_handler(handler, event)
+    
+    def has_subscribers(self, event_type: Type[Event]) -> bool:
+        """Whether any handler is subscribed to the event type."""
+        return bool(self._handlers.get(event_type))
+    
+    def subscribe(
+        self,
+        event_type: Type[Event],
+        handler: Callable,
+        priority: EventPriority = EventPriority.NORMAL,
+        fanout: bool = False
+    ) -> None:
+        """
+        Subscribe to an event type.
+        
+        With a transport set, ordinary handlers run once per event in some
+        worker, while ``fanout`` handlers run in every worker; use it for
+        per-process state such as local caches.
+        """
+        handlers = self._handlers.setdefault(event_type, [])
+        # A bound method of a rebuilt service is a new object, so handlers
+        # are matched by (class, function): the new instance's handler
+        # takes the old one's place and an event is never dispatched twice
+        key = self._registration_key(handler)
+        index = next((i for i, h in enumerate(handlers) if self._registration_key(h) == key), None)
+        if index is None:
+            handlers.append(handler)
+        else:
+            replaced = handlers[index]
+            handlers[index] = handler
+            self._priorities.pop((event_type, replaced), None)
+            self._fanout.discard((event_type, replaced))
+        self._priorities[(event_type, handler)] = priority
+        if fanout:
+            self._fanout.add((event_type, handler))
+        else:
+            self._fanout.discard((event_type, handler))
+        # Stable sort: equal priorities keep their subscription order
+        handlers.sort(key=lambda h: self._priorities[(event_type, h)].value, reverse=True)
+
+    def unsubscribe(self, event_type: Type[Event], handler: Callable) -> None:
+        """Remove a handler subscribed to an event type, matched as in subscribe."""
+        handlers = self._handlers.get(event_type, [])
+        key = self._registration_key(handler)
+        for subscribed in [h for h in handlers if self._registration_key(h) == key]:
+            handlers.remove(subscribed)
+            self._priorities.pop((event_type, subscribed), None)
+            self._fanout.discard((event_type, subscribed))
+        if not handlers:
+            self._handlers.pop(event_type, None)
     
     def subscribe_error(self, handler: Callable) -> None:
         """Subscribe to error events."""
@@ -143,6 +341,70 @@ class EventBus:
         """Clear event history."""
         self._event_history.clear()
     
+    def get_handler_stats(self) -> Dict[str, Dict[str, float]]:
+        """Calls, errors and wall-clock time (ms) per handler."""
+        with self._stats_lock:
+            return {name: dict(stats) for name, stats in self._handler_stats.items()}
+    
+    def add_handler_observer(self, observer: Callable[[str, float, bool], None]) -> None:
+        """Call ``observer(handler_name, elapsed_seconds, failed)`` after every handler run."""
+        self._handler_observers.append(observer)
+    
+    def _run_handler(self, handler: Callable, event: Any) -> None:
+        """Run one handler, recording its wall-clock time and outcome."""
+        started = time.perf_counter()
+        failed = False
+        try:
+            handler(event)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            name = getattr(handler, '__qualname__', repr(handler))
+            with self._stats_lock:
+                stats = self._handler_stats.setdefault(
+                    name, {'calls': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+                )
+                stats['calls'] += 1
+                stats['errors'] += int(failed)
+                stats['total_ms'] += elapsed_ms
+                stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            for observer in self._handler_observers:
+                try:
+                    observer(name, elapsed_ms / 1000, failed)
+                except Exception as e:
+                    logger.warning(f"Handler observer failed: {str(e)}")
+            logger.debug(f"Handler {name} took {elapsed_ms:.1f} ms for {type(event).__name__}")
+    
+    @staticmethod
+    def _registration_key(handler: Callable) -> Any:
+        """(class, function) for bound methods, the handler itself otherwise"""
+        owner = getattr(handler, '__self__', None)
+        function = getattr(handler, '__func__', None)
+        if owner is None or function is None:
+            return handler
+        return (type(owner), function)
+    
+    def _fanout_handlers(self, event_type: Type[Event]) -> List[Callable]:
+        return [handler for handler in self._handlers.get(event_type, []) if (event_type, handler) in self._fanout]
+    
+    def _send_to_transport(self, event: Any, handlers: List[Callable]) -> List[Callable]:
+        """Hand the event to the transport and return the handlers still to run here"""
+        fanout_handlers = self._fanout_handlers(type(event))
+        shared = len(fanout_handlers) < len(handlers)
+        if not self._transport.send(event, shared=shared):
+            return handlers
+        # Shared handlers now run in whichever worker reads the event
+        return fanout_handlers if shared else handlers
+    
+    @staticmethod
+    def _event_priority(event: Any) -> EventPriority:
+        """Priority from the event's metadata, NORMAL when it has none."""
+        metadata = getattr(event, 'metadata', None)
+        priority = getattr(metadata, 'priority', None)
+        return priority if isinstance(priority, EventPriority) else EventPriority.NORMAL
+    
     def _handle_error(self, error: Exception, event: Event, context: Optional[EventHandlerContext]) -> None:
         """Handle error in event processing."""
         if context:
@@ -0,0 +1,30 @@
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class StockReservationItemContract(BaseModel):
+    product_id: UUID
+    quantity: int
+
+
+class StockReservationRequestContract(BaseModel):
+    """Contract for taking stock for every line of an order at once"""
+    order_id: Optional[UUID] = None
+    items: List[StockReservationItemContract] = []
+
+
+class StockShortageContract(BaseModel):
+    product_id: UUID
+    requested_quantity: int
+    # None when the product has no inventory record
+    available_quantity: Optional[int] = None
+
+
+class StockReservationResponseContract(BaseModel):
+    """Contract for a stock reservation response; nothing is reserved unless success is True"""
+    success: bool
+    message: str
+    reserved_items: List[StockReservationItemContract] = []
+    shortages: List[StockShortageContract] = []
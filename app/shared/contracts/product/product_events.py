@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -47,4 +47,14 @@ class ProductStatusChangedEvent(BaseModel):
     name: str
     old_status: str
     new_status: str
-    timestamp: str 
\ No newline at end of file
+    timestamp: str 
+
+class CatalogChangedEvent(BaseModel):
+    """
+    Event contract for writes that change what the product catalog shows.
+
+    Published by the product and inventory services whenever a product or
+    its stock, price or expiry changes. ``product_ids`` lists the products
+    whose detail entries are stale; every cached listing is stale either way.
+    """
+    product_ids: List[UUID] = Field(default_factory=list)
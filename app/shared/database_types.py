@@ -3,18 +3,67 @@ Database-compatible types for cross-database support.
 
 This module provides custom SQLAlchemy types that work across different
 database backends, particularly for UUID support in SQLite.
+
+On SQLite, UUIDs are stored either as 36-character text (the default) or
+as 16-byte blobs, selected once per process with configure_uuid_storage()
+(SQLITE_UUID_STORAGE) before the first query. Binary storage makes every
+UUID key and index less than half the size. Existing databases are
+converted with ``flask convert-uuid-storage``.
 """
 
 import uuid
-from sqlalchemy import TypeDecorator, String
+from sqlalchemy import LargeBinary, String, TypeDecorator, cast
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+UUID_STORAGE_MODES = ('text', 'binary')
+
+_sqlite_storage = 'text'
+
+
+def configure_uuid_storage(mode: str) -> None:
+    """
+    Select how UUIDs are stored on SQLite: 'text' or 'binary'.
+
+    Must be called before the engine runs its first query; the storage is
+    resolved once per dialect and cached.
+    """
+    global _sqlite_storage
+    if mode not in UUID_STORAGE_MODES:
+        raise ValueError(f"Unknown UUID storage '{mode}', expected one of: {', '.join(UUID_STORAGE_MODES)}")
+    _sqlite_storage = mode
+
+
+def uuid_storage() -> str:
+    return _sqlite_storage
+
+
+def uuid_to_bytes(value) -> bytes:
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if isinstance(value, bytes):
+        return value
+    return uuid.UUID(str(value)).bytes
+
+
+def _uuid_to_text(value) -> str:
+    return str(value)
+
+
+def _uuid_from_bytes(value) -> uuid.UUID:
+    return uuid.UUID(bytes=value)
+
+
+def _uuid_from_text(value) -> uuid.UUID:
+    return uuid.UUID(value) if isinstance(value, str) else value
 
 
 class UUID(TypeDecorator):
     """
     A UUID type that works with both SQLite and PostgreSQL.
-    
-    For SQLite: Stores UUIDs as strings (VARCHAR)
+
+    For SQLite: Stores UUIDs as strings (VARCHAR) or 16-byte BLOBs
     For PostgreSQL: Uses native UUID type
     """
     impl = String
@@ -28,33 +77,80 @@ class UUID(TypeDecorator):
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
             return dialect.type_descriptor(PostgresUUID(as_uuid=True))
+        elif _sqlite_storage == 'binary':
+            return dialect.type_descriptor(LargeBinary(16))
         else:
             # For SQLite and other databases, use String
             return dialect.type_descriptor(String(36))
 
+    # The processors are picked once per dialect rather than branching on
+    # the dialect and storage for every value
+
+    def bind_processor(self, dialect):
+        if dialect.name == 'postgresql':
+            return None
+        if _sqlite_storage == 'binary':
+            return _none_safe(uuid_to_bytes)
+        return _none_safe(_uuid_to_text)
+
+    def result_processor(self, dialect, coltype):
+        if dialect.name == 'postgresql':
+            return None
+        if _sqlite_storage == 'binary':
+            return _none_safe(_uuid_from_bytes)
+        return _none_safe(_uuid_from_text)
+
     def process_bind_param(self, value, dialect):
-        if value is None:
-            return value
-        elif dialect.name == 'postgresql':
+        # Only used to render literals; binds go through bind_processor
+        if value is None or dialect.name == 'postgresql':
             return value
-        else:
-            # For SQLite, convert UUID to string
-            if isinstance(value, uuid.UUID):
-                return str(value)
-            return str(value)
+        if _sqlite_storage == 'binary':
+            return uuid_to_bytes(value)
+        return str(value)
 
     def process_result_value(self, value, dialect):
-        if value is None:
-            return value
-        elif dialect.name == 'postgresql':
-            return value
-        else:
-            # For SQLite, convert string back to UUID
-            if isinstance(value, str):
-                return uuid.UUID(value)
+        if value is None or dialect.name == 'postgresql':
             return value
+        if isinstance(value, bytes):
+            return _uuid_from_bytes(value)
+        return _uuid_from_text(value)
 
     @staticmethod
     def as_uuid():
         """Return a UUID type configured to use UUID objects"""
-        return UUID(as_uuid=True)
\ No newline at end of file
+        return UUID(as_uuid=True)
+
+
+def _none_safe(convert):
+    def process(value):
+        return None if value is None else convert(value)
+    return process
+
+
+class uuid_text(FunctionElement):
+    """
+    A UUID column as its canonical 36-character text, for LIKE searches.
+
+    Comparing the column itself with a LIKE pattern binds the pattern as a
+    UUID, which fails for binary storage and on PostgreSQL's native type.
+    """
+    type = String()
+    name = 'uuid_text'
+    inherit_cache = True
+
+
+@compiles(uuid_text)
+def _compile_uuid_text(element, compiler, **kw):
+    column, = element.clauses
+    return compiler.process(cast(column, String), **kw)
+
+
+@compiles(uuid_text, 'sqlite')
+def _compile_uuid_text_sqlite(element, compiler, **kw):
+    column, = element.clauses
+    sql = compiler.process(column, **kw)
+    if _sqlite_storage != 'binary':
+        return sql
+    hex_sql = f"lower(hex({sql}))"
+    parts = [(1, 8), (9, 4), (13, 4), (17, 4), (21, 12)]
+    return " || '-' || ".join(f"substr({hex_sql}, {start}, {length})" for start, length in parts)
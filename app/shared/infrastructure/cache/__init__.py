@@ -0,0 +1,4 @@
+from app.shared.infrastructure.cache.backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.shared.infrastructure.cache.fake_redis import FakeRedis
+from app.shared.infrastructure.cache.catalog_cache import CatalogCache, build_cache_backend
+__all__ = ['CacheBackend', 'InMemoryCacheBackend', 'RedisCacheBackend', 'FakeRedis', 'CatalogCache', 'build_cache_backend']
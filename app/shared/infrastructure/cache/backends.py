@@ -0,0 +1,187 @@
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """
+    Key/value store behind CatalogCache.
+
+    Values are only ever written by this process's own code, never parsed
+    from requests. ``get`` returns None for a missing or expired key, so
+    None itself cannot be cached.
+    """
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """Atomically increment a counter that never expires and return it."""
+        raise NotImplementedError
+
+    def get_counter(self, key: str) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters (and the entry count where known)."""
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Per-process LRU cache with a time-to-live on every entry.
+
+    Cached objects are returned as-is, not copied, so callers must treat
+    them as read-only. Each gunicorn worker has its own copy, so writes made
+    through one worker only reach the others when their entries expire.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max(max_entries, 1)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries)
+            }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by every worker through Redis.
+
+    Values are pickled, and expiry is left to Redis (``SET ... EX``). Redis
+    errors are logged and treated as misses, so an unavailable Redis slows
+    the catalog down to its uncached speed instead of failing requests.
+    Hits and misses are counted per process; evictions come from the
+    server's own ``evicted_keys`` statistic.
+    """
+
+    name = "redis"
+
+    def __init__(self, client, prefix: str = "catalog:"):
+        self._client = client
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "catalog:") -> 'RedisCacheBackend':
+        import redis
+
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5), prefix=prefix)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self._prefix + key)
+        except Exception as e:
+            logger.warning(f"Catalog cache read failed: {str(e)}")
+            raw = None
+
+        value = pickle.loads(raw) if raw is not None else None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            self._client.set(self._prefix + key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=max(int(ttl), 1))
+        except Exception as e:
+            logger.warning(f"Catalog cache write failed: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(self._prefix + key)
+        except Exception as e:
+            logger.warning(f"Catalog cache delete failed: {str(e)}")
+
+    def incr(self, key: str) -> int:
+        try:
+            return int(self._client.incr(self._prefix + key))
+        except Exception as e:
+            logger.warning(f"Catalog cache counter update failed: {str(e)}")
+            return 0
+
+    def get_counter(self, key: str) -> int:
+        try:
+            raw = self._client.get(self._prefix + key)
+        except Exception as e:
+            logger.warning(f"Catalog cache counter read failed: {str(e)}")
+            return 0
+        return int(raw) if raw is not None else 0
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            evictions = int(self._client.info("stats").get("evicted_keys", 0))
+        except Exception:
+            evictions = 0
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": evictions
+            }
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import event as sa_event
+
+from app.shared.infrastructure.cache.backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.shared.infrastructure.cache.fake_redis import FakeRedis
+
+logger = logging.getLogger(__name__)
+
+# Bumped on every catalog write; listing keys embed it, so one increment
+# retires every cached page at once without scanning for keys
+_LISTING_GENERATION_KEY = "listings:generation"
+
+
+class CatalogCache:
+    """
+    Read-through cache for product detail, list and search results.
+
+    Product details are cached per product ID and dropped individually.
+    List and search pages depend on many products, so their keys carry a
+    generation number and any write invalidates all of them by bumping it.
+    Without a backend the cache is disabled and every read goes straight
+    to the loader.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 60.0):
+        self._backend = backend
+        self._ttl = ttl
+
+    def configure(self, backend: Optional[CacheBackend], ttl: float) -> None:
+        """Swap the backend, e.g. once the application config is known."""
+        self._backend = backend
+        self._ttl = ttl
+        logger.info(f"Catalog cache backend: {backend.name if backend else 'disabled'} (ttl {ttl}s)")
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend is not None
+
+    def get_product(self, product_id: Any, loader: Callable[[], Any]) -> Any:
+        """Return the cached product detail, loading and storing it on a miss."""
+        if self._backend is None:
+            return loader()
+        return self._read_through(self._product_key(product_id), loader)
+
+    def get_listing(self, kind: str, query: BaseModel, loader: Callable[[], Any]) -> Any:
+        """
+        Return a cached list or search page, loading and storing it on a miss.
+
+        Args:
+            kind: Listing name, keeps list and search results apart
+            query: Filter query; its field values make up the key
+            loader: Computes the page on a miss
+        """
+        if self._backend is None:
+            return loader()
+        generation = self._backend.get_counter(_LISTING_GENERATION_KEY)
+        fingerprint = hashlib.sha1(
+            json.dumps(query.model_dump(mode="json"), sort_keys=True).encode()
+        ).hexdigest()
+        return self._read_through(f"{kind}:{generation}:{fingerprint}", loader)
+
+    def invalidate_product(self, product_id: Any) -> None:
+        """Drop a product's detail entry and every cached listing."""
+        if self._backend is None:
+            return
+        self._backend.delete(self._product_key(product_id))
+        self.invalidate_listings()
+
+    def invalidate_listings(self) -> None:
+        if self._backend is None:
+            return
+        self._backend.incr(_LISTING_GENERATION_KEY)
+
+    def invalidate_products(self, product_ids: Iterable[Any]) -> None:
+        """Drop the detail entries of several products and every cached listing."""
+        if self._backend is None:
+            return
+        for product_id in product_ids:
+            self._backend.delete(self._product_key(product_id))
+        self.invalidate_listings()
+
+    def invalidate_product_after_commit(self, session, product_id: Any) -> None:
+        self.invalidate_products_after_commit(session, [product_id])
+
+    def invalidate_products_after_commit(self, session, product_ids: Iterable[Any]) -> None:
+        """
+        Invalidate now and again once the session's transaction commits.
+
+        The second pass drops anything a concurrent reader cached from the
+        pre-commit state in between. With no product IDs only the listings
+        are invalidated.
+        """
+        if self._backend is None:
+            return
+        product_ids = list(product_ids)
+        self.invalidate_products(product_ids)
+        # Resolve a scoped_session proxy to the Session it currently stands for
+        target = session() if callable(session) else session
+        sa_event.listen(target, "after_commit", lambda _: self.invalidate_products(product_ids), once=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and eviction counters of the current backend."""
+        if self._backend is None:
+            return {"backend": "disabled", "hits": 0, "misses": 0, "evictions": 0}
+        return {"backend": self._backend.name, **self._backend.stats()}
+
+    def _read_through(self, key: str, loader: Callable[[], Any]) -> Any:
+        value = self._backend.get(key)
+        if value is not None:
+            return value
+        value = loader()
+        # Not-found results are not cached, so a product created later shows up
+        if value is not None:
+            self._backend.set(key, value, self._ttl)
+        return value
+
+    @staticmethod
+    def _product_key(product_id: Any) -> str:
+        return f"product:{product_id}"
+
+
+def build_cache_backend(config: Mapping[str, Any]) -> Optional[CacheBackend]:
+    """
+    Create the backend selected by CATALOG_CACHE_BACKEND.
+
+    'memory' is a per-process LRU, 'redis' shares entries through REDIS_URL,
+    'fakeredis' runs the Redis code path against an in-process fake and
+    'none' disables caching. 'auto' picks 'memory' when an event transport
+    carries invalidations to the other workers (EVENT_BUS_TRANSPORT is not
+    'inprocess') and 'none' otherwise, since a worker's LRU would keep
+    serving products another worker changed.
+    """
+    backend = (config.get('CATALOG_CACHE_BACKEND') or 'none').lower()
+    if backend == 'auto':
+        relayed = config.get('EVENT_BUS_TRANSPORT', 'inprocess') != 'inprocess'
+        backend = 'memory' if relayed else 'none'
+
+    if backend == 'memory':
+        return InMemoryCacheBackend(max_entries=config.get('CATALOG_CACHE_MAX_ENTRIES', 1024))
+    if backend == 'redis':
+        return RedisCacheBackend.from_url(config['REDIS_URL'])
+    if backend == 'fakeredis':
+        return RedisCacheBackend(FakeRedis())
+    if backend == 'none':
+        return None
+
+    raise ValueError(f"Unknown CATALOG_CACHE_BACKEND: {backend}")
@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class FakeRedis:
+    """
+    In-process stand-in for the subset of the redis client used by
+    RedisCacheBackend (get, set with ``ex``, delete, incr, info).
+
+    Lets tests and local runs use the Redis backend code path without a
+    Redis server (CATALOG_CACHE_BACKEND=fakeredis).
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        if not isinstance(value, bytes):
+            value = str(value).encode()
+        with self._lock:
+            self._data[key] = (time.monotonic() + ex if ex else None, value)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            _, raw = self._data.get(key, (None, b"0"))
+            value = int(raw) + 1
+            self._data[key] = (None, str(value).encode())
+            return value
+
+    def info(self, section: Optional[str] = None) -> Dict[str, Any]:
+        return {"evicted_keys": 0}
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+        return True
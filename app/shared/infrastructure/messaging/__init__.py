@@ -0,0 +1,5 @@
+from app.shared.infrastructure.messaging.transport import EventTransport, TransportMessage
+from app.shared.infrastructure.messaging.redis_streams import RedisStreamTransport
+from app.shared.infrastructure.messaging.sqlite_broker import SQLiteBrokerTransport
+from app.shared.infrastructure.messaging.relay import EventRelay, build_event_transport
+__all__ = ['EventTransport', 'TransportMessage', 'RedisStreamTransport', 'SQLiteBrokerTransport', 'EventRelay', 'build_event_transport']
@@ -0,0 +1,93 @@
+import logging
+from typing import Dict, List
+
+from app.shared.infrastructure.messaging.transport import EventTransport, TransportMessage
+
+logger = logging.getLogger(__name__)
+
+
+class RedisStreamTransport(EventTransport):
+    """
+    Event stream on a Redis Stream shared by every worker and host.
+
+    Consumer groups, pending entries and claiming map directly onto
+    XREADGROUP, XACK and XAUTOCLAIM. The stream is capped at roughly
+    ``maxlen`` messages on every publish (``XADD MAXLEN ~``).
+    """
+
+    name = "redis"
+
+    def __init__(self, client, stream: str = "pharmacy:events", maxlen: int = 100000):
+        self._client = client
+        self._stream = stream
+        self._maxlen = maxlen
+
+    @classmethod
+    def from_url(cls, url: str, stream: str = "pharmacy:events", maxlen: int = 100000) -> 'RedisStreamTransport':
+        import redis
+
+        # The socket timeout must outlast a blocking XREADGROUP
+        return cls(redis.Redis.from_url(url, decode_responses=True, socket_timeout=30), stream, maxlen)
+
+    def publish(self, messages: List[Dict[str, str]]) -> None:
+        pipeline = self._client.pipeline(transaction=False)
+        for fields in messages:
+            pipeline.xadd(self._stream, fields, maxlen=self._maxlen, approximate=True)
+        pipeline.execute()
+
+    def create_group(self, group: str) -> None:
+        try:
+            self._client.xgroup_create(self._stream, group, id="$", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def delete_group(self, group: str) -> None:
+        self._client.xgroup_destroy(self._stream, group)
+
+    def read(self, group: str, consumer: str, count: int, block: float) -> List[TransportMessage]:
+        response = self._client.xreadgroup(
+            group, consumer, {self._stream: ">"}, count=count, block=max(int(block * 1000), 1)
+        )
+        if not response:
+            return []
+        _, entries = response[0]
+        return [TransportMessage(id=message_id, fields=fields) for message_id, fields in entries]
+
+    def claim_stale(self, group: str, consumer: str, idle: float, count: int) -> List[TransportMessage]:
+        # Entries trimmed from the stream meanwhile are dropped by XAUTOCLAIM itself
+        _, entries, *_ = self._client.xautoclaim(
+            self._stream, group, consumer, min_idle_time=int(idle * 1000), start_id="0-0", count=count
+        )
+        entries = [(message_id, fields) for message_id, fields in entries if fields]
+        if not entries:
+            return []
+
+        pipeline = self._client.pipeline(transaction=False)
+        for message_id, _ in entries:
+            pipeline.xpending_range(self._stream, group, min=message_id, max=message_id, count=1)
+        deliveries = {
+            pending[0]["message_id"]: pending[0]["times_delivered"]
+            for pending in pipeline.execute() if pending
+        }
+        return [
+            TransportMessage(id=message_id, fields=fields, deliveries=deliveries.get(message_id, 1))
+            for message_id, fields in entries
+        ]
+
+    def ack(self, group: str, message_ids: List[str]) -> None:
+        if message_ids:
+            self._client.xack(self._stream, group, *message_ids)
+
+    def stats(self) -> Dict[str, int]:
+        try:
+            groups = self._client.xinfo_groups(self._stream)
+            length = self._client.xlen(self._stream)
+        except Exception as e:
+            logger.warning(f"Event stream stats unavailable: {str(e)}")
+            return {}
+        return {
+            "length": int(length),
+            "groups": len(groups),
+            "pending": sum(int(group["pending"]) for group in groups)
+        }
@@ -0,0 +1,303 @@
+import atexit
+import logging
+import os
+import socket
+import threading
+from typing import Any, Dict, List, Mapping, Optional
+
+from flask import Flask, has_app_context
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.dataBase import db
+from app.shared.application.events.event_bus import EventBus, EventMetadata
+from app.shared.infrastructure.messaging.redis_streams import RedisStreamTransport
+from app.shared.infrastructure.messaging.sqlite_broker import SQLiteBrokerTransport
+from app.shared.infrastructure.messaging.transport import EventTransport, TransportMessage
+from app.shared.infrastructure.outbox.serialization import deserialize_event, serialize_event
+from app.shared.infrastructure.persistence.engine import write_intent
+
+logger = logging.getLogger(__name__)
+
+# Messages waiting in session.info for the publishing transaction to commit
+_PENDING_KEY = "event_relay_pending"
+
+_HOSTNAME = socket.gethostname()
+
+
+def _worker_id() -> str:
+    # Evaluated after the fork, so every gunicorn worker gets its own
+    return f"{_HOSTNAME}:{os.getpid()}"
+
+
+class EventRelay:
+    """
+    Carries events between workers and hosts through an EventTransport.
+
+    Every worker reads the stream through two consumer groups. The shared
+    group (``group``) is common to all workers, so each event runs its
+    ordinary handlers in exactly one of them; a per-worker group
+    (``group:host:pid``) makes every worker run its fanout handlers for
+    every event, e.g. to drop entries from a local cache. The publishing
+    worker has already run its own fanout handlers and skips them.
+
+    Events are sent once the publishing transaction commits, and dropped if
+    it rolls back. Messages are acknowledged per batch; a message whose
+    handlers fail stays pending and is claimed again after ``claim_idle``
+    seconds, up to ``max_deliveries`` times. Like the outbox, delivery is
+    at-least-once, so handlers should tolerate duplicates.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        event_bus: EventBus,
+        transport: EventTransport,
+        group: str = "pharmacy",
+        batch_size: int = 100,
+        block: float = 1.0,
+        claim_idle: float = 30.0,
+        max_deliveries: int = 5
+    ):
+        self._app = app
+        self._event_bus = event_bus
+        self._transport = transport
+        self._group = group
+        self._batch_size = batch_size
+        self._block = block
+        self._claim_idle = claim_idle
+        self._max_deliveries = max_deliveries
+        self._group_ready = False
+        self._worker: Optional[str] = None
+        self._fanout_group: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stats_lock = threading.Lock()
+        self._stats = {"published": 0, "publish_failures": 0, "delivered": 0, "failures": 0, "dropped": 0}
+        _install_session_hooks()
+
+    @classmethod
+    def from_config(cls, app: Flask, event_bus: EventBus, transport: EventTransport) -> 'EventRelay':
+        """Build a relay from the EVENT_BUS_* / EVENT_RELAY_* configuration values."""
+        config = app.config
+        return cls(
+            app,
+            event_bus,
+            transport,
+            group=config.get('EVENT_BUS_GROUP', 'pharmacy'),
+            batch_size=config.get('EVENT_RELAY_BATCH_SIZE', 100),
+            block=config.get('EVENT_RELAY_BLOCK', 1.0),
+            claim_idle=config.get('EVENT_RELAY_CLAIM_IDLE', 30.0),
+            max_deliveries=config.get('EVENT_RELAY_MAX_DELIVERIES', 5)
+        )
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def send(self, event: Any, shared: bool) -> bool:
+        """
+        Queue an event for the other workers.
+
+        Args:
+            event: Pydantic model or dataclass event
+            shared: Whether one worker still has to run its ordinary handlers
+
+        Returns:
+            True if the event will be sent, False if it must be handled
+            locally (unsupported event type)
+        """
+        try:
+            event_type, payload = serialize_event(event)
+        except TypeError as e:
+            logger.warning(f"Not relaying {type(event).__name__}: {str(e)}")
+            return False
+
+        message = {
+            **EventMetadata.for_event(event).to_headers(),
+            "type": event_type,
+            "payload": payload,
+            "origin": _worker_id(),
+            "shared": "1" if shared else "0"
+        }
+
+        session = self._transaction_session()
+        if session is None:
+            self._publish([message])
+        else:
+            session.info.setdefault(_PENDING_KEY, {}).setdefault(self, []).append(message)
+        return True
+
+    def start(self) -> None:
+        """Create this worker's groups and start the consumer threads (idempotent)."""
+        with self._start_lock:
+            if self._threads:
+                return
+            self._worker = _worker_id()
+            self._fanout_group = f"{self._group}:{self._worker}"
+            self._ensure_group()
+            self._transport.create_group(self._fanout_group)
+            self._stop_event.clear()
+            for group, fanout in ((self._group, False), (self._fanout_group, True)):
+                thread = threading.Thread(
+                    target=self._consume,
+                    args=(group, fanout),
+                    name=f"event-relay-{'fanout' if fanout else 'shared'}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            atexit.register(self.stop)
+        logger.info(f"Event relay started on {self._transport.name} as {self._worker}")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the consumers and remove this worker's fanout group."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if self._fanout_group is not None:
+            try:
+                self._transport.delete_group(self._fanout_group)
+            except Exception as e:
+                logger.warning(f"Could not remove consumer group {self._fanout_group}: {str(e)}")
+            self._fanout_group = None
+
+    def run_once(self, group: str, fanout: bool) -> int:
+        """
+        Handle one batch of the group's messages, stale ones first.
+
+        Returns:
+            Number of messages read
+        """
+        messages = self._transport.claim_stale(group, self._worker, self._claim_idle, self._batch_size)
+        if not messages:
+            messages = self._transport.read(group, self._worker, self._batch_size, self._block)
+
+        handled = [message.id for message in messages if self._handle(message, fanout)]
+        self._transport.ack(group, handled)
+        return len(messages)
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        try:
+            stats.update(self._transport.stats())
+        except Exception as e:
+            logger.warning(f"Event transport stats unavailable: {str(e)}")
+        return stats
+
+    def _consume(self, group: str, fanout: bool) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.run_once(group, fanout)
+            except Exception as e:
+                logger.error(f"Event relay read from {group} failed: {str(e)}", exc_info=True)
+                self._stop_event.wait(self._block)
+
+    def _handle(self, message: TransportMessage, fanout: bool) -> bool:
+        """Run the message's handlers; returns whether to acknowledge it."""
+        fields = message.fields
+        if fanout and fields.get("origin") == self._worker:
+            return True
+        if not fanout and fields.get("shared") != "1":
+            return True
+
+        try:
+            event = deserialize_event(fields["type"], fields["payload"])
+            with self._app.app_context(), write_intent():
+                try:
+                    self._event_bus.deliver(event, fanout=fanout)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+        except Exception as e:
+            self._count("failures")
+            if message.deliveries >= self._max_deliveries:
+                self._count("dropped")
+                logger.error(
+                    f"Dropping event {fields.get('event_id')} ({fields.get('type')}) "
+                    f"after {message.deliveries} deliveries: {str(e)}"
+                )
+                return True
+            logger.warning(f"Delivery of event {fields.get('event_id')} ({fields.get('type')}) failed: {str(e)}")
+            return False
+
+        self._count("delivered")
+        return True
+
+    def _publish(self, messages: List[Dict[str, str]]) -> None:
+        try:
+            self._ensure_group()
+            self._transport.publish(messages)
+        except Exception as e:
+            # The publisher's transaction is already committed; the other
+            # workers miss these events, but the request still succeeds
+            self._count("publish_failures", len(messages))
+            logger.error(f"Could not relay {len(messages)} events: {str(e)}", exc_info=True)
+            return
+        self._count("published", len(messages))
+
+    def _ensure_group(self) -> None:
+        # A group only sees messages published after it exists, so the
+        # shared group is created before the first event is sent
+        if not self._group_ready:
+            self._transport.create_group(self._group)
+            self._group_ready = True
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    @staticmethod
+    def _transaction_session() -> Optional[Session]:
+        """The request's or job's session if it has a transaction to wait for."""
+        if not has_app_context():
+            return None
+        session = db.session()
+        return session if session.in_transaction() else None
+
+
+def _install_session_hooks() -> None:
+    if sa_event.contains(Session, "after_commit", _send_after_commit):
+        return
+    sa_event.listen(Session, "after_commit", _send_after_commit)
+    sa_event.listen(Session, "after_soft_rollback", _discard_after_rollback)
+
+
+def _send_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    for relay, messages in (pending or {}).items():
+        relay._publish(messages)
+
+
+def _discard_after_rollback(session: Session, previous_transaction) -> None:
+    # A rolled back savepoint leaves the outer transaction, and its events, alive
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+def build_event_transport(config: Mapping[str, Any], instance_path: str) -> Optional[EventTransport]:
+    """
+    Create the transport selected by EVENT_BUS_TRANSPORT.
+
+    'inprocess' keeps events inside the publishing worker (no transport),
+    'redis' uses a Redis Stream on REDIS_URL and 'sqlite' a broker file
+    (EVENT_BROKER_PATH, by default in the instance folder).
+    """
+    name = config.get('EVENT_BUS_TRANSPORT', 'inprocess')
+    maxlen = config.get('EVENT_STREAM_MAXLEN', 100000)
+    if name == 'inprocess':
+        return None
+    if name == 'redis':
+        return RedisStreamTransport.from_url(
+            config.get('REDIS_URL', 'redis://localhost:6379/0'),
+            stream=config.get('EVENT_STREAM_NAME', 'pharmacy:events'),
+            maxlen=maxlen
+        )
+    if name == 'sqlite':
+        path = config.get('EVENT_BROKER_PATH') or os.path.join(instance_path, 'event_broker.db')
+        return SQLiteBrokerTransport(path, maxlen=maxlen)
+    raise ValueError(f"Unknown EVENT_BUS_TRANSPORT '{name}', expected 'inprocess', 'redis' or 'sqlite'")
@@ -0,0 +1,170 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+from app.shared.infrastructure.messaging.transport import EventTransport, TransportMessage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS broker_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fields TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS broker_groups (
+    name TEXT PRIMARY KEY,
+    last_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS broker_pending (
+    group_name TEXT NOT NULL,
+    message_id INTEGER NOT NULL,
+    consumer TEXT NOT NULL,
+    delivered_at REAL NOT NULL,
+    deliveries INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (group_name, message_id)
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteBrokerTransport(EventTransport):
+    """
+    Event stream in a SQLite file, for development and tests.
+
+    Shared by the workers of one host, which all open the same file; it
+    behaves like the Redis transport (consumer groups, pending messages,
+    claiming) so the relay runs unchanged. Each group keeps the id of the
+    last message it handed out, and AUTOINCREMENT ids are never reused, so
+    trimming the stream to ``maxlen`` messages never confuses a group.
+    Reads poll every ``poll_interval`` seconds while blocking.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, maxlen: int = 100000, poll_interval: float = 0.2):
+        self._path = path
+        self._maxlen = maxlen
+        self._poll_interval = poll_interval
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def publish(self, messages: List[Dict[str, str]]) -> None:
+        now = time.time()
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT INTO broker_messages (fields, created_at) VALUES (?, ?)",
+                [(json.dumps(fields), now) for fields in messages]
+            )
+            last_id = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+            connection.execute("DELETE FROM broker_messages WHERE id <= ?", (last_id - self._maxlen,))
+
+    def create_group(self, group: str) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO broker_groups (name, last_id) VALUES (?, COALESCE("
+                "(SELECT seq FROM sqlite_sequence WHERE name = 'broker_messages'), 0))",
+                (group,)
+            )
+
+    def delete_group(self, group: str) -> None:
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM broker_pending WHERE group_name = ?", (group,))
+            connection.execute("DELETE FROM broker_groups WHERE name = ?", (group,))
+
+    def read(self, group: str, consumer: str, count: int, block: float) -> List[TransportMessage]:
+        deadline = time.monotonic() + block
+        while True:
+            messages = self._read_new(group, consumer, count)
+            if messages or time.monotonic() >= deadline:
+                return messages
+            time.sleep(self._poll_interval)
+
+    def claim_stale(self, group: str, consumer: str, idle: float, count: int) -> List[TransportMessage]:
+        now = time.time()
+        with self._transaction() as connection:
+            # Pending entries of messages trimmed from the stream cannot be redelivered
+            connection.execute(
+                "DELETE FROM broker_pending WHERE group_name = ? "
+                "AND message_id < (SELECT MIN(id) FROM broker_messages)",
+                (group,)
+            )
+            rows = connection.execute(
+                "SELECT p.message_id, m.fields, p.deliveries FROM broker_pending p "
+                "JOIN broker_messages m ON m.id = p.message_id "
+                "WHERE p.group_name = ? AND p.delivered_at <= ? ORDER BY p.message_id LIMIT ?",
+                (group, now - idle, count)
+            ).fetchall()
+            connection.executemany(
+                "UPDATE broker_pending SET consumer = ?, delivered_at = ?, deliveries = deliveries + 1 "
+                "WHERE group_name = ? AND message_id = ?",
+                [(consumer, now, group, message_id) for message_id, _, _ in rows]
+            )
+        return [
+            TransportMessage(id=str(message_id), fields=json.loads(fields), deliveries=deliveries + 1)
+            for message_id, fields, deliveries in rows
+        ]
+
+    def ack(self, group: str, message_ids: List[str]) -> None:
+        if not message_ids:
+            return
+        with self._transaction() as connection:
+            connection.executemany(
+                "DELETE FROM broker_pending WHERE group_name = ? AND message_id = ?",
+                [(group, int(message_id)) for message_id in message_ids]
+            )
+
+    def stats(self) -> Dict[str, int]:
+        connection = self._connection()
+        return {
+            "length": connection.execute("SELECT COUNT(*) FROM broker_messages").fetchone()[0],
+            "groups": connection.execute("SELECT COUNT(*) FROM broker_groups").fetchone()[0],
+            "pending": connection.execute("SELECT COUNT(*) FROM broker_pending").fetchone()[0]
+        }
+
+    def _read_new(self, group: str, consumer: str, count: int) -> List[TransportMessage]:
+        now = time.time()
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT id, fields FROM broker_messages "
+                "WHERE id > (SELECT last_id FROM broker_groups WHERE name = ?) ORDER BY id LIMIT ?",
+                (group, count)
+            ).fetchall()
+            if rows:
+                connection.execute("UPDATE broker_groups SET last_id = ? WHERE name = ?", (rows[-1][0], group))
+                connection.executemany(
+                    "INSERT INTO broker_pending (group_name, message_id, consumer, delivered_at) VALUES (?, ?, ?, ?)",
+                    [(group, message_id, consumer, now) for message_id, _ in rows]
+                )
+        return [TransportMessage(id=str(message_id), fields=json.loads(fields)) for message_id, fields in rows]
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; a forked worker opens its own instead
+        # of sharing the parent's
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _transaction(self):
+        return _ImmediateTransaction(self._connection())
+
+
+class _ImmediateTransaction:
+    """BEGIN IMMEDIATE ... COMMIT, so concurrent readers of a group never hand out the same message."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._connection.execute("ROLLBACK" if exc_type else "COMMIT")
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class TransportMessage:
+    """A message read from a consumer group, not yet acknowledged."""
+    id: str
+    fields: Dict[str, str]
+    # How many times the group has handed this message out, this time included
+    deliveries: int = 1
+
+
+class EventTransport:
+    """
+    Append-only message stream read through consumer groups.
+
+    Every group sees every message published after it was created; within
+    a group each message goes to one consumer and stays pending until that
+    consumer acknowledges it. Pending messages idle for too long can be
+    claimed by another consumer of the group, so a crashed worker's
+    messages are redelivered. Modelled on Redis Streams.
+    """
+
+    name = "base"
+
+    def publish(self, messages: List[Dict[str, str]]) -> None:
+        """Append the messages to the stream, in order."""
+        raise NotImplementedError
+
+    def create_group(self, group: str) -> None:
+        """Create a consumer group starting after the newest message (no-op if it exists)."""
+        raise NotImplementedError
+
+    def delete_group(self, group: str) -> None:
+        raise NotImplementedError
+
+    def read(self, group: str, consumer: str, count: int, block: float) -> List[TransportMessage]:
+        """Hand out up to ``count`` new messages, waiting up to ``block`` seconds for some."""
+        raise NotImplementedError
+
+    def claim_stale(self, group: str, consumer: str, idle: float, count: int) -> List[TransportMessage]:
+        """Take over up to ``count`` messages pending for at least ``idle`` seconds."""
+        raise NotImplementedError
+
+    def ack(self, group: str, message_ids: List[str]) -> None:
+        """Acknowledge a batch of messages of the group."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, int]:
+        """Stream length, number of groups and pending messages."""
+        raise NotImplementedError
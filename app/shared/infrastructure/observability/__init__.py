@@ -0,0 +1,4 @@
+from app.shared.infrastructure.observability.metrics import Counter, Histogram, MetricsRegistry, stats_collector
+from app.shared.infrastructure.observability.request_metrics import RequestMetrics, sql_fingerprint
+from app.shared.infrastructure.observability.startup import StartupTimings
+__all__ = ['Counter', 'Histogram', 'MetricsRegistry', 'stats_collector', 'RequestMetrics', 'sql_fingerprint', 'StartupTimings']
@@ -0,0 +1,164 @@
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Seconds; roughly exponential from 5 ms to 10 s
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label values."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        with self._lock:
+            # One slot per bucket, then +Inf, sum
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0.0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            for bound, count in zip(self.buckets, series):
+                le = 'le="' + _format_number(bound) + '"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {_format_number(count)}"
+            le = 'le="+Inf"'
+            yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {_format_number(series[-2])}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_number(series[-1])}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {_format_number(series[-2])}"
+
+
+class Counter:
+    """Monotonic counter keyed by label values."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, *labelvalues: str) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            snapshot = dict(self._values)
+        for labels, value in sorted(snapshot.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(value)}"
+
+
+# A collector returns (name, type, help, [(labels dict, value)]) samples at scrape time
+Collector = Callable[[], Iterable[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]]
+
+
+class MetricsRegistry:
+    """
+    Metrics of this process, rendered in the Prometheus text format.
+
+    Every gunicorn worker keeps its own registry, so a scrape through the
+    load balancer sees one worker at a time; counters and histograms are
+    still correct per worker and Prometheus' rate() copes with that.
+    """
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Collector] = []
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Collector) -> None:
+        """Register a callback producing gauge/counter samples when scraped."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                families = list(collector())
+            except Exception as e:
+                lines.append(f"# collector {getattr(collector, '__name__', collector)} failed: {_escape(str(e))}")
+                continue
+            for name, metric_type, documentation, samples in families:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def stats_collector(prefix: str, documentation: str, stats: Callable[[], Dict], label: str = None) -> Collector:
+    """
+    Expose an existing ``stats()`` dictionary as gauges.
+
+    Flat dictionaries become one ``<prefix>_<key>`` gauge per numeric value.
+    With ``label``, the dictionary is read as ``{label value: {key: value}}``
+    (e.g. per-handler stats) and every key becomes a gauge labelled by it.
+    """
+    def collect():
+        data = stats() or {}
+        series: Dict[str, List[Tuple[Dict[str, str], float]]] = {}
+        rows = data.items() if label else [(None, data)]
+        for label_value, values in rows:
+            labels = {label: str(label_value)} if label else {}
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                series.setdefault(f"{prefix}_{key}", []).append((labels, value))
+        for name, samples in series.items():
+            yield name, "gauge", documentation, samples
+
+    collect.__name__ = prefix
+    return collect
@@ -0,0 +1,171 @@
+import hmac
+import logging
+import re
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.shared.infrastructure.observability.metrics import (
+    COUNT_BUCKETS,
+    DURATION_BUCKETS,
+    SIZE_BUCKETS,
+    MetricsRegistry
+)
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|%s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|:\w+))+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def sql_fingerprint(statement: str, max_length: int = 200) -> str:
+    """
+    Normalize a SQL statement so that executions differing only in their
+    literals or IN-list lengths group together.
+    """
+    fingerprint = _STRING_LITERAL.sub("?", statement)
+    fingerprint = _NUMBER_LITERAL.sub("?", fingerprint)
+    fingerprint = _PLACEHOLDER_LIST.sub("(...)", fingerprint)
+    fingerprint = _WHITESPACE.sub(" ", fingerprint).strip()
+    return fingerprint[:max_length]
+
+
+class RequestMetrics:
+    """
+    Per-endpoint request instrumentation.
+
+    For every request it records wall time, the number and total time of
+    SQL statements (from the engine's cursor events), response size and
+    the time spent in event handlers run inline, as histograms labelled
+    with the endpoint (``blueprint.view``). Requests slower than
+    SLOW_REQUEST_THRESHOLD_MS are logged with their most expensive SQL
+    fingerprints. ``/metrics`` serves everything in the Prometheus text
+    format, along with pool, cache and event handler figures collected at
+    scrape time.
+    """
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry or MetricsRegistry()
+        labels = ("endpoint", "method", "status")
+        self.request_duration = self.registry.histogram(
+            "http_request_duration_seconds", "Request wall time", labels, DURATION_BUCKETS
+        )
+        self.sql_statements = self.registry.histogram(
+            "http_request_sql_statements", "SQL statements executed per request", labels, COUNT_BUCKETS
+        )
+        self.sql_duration = self.registry.histogram(
+            "http_request_sql_duration_seconds", "Total SQL time per request", labels, DURATION_BUCKETS
+        )
+        self.response_size = self.registry.histogram(
+            "http_response_size_bytes", "Response body size", labels, SIZE_BUCKETS
+        )
+        self.handler_duration = self.registry.histogram(
+            "http_request_event_handler_duration_seconds",
+            "Time spent in inline event handlers per request",
+            labels,
+            DURATION_BUCKETS
+        )
+        self.event_handler_duration = self.registry.histogram(
+            "event_handler_duration_seconds", "Event handler run time", ("handler", "outcome"), DURATION_BUCKETS
+        )
+        self.slow_requests = self.registry.counter(
+            "http_slow_requests_total", "Requests over the slow request threshold", ("endpoint",)
+        )
+        self._slow_threshold = 1.0
+        self._slow_top_statements = 5
+
+    def init_app(self, app: Flask, engine: Engine, event_bus=None) -> None:
+        self._slow_threshold = app.config.get('SLOW_REQUEST_THRESHOLD_MS', 1000) / 1000
+        self._slow_top_statements = app.config.get('SLOW_REQUEST_TOP_STATEMENTS', 5)
+        metrics_token = app.config.get('METRICS_TOKEN')
+
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        if event_bus is not None:
+            event_bus.add_handler_observer(self._observe_handler)
+
+        def metrics():
+            if metrics_token:
+                supplied = request.headers.get('Authorization', '').removeprefix('Bearer ')
+                if not hmac.compare_digest(supplied, metrics_token):
+                    return Response("Unauthorized\n", status=401, mimetype="text/plain")
+            return Response(self.registry.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+        app.add_url_rule(app.config.get('METRICS_PATH', '/metrics'), 'metrics', metrics)
+
+    def _start_request(self) -> None:
+        g._metrics_started = time.perf_counter()
+        g._metrics_sql_count = 0
+        g._metrics_sql_time = 0.0
+        g._metrics_sql_by_fingerprint = defaultdict(lambda: [0, 0.0])
+        g._metrics_handler_time = 0.0
+
+    def _finish_request(self, response: Response) -> Response:
+        started = g.pop('_metrics_started', None)
+        if started is None or request.endpoint == 'metrics':
+            return response
+
+        elapsed = time.perf_counter() - started
+        labels = (request.endpoint or "unmatched", request.method, str(response.status_code))
+
+        self.request_duration.observe(elapsed, *labels)
+        self.sql_statements.observe(g.get('_metrics_sql_count', 0), *labels)
+        self.sql_duration.observe(g.get('_metrics_sql_time', 0.0), *labels)
+        self.handler_duration.observe(g.get('_metrics_handler_time', 0.0), *labels)
+
+        # Streamed bodies have no length until they have been sent
+        if not response.is_streamed:
+            size = response.content_length
+            if size is None:
+                size = response.calculate_content_length()
+            if size is not None:
+                self.response_size.observe(size, *labels)
+
+        if elapsed >= self._slow_threshold:
+            self.slow_requests.inc(1, labels[0])
+            self._log_slow_request(elapsed, labels)
+
+        return response
+
+    def _log_slow_request(self, elapsed: float, labels: Tuple[str, str, str]) -> None:
+        by_fingerprint: Dict[str, List[Any]] = g.get('_metrics_sql_by_fingerprint', {})
+        top = sorted(by_fingerprint.items(), key=lambda item: item[1][1], reverse=True)[:self._slow_top_statements]
+        statements = "; ".join(
+            f"[{count}x {total * 1000:.1f} ms] {fingerprint}" for fingerprint, (count, total) in top
+        )
+        logger.warning(
+            f"Slow request {labels[1]} {request.path} ({labels[0]}) -> {labels[2]} in {elapsed * 1000:.0f} ms: "
+            f"{g.get('_metrics_sql_count', 0)} SQL statements, {g.get('_metrics_sql_time', 0.0) * 1000:.0f} ms SQL, "
+            f"{g.get('_metrics_handler_time', 0.0) * 1000:.0f} ms event handlers. Top SQL: {statements or 'none'}"
+        )
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_metrics_query_start', []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get('_metrics_query_start')
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+
+        # Background threads (outbox dispatcher, concurrent handlers) have no request to charge
+        if not has_request_context() or '_metrics_started' not in g:
+            return
+        g._metrics_sql_count += 1
+        g._metrics_sql_time += elapsed
+        entry = g._metrics_sql_by_fingerprint[sql_fingerprint(statement)]
+        entry[0] += 1
+        entry[1] += elapsed
+
+    def _observe_handler(self, name: str, elapsed: float, failed: bool) -> None:
+        self.event_handler_duration.observe(elapsed, name, "error" if failed else "ok")
+        if has_request_context() and '_metrics_started' in g:
+            g._metrics_handler_time += elapsed
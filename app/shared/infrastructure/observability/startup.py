@@ -0,0 +1,59 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimings:
+    """
+    Wall time of each startup phase of one process.
+
+    ``create_app`` records its phases (imports, extensions, schema,
+    blueprints, ...) and ``init_app`` adds the time from the start of the
+    process' imports to the end of its first request. For a per-module
+    breakdown of the imports run ``python -X importtime run.py``.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        self._started = started if started is not None else time.perf_counter()
+        self._phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._first_request_done = False
+
+    def record(self, name: str, seconds: float) -> None:
+        self._phases[name] = seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def init_app(self, app: Flask) -> None:
+        """Log the phases once the app is built and time its first request."""
+        self.record('create_app', time.perf_counter() - self._started)
+        logger.info(f"Startup: {self._format()}")
+
+        @app.teardown_request
+        def _first_request_done(exc=None):
+            if self._first_request_done:
+                return
+            with self._lock:
+                if self._first_request_done:
+                    return
+                self._first_request_done = True
+                self.record('first_request', time.perf_counter() - self._started)
+            logger.info(f"Time to first request: {self._phases['first_request'] * 1000:.1f} ms")
+
+    def stats(self) -> Dict[str, float]:
+        return {f"{name}_seconds": round(seconds, 6) for name, seconds in self._phases.items()}
+
+    def _format(self) -> str:
+        return ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self._phases.items())
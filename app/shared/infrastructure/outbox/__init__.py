@@ -0,0 +1,4 @@
+from app.shared.infrastructure.outbox.models import OutboxEventModel, DeadLetterEventModel
+from app.shared.infrastructure.outbox.outbox import TransactionalOutbox
+from app.shared.infrastructure.outbox.dispatcher import OutboxDispatcher, outbox_worker_command
+__all__ = ['OutboxEventModel', 'DeadLetterEventModel', 'TransactionalOutbox', 'OutboxDispatcher', 'outbox_worker_command']
@@ -0,0 +1,245 @@
+import logging
+import os
+import random
+import socket
+import threading
+from datetime import timedelta
+from typing import List, Optional
+from uuid import uuid4
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+from sqlalchemy import and_, or_, select
+
+from app.dataBase import db
+from app.shared.infrastructure.persistence.engine import write_intent
+from app.shared.application.events.event_bus import EventBus
+from app.shared.infrastructure.outbox.models import DeadLetterEventModel, OutboxEventModel, utcnow
+from app.shared.infrastructure.outbox.serialization import deserialize_event
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """
+    Drains the outbox table in the background and delivers events to the
+    event bus subscribers.
+
+    Delivery is at-least-once: a batch is claimed with a lease (a single
+    conditional UPDATE, so several workers or processes can poll the same
+    table), each event's handlers run in their own transaction together
+    with the deletion of the outbox row, and a failed event is retried with
+    exponential backoff until it is moved to ``outbox_dead_letter``. A
+    worker that dies mid-batch loses its lease and the events are picked up
+    again, so handlers should tolerate seeing an event twice.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        event_bus: EventBus,
+        workers: int = 1,
+        batch_size: int = 50,
+        poll_interval: float = 0.5,
+        max_attempts: int = 8,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
+        lease_seconds: float = 60.0
+    ):
+        self._app = app
+        self._event_bus = event_bus
+        self._workers = max(workers, 1)
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._lease = timedelta(seconds=lease_seconds)
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    @classmethod
+    def from_config(cls, app: Flask, event_bus: EventBus) -> 'OutboxDispatcher':
+        """Build a dispatcher from the OUTBOX_* configuration values."""
+        config = app.config
+        return cls(
+            app,
+            event_bus,
+            workers=config.get('OUTBOX_WORKERS', 1),
+            batch_size=config.get('OUTBOX_BATCH_SIZE', 50),
+            poll_interval=config.get('OUTBOX_POLL_INTERVAL', 0.5),
+            max_attempts=config.get('OUTBOX_MAX_ATTEMPTS', 8),
+            backoff_base=config.get('OUTBOX_BACKOFF_BASE', 1.0),
+            backoff_max=config.get('OUTBOX_BACKOFF_MAX', 300.0),
+            lease_seconds=config.get('OUTBOX_LEASE_SECONDS', 60.0)
+        )
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def start(self) -> None:
+        """Start the worker threads (idempotent)."""
+        with self._start_lock:
+            if self._threads:
+                return
+            self._stop_event.clear()
+            for index in range(self._workers):
+                thread = threading.Thread(
+                    target=self.run_forever,
+                    name=f"outbox-dispatcher-{index}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"Outbox dispatcher started with {self._workers} worker(s)")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the worker threads to stop and wait for them."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_forever(self) -> None:
+        """Poll the outbox until stop() is called."""
+        while not self._stop_event.is_set():
+            try:
+                delivered = self.run_once()
+            except Exception as e:
+                logger.error(f"Outbox dispatch cycle failed: {str(e)}", exc_info=True)
+                delivered = 0
+
+            # Keep draining while full batches come back, otherwise wait
+            if delivered < self._batch_size:
+                self._stop_event.wait(self._poll_interval)
+
+    def run_once(self) -> int:
+        """
+        Claim and deliver one batch of due events.
+
+        Returns:
+            Number of events claimed
+        """
+        # The app context teardown removes the scoped session afterwards
+        with self._app.app_context():
+            # Polling an empty outbox is a plain read; only a batch that is
+            # due takes the write lock (BEGIN IMMEDIATE on SQLite)
+            if not self._has_due_events(db.engine):
+                return 0
+            with write_intent():
+                session = db.session
+                claimed = self._claim_batch(session)
+                for row_id in claimed:
+                    self._deliver(session, row_id)
+                return len(claimed)
+
+    @staticmethod
+    def _has_due_events(engine) -> bool:
+        due = select(OutboxEventModel.id).where(_due(utcnow())).limit(1)
+        with engine.connect().execution_options(sqlite_begin='deferred') as connection:
+            return connection.execute(due).first() is not None
+
+    def _claim_batch(self, session) -> List[int]:
+        now = utcnow()
+        token = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+        due_ids = (
+            select(OutboxEventModel.id)
+            .where(_due(now))
+            .order_by(OutboxEventModel.id)
+            .limit(self._batch_size)
+        )
+        # The lock condition is re-checked by the UPDATE itself, so two
+        # workers selecting the same rows cannot both claim them
+        session.query(OutboxEventModel).filter(
+            OutboxEventModel.id.in_(due_ids),
+            _available(now)
+        ).update(
+            {
+                OutboxEventModel.locked_by: token,
+                OutboxEventModel.locked_until: now + self._lease
+            },
+            synchronize_session=False
+        )
+        session.commit()
+
+        return [
+            row_id for (row_id,) in session.query(OutboxEventModel.id)
+            .filter(OutboxEventModel.locked_by == token)
+            .order_by(OutboxEventModel.id)
+            .all()
+        ]
+
+    def _deliver(self, session, row_id: int) -> None:
+        row = session.get(OutboxEventModel, row_id)
+        if row is None:
+            return
+
+        try:
+            event = deserialize_event(row.event_type, row.payload)
+            self._event_bus.dispatch(event)
+            # Handler writes and the outbox deletion commit together
+            session.delete(row)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Delivery of outbox event {row_id} failed: {str(e)}")
+            self._record_failure(session, row_id, e)
+
+    def _record_failure(self, session, row_id: int, error: Exception) -> None:
+        row = session.get(OutboxEventModel, row_id)
+        if row is None:
+            return
+
+        row.attempts += 1
+        row.last_error = f"{type(error).__name__}: {str(error)}"[:4000]
+        row.locked_by = None
+        row.locked_until = None
+
+        if row.attempts >= self._max_attempts:
+            session.add(DeadLetterEventModel(
+                event_id=row.event_id,
+                event_type=row.event_type,
+                payload=row.payload,
+                created_at=row.created_at,
+                attempts=row.attempts,
+                last_error=row.last_error
+            ))
+            session.delete(row)
+            logger.error(f"Outbox event {row.event_id} ({row.event_type}) moved to dead letter after {row.attempts} attempts")
+        else:
+            row.next_attempt_at = utcnow() + timedelta(seconds=self._backoff(row.attempts))
+
+        session.commit()
+
+    def _backoff(self, attempts: int) -> float:
+        # Exponential backoff with jitter so failing events do not retry in lockstep
+        delay = min(self._backoff_max, self._backoff_base * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+
+def _available(now):
+    """Not claimed, or claimed by a worker whose lease has run out."""
+    return or_(OutboxEventModel.locked_until.is_(None), OutboxEventModel.locked_until < now)
+
+
+def _due(now):
+    return and_(OutboxEventModel.next_attempt_at <= now, _available(now))
+
+
+@click.command("outbox-worker")
+@with_appcontext
+def outbox_worker_command():
+    """Deliver outbox events from a dedicated process until interrupted."""
+    from app.extensions import container, subscribe_event_handlers
+
+    subscribe_event_handlers()
+    dispatcher = OutboxDispatcher.from_config(current_app._get_current_object(), container.event_bus())
+    click.echo("Outbox worker running, press Ctrl+C to stop")
+    try:
+        dispatcher.run_forever()
+    except KeyboardInterrupt:
+        dispatcher.stop()
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from app.dataBase import db
+
+
+def utcnow() -> datetime:
+    """Naive UTC timestamp, comparable across SQLite and PostgreSQL."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class OutboxEventModel(db.Model):
+    """
+    An event waiting to be delivered to its subscribers.
+
+    Rows are inserted in the same transaction as the aggregate change that
+    raised the event and deleted once every handler has succeeded.
+    """
+    __tablename__ = 'outbox'
+    __table_args__ = (
+        # Dispatcher poll: due rows in insertion order
+        Index('ix_outbox_next_attempt_at_id', 'next_attempt_at', 'id'),
+        Index('ix_outbox_locked_by', 'locked_by'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(String(36), nullable=False, unique=True)
+    event_type = Column(String(255), nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=utcnow)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=utcnow)
+    locked_by = Column(String(128), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<OutboxEvent {self.id} {self.event_type}, attempts: {self.attempts}>"
+
+
+class DeadLetterEventModel(db.Model):
+    """An outbox event that kept failing and was taken out of delivery."""
+    __tablename__ = 'outbox_dead_letter'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(String(36), nullable=False, index=True)
+    event_type = Column(String(255), nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    failed_at = Column(DateTime, nullable=False, default=utcnow)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<DeadLetterEvent {self.event_id} {self.event_type}, attempts: {self.attempts}>"
@@ -0,0 +1,55 @@
+import logging
+from typing import Any, Callable
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.shared.infrastructure.outbox.models import OutboxEventModel
+from app.shared.infrastructure.outbox.serialization import serialize_event
+
+logger = logging.getLogger(__name__)
+
+
+class TransactionalOutbox:
+    """
+    Stores published events in the ``outbox`` table of the caller's session.
+
+    The row is only added to the session, not committed: it becomes visible
+    to the dispatcher when the unit of work that raised the event commits,
+    and disappears with it on rollback.
+    """
+
+    def __init__(self, session_provider: Callable[[], Session]):
+        self._session_provider = session_provider
+
+    def add(self, event: Any) -> bool:
+        """
+        Queue an event for background delivery.
+
+        Args:
+            event: Pydantic model or dataclass event
+
+        Returns:
+            True if the event was queued, False if it must be delivered inline
+            (unsupported event type or no database session available)
+        """
+        try:
+            event_type, payload = serialize_event(event)
+        except TypeError as e:
+            logger.warning(f"Delivering {type(event).__name__} inline: {str(e)}")
+            return False
+
+        try:
+            session = self._session_provider()
+            session.add(OutboxEventModel(
+                event_id=str(uuid4()),
+                event_type=event_type,
+                payload=payload
+            ))
+        except RuntimeError as e:
+            # Outside an application context there is no session to join
+            logger.warning(f"Delivering {type(event).__name__} inline: {str(e)}")
+            return False
+
+        logger.debug(f"Queued {event_type} in the outbox")
+        return True
@@ -0,0 +1,65 @@
+"""
+Round-tripping events through the outbox table.
+
+Events are pydantic models or dataclasses; they are stored as JSON together
+with the import path of their class, which is used to rebuild them. The
+EventMetadata of Event dataclasses is stored in its header form.
+"""
+
+import dataclasses
+import importlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Tuple
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.shared.application.events.event_bus import Event, EventMetadata
+
+
+def serialize_event(event: Any) -> Tuple[str, str]:
+    """
+    Returns:
+        Tuple of the event type ("module:QualName") and the JSON payload
+
+    Raises:
+        TypeError: If the event is neither a pydantic model nor a dataclass
+    """
+    event_class = type(event)
+    if isinstance(event, BaseModel):
+        payload = event.model_dump(mode="json")
+    elif dataclasses.is_dataclass(event):
+        payload = dataclasses.asdict(event)
+        if isinstance(event, Event):
+            payload["metadata"] = event.metadata.to_headers()
+    else:
+        raise TypeError(f"Cannot store {event_class.__name__} in the outbox")
+
+    event_type = f"{event_class.__module__}:{event_class.__qualname__}"
+    return event_type, json.dumps(payload, default=_json_default)
+
+
+def deserialize_event(event_type: str, payload: str) -> Any:
+    """Rebuild an event stored by serialize_event."""
+    module_name, _, class_name = event_type.partition(":")
+    event_class = getattr(importlib.import_module(module_name), class_name)
+    data = json.loads(payload)
+
+    if issubclass(event_class, BaseModel):
+        return event_class.model_validate(data)
+    if issubclass(event_class, Event) and "metadata" in data:
+        data["metadata"] = EventMetadata.from_headers(data["metadata"])
+    return event_class(**data)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
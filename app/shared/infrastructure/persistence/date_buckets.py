@@ -0,0 +1,105 @@
+"""
+Calendar bucketing for time-series aggregates.
+
+``bucket_expression`` truncates a timestamp column to the start of its day,
+week (ISO, Monday-based), month, quarter or year in SQL, so the rows of a
+whole period can be aggregated with a single GROUP BY: ``date_trunc`` on
+PostgreSQL and a ``strftime``/``date`` equivalent on SQLite. ``iter_buckets`` and
+``to_bucket_date`` fill in and normalise the buckets on the Python side.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Iterator, Union
+
+from sqlalchemy import Integer, String, cast, func, literal
+
+from app.shared.domain.exceptions.common_errors import ValidationError
+
+BUCKETS = ("day", "week", "month", "quarter", "year")
+
+
+def validate_bucket(bucket: str) -> str:
+    """
+    Raises:
+        ValidationError: If the bucket is not one of BUCKETS
+    """
+    bucket = (bucket or "day").lower()
+    if bucket not in BUCKETS:
+        raise ValidationError(f"Invalid bucket '{bucket}', expected one of: {', '.join(BUCKETS)}")
+    return bucket
+
+
+def bucket_expression(column, bucket: str, dialect_name: str):
+    """
+    SQL expression truncating ``column`` to the start of its bucket.
+
+    Args:
+        column: Date/datetime column
+        bucket: One of BUCKETS
+        dialect_name: Name of the session's dialect, e.g. "postgresql" or "sqlite"
+    """
+    bucket = validate_bucket(bucket)
+
+    if dialect_name == "postgresql":
+        return func.date_trunc(bucket, column)
+
+    if bucket == "year":
+        return func.strftime("%Y-01-01", column)
+    if bucket == "quarter":
+        first_month = (cast(func.strftime("%m", column), Integer) - 1) // 3 * 3 + 1
+        return func.strftime("%Y-", column).concat(func.printf("%02d", first_month)).concat("-01")
+    if bucket == "month":
+        return func.strftime("%Y-%m-01", column)
+    if bucket == "week":
+        # %w is 0 for Sunday; step back to the Monday of the same ISO week
+        days_since_monday = (cast(func.strftime("%w", column), Integer) + 6) % 7
+        return func.date(column, literal("-") + cast(days_since_monday, String) + " days")
+    return func.date(column)
+
+
+def to_bucket_date(value: Union[str, date, datetime]) -> date:
+    """Normalise a bucket value returned by either dialect to a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def bucket_start(value: Union[date, datetime], bucket: str) -> date:
+    """Start date of the bucket containing ``value``."""
+    day = to_bucket_date(value)
+    if bucket == "year":
+        return day.replace(month=1, day=1)
+    if bucket == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    if bucket == "month":
+        return day.replace(day=1)
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def iter_buckets(start: Union[date, datetime], end: Union[date, datetime], bucket: str) -> Iterator[date]:
+    """Yield the start date of every bucket between start and end, inclusive."""
+    bucket = validate_bucket(bucket)
+    current = bucket_start(start, bucket)
+    last = bucket_start(end, bucket)
+
+    while current <= last:
+        yield current
+        current = next_bucket_start(current, bucket)
+
+
+def next_bucket_start(start: date, bucket: str) -> date:
+    """Start date of the bucket following the one starting at ``start``."""
+    if bucket == "year":
+        return start.replace(year=start.year + 1, month=1, day=1)
+    if bucket == "quarter":
+        month = start.month + 3
+        return date(start.year + (month - 1) // 12, (month - 1) % 12 + 1, 1)
+    if bucket == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    if bucket == "week":
+        return start + timedelta(days=7)
+    return start + timedelta(days=1)
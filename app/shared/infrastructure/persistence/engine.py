@@ -0,0 +1,238 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, Mapping
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long checkouts wait for a connection and
+    how often they time out.
+
+    Counters live on the pool instance, so they restart when the engine is
+    disposed and the pool recreated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._metrics_lock:
+                self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._metrics_lock:
+                self.checkouts += 1
+                self.checkout_wait_total += waited
+                self.checkout_wait_max = max(self.checkout_wait_max, waited)
+
+
+def build_engine_options(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for the DB_ENGINE_PROFILE selected in config.
+
+    Each worker's pool holds one connection per request thread plus one per
+    background thread (outbox dispatcher, concurrent event handlers, scheduler), and
+    overflow on top of that, all capped so that every gunicorn worker
+    together stays within DB_MAX_CONNECTIONS.
+    """
+    profile = config['ENGINE_PROFILES'][config.get('DB_ENGINE_PROFILE', 'web')]
+    url = make_url(config['SQLALCHEMY_DATABASE_URI'])
+
+    pool_size = _pool_size(config)
+    max_overflow = int(pool_size * profile['overflow_ratio'])
+
+    max_connections = config.get('DB_MAX_CONNECTIONS') or 0
+    if max_connections:
+        per_worker = max(max_connections // max(config.get('GUNICORN_WORKERS', 1), 1), 1)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = max(min(max_overflow, per_worker - pool_size), 0)
+
+    if url.get_backend_name() == 'sqlite':
+        options: Dict[str, Any] = {'connect_args': {'check_same_thread': False}}
+        # In-memory databases keep SQLAlchemy's single-connection pool
+        if url.database and url.database != ':memory:':
+            options.update(
+                poolclass=InstrumentedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=profile['pool_timeout'],
+            )
+        return options
+
+    options = {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_timeout': profile['pool_timeout'],
+        'pool_recycle': profile['pool_recycle'],
+        'pool_pre_ping': True,
+    }
+
+    if url.get_backend_name() == 'postgresql':
+        server_options = [
+            f"-c statement_timeout={profile['statement_timeout_ms']}",
+            f"-c idle_in_transaction_session_timeout={profile['idle_in_transaction_timeout_ms']}",
+        ]
+        options['connect_args'] = {
+            'options': ' '.join(server_options),
+            'application_name': config.get('DB_APPLICATION_NAME', 'pharmacy-api'),
+        }
+
+    return options
+
+
+# Whether transactions started on this thread/task will write. Only read on
+# SQLite, where it selects BEGIN IMMEDIATE over a plain deferred BEGIN.
+_write_intent: ContextVar[bool] = ContextVar('db_write_intent', default=False)
+
+
+def set_write_intent(value: bool) -> Token:
+    """Mark the transactions started from now on in this context as writes; returns a reset token."""
+    return _write_intent.set(value)
+
+
+def reset_write_intent(token: Token) -> None:
+    _write_intent.reset(token)
+
+
+@contextmanager
+def write_intent() -> Iterator[None]:
+    """Run a block whose transactions will write (background jobs, CLI commands)."""
+    token = set_write_intent(True)
+    try:
+        yield
+    finally:
+        reset_write_intent(token)
+
+
+def configure_engine(engine: Engine, config: Mapping[str, Any]) -> None:
+    """
+    Apply the profile's SQLite connection settings to a new engine and
+    make its pool safe to inherit across fork.
+
+    With ``gunicorn --preload`` the app, and any connection it opened while
+    starting, is created once in the master and forked into every worker;
+    each child drops the inherited connections (without closing them under
+    the parent) and opens its own.
+
+    On SQLite every new connection gets the profile's pragmas (WAL journal,
+    synchronous, busy_timeout, mmap and page cache sizes, ...), and the
+    driver's own transaction handling is replaced so that SQLAlchemy emits
+    BEGIN itself (see ``_begin_statement``).
+    """
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
+
+    if engine.dialect.name != 'sqlite':
+        return
+
+    profile = config['ENGINE_PROFILES'][config.get('DB_ENGINE_PROFILE', 'web')]
+    pragmas = profile.get('sqlite_pragmas', {})
+    begin_mode = profile.get('sqlite_begin', 'deferred')
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Autocommit at the driver level: pysqlite would otherwise issue its
+        # own deferred BEGIN before the first write and none for SAVEPOINT
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, 'begin')
+    def _begin(connection):
+        # A connection may override the profile with the sqlite_begin
+        # execution option, e.g. a read-only probe inside write_intent()
+        mode = connection.get_execution_options().get('sqlite_begin', begin_mode)
+        connection.exec_driver_sql(_begin_statement(mode))
+
+
+def _begin_statement(begin_mode: str) -> str:
+    """
+    BEGIN for a new SQLite transaction.
+
+    A deferred transaction that reads and then writes has to upgrade its
+    lock; under WAL that fails at once with "database is locked" if another
+    writer committed in between, without waiting on busy_timeout. BEGIN
+    IMMEDIATE takes the write lock up front, waiting up to busy_timeout, so
+    write units of work queue behind each other instead of failing, while
+    readers stay on deferred transactions and never block on writers.
+
+    ``immediate`` does this for every transaction (batch processes),
+    ``auto`` only where write intent was declared (unsafe HTTP methods,
+    background jobs), ``deferred`` never.
+    """
+    if begin_mode == 'immediate' or (begin_mode == 'auto' and _write_intent.get()):
+        return "BEGIN IMMEDIATE"
+    return "BEGIN"
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    Current pool usage for an engine.
+
+    Returns:
+        Dictionary with the pool size and overflow limit, connections in use,
+        idle and in overflow, and checkout count, timeouts and wait times
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {'pool_class': type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            # Negative while the pool has not yet opened all of its pool_size connections
+            overflow=max(pool.overflow(), 0),
+        )
+
+    if isinstance(pool, InstrumentedQueuePool):
+        with pool._metrics_lock:
+            stats.update(
+                checkouts=pool.checkouts,
+                checkout_timeouts=pool.checkout_timeouts,
+                checkout_wait_total_seconds=round(pool.checkout_wait_total, 6),
+                checkout_wait_avg_seconds=round(pool.checkout_wait_total / pool.checkouts, 6) if pool.checkouts else 0.0,
+                checkout_wait_max_seconds=round(pool.checkout_wait_max, 6),
+            )
+
+    return stats
+
+
+def _pool_size(config: Mapping[str, Any]) -> int:
+    background_threads = 0
+    if config.get('OUTBOX_ENABLED') and config.get('OUTBOX_RUN_DISPATCHER'):
+        background_threads += config.get('OUTBOX_WORKERS', 1)
+    if config.get('EVENT_BUS_DISPATCH_MODE') == 'concurrent':
+        background_threads += config.get('EVENT_BUS_MAX_WORKERS', 4)
+    if config.get('EVENT_BUS_TRANSPORT', 'inprocess') != 'inprocess':
+        # Shared and fanout relay consumers
+        background_threads += 2
+    if config.get('SCHEDULER_ENABLED'):
+        # The job's session plus the connection holding its advisory lock
+        background_threads += 2
+    return max(config.get('GUNICORN_THREADS', 1), 1) + background_threads
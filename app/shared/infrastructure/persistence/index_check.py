@@ -0,0 +1,259 @@
+"""
+EXPLAIN-based check that the hot queries of the query services use an index.
+
+Run it against a migrated database with ``flask check-indexes``. It exits
+non-zero when a query falls back to a full table scan, so it can gate a
+deployment or a CI job.
+
+Works on SQLite (``EXPLAIN QUERY PLAN``) and PostgreSQL
+(``EXPLAIN (FORMAT JSON)`` with sequential scans disabled, so that the
+planner's preference for seq scans on small tables does not hide a
+missing index).
+"""
+
+import json
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable, List
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.dataBase import db
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.services.inventory_service.infrastructure.persistence.models import InventoryModel, StockMovementModel
+from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.infrastructure.persistence.models import InvoiceItemModel, InvoiceModel
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models import OrderItemModel, OrderModel
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+
+logger = logging.getLogger(__name__)
+
+# Plan nodes that read a relation through an index on PostgreSQL
+_PG_INDEX_NODES = {"Index Scan", "Index Only Scan", "Bitmap Heap Scan"}
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN wrapper that keeps the wrapped statement's bind processing."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    if compiler.dialect.name == "postgresql":
+        prefix = "EXPLAIN (FORMAT JSON) "
+    else:
+        prefix = "EXPLAIN QUERY PLAN "
+    return prefix + compiler.process(element.statement, **kw)
+
+
+@dataclass
+class HotQuery:
+    name: str
+    table: str
+    statement: Any
+
+
+@dataclass
+class IndexCheckResult:
+    name: str
+    table: str
+    uses_index: bool
+    plan: List[str] = field(default_factory=list)
+
+
+def hot_queries() -> List[HotQuery]:
+    """The lookups the query services and repositories run on every request."""
+    some_id = uuid.uuid4()
+    now = datetime.now()
+    return [
+        HotQuery(
+            "inventory by product",
+            "inventory",
+            select(InventoryModel).where(InventoryModel.product_id == some_id),
+        ),
+        HotQuery(
+            "stock check batch lookup",
+            "inventory",
+            select(InventoryModel).where(InventoryModel.product_id.in_([some_id, uuid.uuid4()])),
+        ),
+        HotQuery(
+            "expiring inventory",
+            "inventory",
+            select(InventoryModel).where(InventoryModel.expiry_date <= now),
+        ),
+        HotQuery(
+            "orders listing",
+            "orders",
+            select(OrderModel).order_by(OrderModel.created_at.desc(), OrderModel.id.desc()).limit(20),
+        ),
+        HotQuery(
+            "orders by user",
+            "orders",
+            select(OrderModel)
+            .where(OrderModel.user_id == some_id)
+            .order_by(OrderModel.created_at.desc())
+            .limit(20),
+        ),
+        HotQuery(
+            "orders by status",
+            "orders",
+            select(OrderModel)
+            .where(OrderModel.status == OrderStatus.PENDING)
+            .order_by(OrderModel.created_at.desc())
+            .limit(20),
+        ),
+        HotQuery(
+            "order items by order",
+            "order_items",
+            select(OrderItemModel).where(OrderItemModel.order_id == some_id),
+        ),
+        HotQuery(
+            "stock movements by inventory",
+            "stock_movements",
+            select(StockMovementModel)
+            .where(StockMovementModel.inventory_id == some_id)
+            .order_by(StockMovementModel.created_at.desc()),
+        ),
+        HotQuery(
+            "stock movements by reference",
+            "stock_movements",
+            select(StockMovementModel).where(StockMovementModel.reference_id == some_id),
+        ),
+        HotQuery(
+            "invoices by order",
+            "invoices",
+            select(InvoiceModel).where(InvoiceModel.order_id == str(some_id)),
+        ),
+        HotQuery(
+            "invoices by user",
+            "invoices",
+            select(InvoiceModel).where(InvoiceModel.user_id == str(some_id)),
+        ),
+        HotQuery(
+            "overdue invoices",
+            "invoices",
+            select(InvoiceModel).where(
+                InvoiceModel.status == InvoiceStatus.PENDING,
+                InvoiceModel.due_date < now,
+            ),
+        ),
+        HotQuery(
+            "invoices listing",
+            "invoices",
+            select(InvoiceModel).order_by(InvoiceModel.created_at.desc()).limit(20),
+        ),
+        HotQuery(
+            "invoice items by invoice",
+            "invoice_items",
+            select(InvoiceItemModel).where(InvoiceItemModel.invoice_id == str(some_id)),
+        ),
+        HotQuery(
+            "subcategories",
+            "categories",
+            select(Category).where(Category.parent_id == some_id),
+        ),
+        HotQuery(
+            "products listing",
+            "products",
+            select(ProductModel).order_by(ProductModel.name, ProductModel.id).limit(20),
+        ),
+        HotQuery(
+            "products by category",
+            "products",
+            select(ProductModel).where(ProductModel.category_id == some_id),
+        ),
+    ]
+
+
+def check_indexes(connection, queries: Iterable[HotQuery] = None) -> List[IndexCheckResult]:
+    """
+    EXPLAIN each hot query and report whether its table is read through an index.
+
+    Args:
+        connection: An open SQLAlchemy connection
+        queries: Queries to check, defaults to hot_queries()
+
+    Returns:
+        One result per query
+    """
+    dialect = connection.dialect.name
+    queries = hot_queries() if queries is None else queries
+
+    results = []
+    with connection.begin() as transaction:
+        if dialect == "postgresql":
+            connection.execute(text("SET LOCAL enable_seqscan = off"))
+
+        for query in queries:
+            rows = connection.execute(Explain(query.statement)).fetchall()
+            if dialect == "postgresql":
+                result = _check_postgres_plan(query, rows[0][0])
+            else:
+                result = _check_sqlite_plan(query, rows)
+            results.append(result)
+
+        transaction.rollback()
+
+    return results
+
+
+def _check_sqlite_plan(query: HotQuery, rows) -> IndexCheckResult:
+    # Row layout: (id, parent, notused, detail), e.g. "SEARCH orders USING INDEX ix_..."
+    details = [row[-1] for row in rows]
+    table_steps = [
+        detail for detail in details
+        if detail.startswith(("SCAN", "SEARCH"))
+        and detail.replace(" TABLE ", " ").split()[1] == query.table
+    ]
+    uses_index = bool(table_steps) and all("USING" in step for step in table_steps)
+    return IndexCheckResult(query.name, query.table, uses_index, details)
+
+
+def _check_postgres_plan(query: HotQuery, plan) -> IndexCheckResult:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes = []
+    stack = [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+
+    table_nodes = [node for node in nodes if node.get("Relation Name") == query.table]
+    uses_index = bool(table_nodes) and all(node["Node Type"] in _PG_INDEX_NODES for node in table_nodes)
+    details = [
+        f"{node['Node Type']} {node.get('Relation Name', '')} {node.get('Index Name', '')}".strip()
+        for node in nodes
+    ]
+    return IndexCheckResult(query.name, query.table, uses_index, details)
+
+
+@click.command("check-indexes")
+@with_appcontext
+def check_indexes_command():
+    """Fail if any hot query would scan its whole table."""
+    with db.engine.connect() as connection:
+        results = check_indexes(connection)
+
+    failures = [result for result in results if not result.uses_index]
+    for result in results:
+        status = "ok" if result.uses_index else "NO INDEX"
+        click.echo(f"[{status}] {result.name} ({result.table}): {' | '.join(result.plan)}")
+
+    if failures:
+        raise click.ClickException(
+            f"{len(failures)} hot queries do not use an index: "
+            + ", ".join(result.name for result in failures)
+        )
+    click.echo(f"All {len(results)} hot queries use an index")
@@ -1,8 +1,9 @@
 from pydoc import importfile
 from app.services.auth_service.infrastructure.persistence.models import UserModel
 from app.services.inventory_service.infrastructure.persistence.models import InventoryModel, StockMovementModel
-from app.services.order_service.infrastructure.persistence.models import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models import OrderItemModel, OrderModel, ArchivedOrderModel, ArchivedOrderItemModel, OrderArchiveCheckpointModel
 from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
 from app.services.invoice_service.infrastructure.persistence.models import InvoiceModel, InvoiceItemModel, PaymentDetailsModel
 from app.services.category_service.infrastructure.persistence.models.category import Category
-__all__ = ['UserModel', 'InventoryModel', 'ProductModel', 'StockMovementModel', 'OrderItemModel', 'OrderModel', 'InvoiceModel', 'InvoiceItemModel', 'PaymentDetailsModel', 'Category'   ]
\ No newline at end of file
+from app.shared.infrastructure.outbox.models import OutboxEventModel, DeadLetterEventModel
+__all__ = ['UserModel', 'InventoryModel', 'ProductModel', 'StockMovementModel', 'OrderItemModel', 'OrderModel', 'ArchivedOrderModel', 'ArchivedOrderItemModel', 'OrderArchiveCheckpointModel', 'InvoiceModel', 'InvoiceItemModel', 'PaymentDetailsModel', 'Category', 'OutboxEventModel', 'DeadLetterEventModel'   ]
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Instead of ``OFFSET n``, a page is located by seeking past the sort key of
+the last row of the previous page, so deep pages cost the same as the first
+one. The sort key is handed to clients as an opaque, URL-safe cursor.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+
+from app.shared.domain.exceptions.common_errors import ValidationError
+
+# (column, direction) pairs, e.g. ((OrderModel.created_at, "desc"), (OrderModel.id, "desc"))
+KeysetOrder = Sequence[Tuple[Any, str]]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of a row as an opaque cursor string."""
+    payload = [_encode_value(value) for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_length: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValidationError: If the cursor is malformed or does not match the sort key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_value(item) for item in payload]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValidationError(f"Invalid pagination cursor: {str(e)}")
+
+    if len(values) != expected_length:
+        raise ValidationError("Invalid pagination cursor: sort key mismatch")
+    return values
+
+
+def apply_keyset_order(query, order: KeysetOrder):
+    """Apply ORDER BY for the keyset columns."""
+    return query.order_by(*[
+        column.desc() if direction == "desc" else column.asc()
+        for column, direction in order
+    ])
+
+
+def seek_condition(order: KeysetOrder, values: Sequence[Any]):
+    """
+    Build the WHERE clause selecting rows strictly after the given sort key.
+
+    For ``(a DESC, id DESC)`` this is ``a < :a OR (a = :a AND id < :id)``.
+    """
+    clauses = []
+    for index, (column, direction) in enumerate(order):
+        equal_prefix = [
+            prefix_column == values[prefix_index]
+            for prefix_index, (prefix_column, _) in enumerate(order[:index])
+        ]
+        step = column < values[index] if direction == "desc" else column > values[index]
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+
+def paginate_keyset(
+    query,
+    order: KeysetOrder,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of rows after ``cursor``.
+
+    Args:
+        query: Filtered, unordered query
+        order: Keyset columns; the last one must be unique (usually the primary key)
+        limit: Page size
+        cursor: Cursor returned with the previous page, or None for the first page
+
+    Returns:
+        Tuple of the page's rows and the cursor for the next page (None on the last page)
+    """
+    if cursor:
+        query = query.filter(seek_condition(order, decode_cursor(cursor, len(order))))
+
+    # Fetch one extra row to know whether another page exists
+    rows = apply_keyset_order(query, order).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor([getattr(last, column.key) for column, _ in order])
+    return rows, next_cursor
+
+
+def _encode_value(value: Any) -> List[Any]:
+    if value is None:
+        return ["n", None]
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    if isinstance(value, UUID):
+        return ["u", str(value)]
+    if isinstance(value, Enum):
+        return ["s", value.value]
+    if isinstance(value, Decimal):
+        return ["dec", str(value)]
+    return ["v", value]
+
+
+def _decode_value(item: List[Any]) -> Any:
+    kind, value = item
+    if kind == "n":
+        return None
+    if kind == "dt":
+        return datetime.fromisoformat(value)
+    if kind == "d":
+        return date.fromisoformat(value)
+    if kind == "u":
+        return UUID(value)
+    if kind == "dec":
+        return Decimal(value)
+    if kind in ("s", "v"):
+        return value
+    raise ValueError(f"unknown cursor value type '{kind}'")
@@ -0,0 +1,90 @@
+"""
+Schema management, kept out of the request-serving startup path.
+
+Production deployments run ``flask migrate-db`` once per release, before
+the workers start: it creates any missing tables from the models and then
+applies the Alembic migrations. Workers started with SCHEMA_AUTO_CREATE off
+then boot without introspecting the database at all, so a rolling restart
+does not have every worker hit the database at the same instant.
+
+SCHEMA_AUTO_CREATE keeps the old behaviour (check and create the tables on
+every boot) for local development.
+"""
+
+import logging
+import os
+
+import click
+from flask import Flask
+from flask.cli import with_appcontext
+from sqlalchemy import inspect
+
+from app.dataBase import db
+
+logger = logging.getLogger(__name__)
+
+
+def create_missing_tables() -> None:
+    """Create the tables of every registered model that do not exist yet."""
+    # Registers every model on db.metadata
+    import app.shared.infrastructure.persistence.models  # noqa: F401
+
+    db.create_all()
+
+
+def bootstrap_schema(app: Flask) -> None:
+    """
+    Create the tables on boot if the database has none (SCHEMA_AUTO_CREATE).
+
+    Failures are logged, not raised, so a development server still starts
+    against a database it cannot manage.
+    """
+    with app.app_context():
+        try:
+            existing_tables = inspect(db.engine).get_table_names()
+            if existing_tables:
+                logger.info(f"Database already has {len(existing_tables)} tables")
+                return
+            create_missing_tables()
+            logger.info("Database tables created successfully")
+        except Exception as e:
+            if _ensure_sqlite_directory(app.config.get('SQLALCHEMY_DATABASE_URI', '')):
+                try:
+                    create_missing_tables()
+                    logger.info("Database tables created successfully after directory creation")
+                    return
+                except Exception as retry_error:
+                    e = retry_error
+            if "already exists" in str(e).lower():
+                logger.info("Tables already exist - continuing with existing database")
+            else:
+                logger.warning(f"Database initialization issue: {e} - continuing anyway")
+
+
+def _ensure_sqlite_directory(uri: str) -> bool:
+    """Create the directory of a SQLite database file; True if it was missing."""
+    if 'sqlite:///' not in uri:
+        return False
+    db_dir = os.path.dirname(uri.replace('sqlite:///', ''))
+    if not db_dir or os.path.exists(db_dir):
+        return False
+    os.makedirs(db_dir, exist_ok=True)
+    logger.info(f"Created database directory: {db_dir}")
+    return True
+
+
+@click.command("migrate-db")
+@with_appcontext
+def migrate_db_command():
+    """Create missing tables, then apply the Alembic migrations."""
+    from flask import current_app
+    from flask_migrate import upgrade
+    from app.extensions import init_migrate
+
+    init_migrate(current_app)
+    _ensure_sqlite_directory(current_app.config.get('SQLALCHEMY_DATABASE_URI', ''))
+    create_missing_tables()
+    # The migrations check for existing tables and indexes, so they are safe
+    # on a database create_all has just brought up to date
+    upgrade()
+    click.echo("Database schema is up to date")
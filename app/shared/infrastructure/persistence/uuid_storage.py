@@ -0,0 +1,140 @@
+"""
+Convert the UUID columns of an existing SQLite database between text and
+binary storage (see app.shared.database_types).
+
+To switch a database to 16-byte UUIDs: stop the workers, set
+SQLITE_UUID_STORAGE=binary, run ``flask convert-uuid-storage`` and start
+the workers again. The command rewrites every UUID value that is not yet
+in the configured storage, so it is safe to re-run and also converts back
+to text.
+
+SQLite types values per row rather than per column, so the values are
+rewritten in place and the declared column type is left alone. Tables
+created from the models after the switch declare BLOB columns.
+"""
+
+import uuid
+from typing import Callable, Dict, List, Tuple
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from app.dataBase import db
+from app.shared.database_types import UUID, uuid_storage, uuid_to_bytes
+
+
+def uuid_columns(engine: Engine) -> Dict[str, List[str]]:
+    """UUID columns of every model table present in the database, by table name."""
+    # Registers every model on db.metadata
+    import app.shared.infrastructure.persistence.models  # noqa: F401
+
+    existing_tables = set(inspect(engine).get_table_names())
+    columns: Dict[str, List[str]] = {}
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        names = [column.name for column in table.columns if isinstance(column.type, UUID)]
+        if names:
+            columns[table.name] = names
+    return columns
+
+
+def convert_uuid_storage(engine: Engine, storage: str, batch_size: int = 5000) -> Dict[str, int]:
+    """
+    Rewrite every UUID value into ``storage`` ('text' or 'binary').
+
+    Runs in a single transaction with foreign key enforcement off (keys and
+    the rows referencing them change one statement at a time), and checks
+    the foreign keys before committing.
+
+    Returns:
+        Number of values rewritten per ``table.column``
+    """
+    if engine.dialect.name != 'sqlite':
+        raise click.ClickException("UUID storage only applies to SQLite databases")
+
+    source_type, convert = _conversion(storage)
+    columns = uuid_columns(engine)
+    converted: Dict[str, int] = {}
+
+    raw = engine.raw_connection()
+    try:
+        connection = raw.driver_connection
+        # Transactions are managed with explicit BEGIN/COMMIT below
+        connection.isolation_level = None
+        cursor = connection.cursor()
+        # Only takes effect outside a transaction
+        cursor.execute("PRAGMA foreign_keys=OFF")
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            for table, names in columns.items():
+                for name in names:
+                    converted[f"{table}.{name}"] = _convert_column(cursor, table, name, source_type, convert, batch_size)
+
+            violations = cursor.execute("PRAGMA foreign_key_check").fetchall()
+            if violations:
+                raise click.ClickException(
+                    f"Conversion would break {len(violations)} foreign keys, first: {violations[0]}"
+                )
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    finally:
+        raw.close()
+
+    return converted
+
+
+def _conversion(storage: str) -> Tuple[str, Callable]:
+    """SQLite typeof() of the values to rewrite, and how to rewrite them."""
+    if storage == 'binary':
+        return 'text', uuid_to_bytes
+    if storage == 'text':
+        return 'blob', lambda value: str(uuid.UUID(bytes=value))
+    raise click.ClickException(f"Unknown UUID storage '{storage}'")
+
+
+def _convert_column(cursor, table: str, name: str, source_type: str, convert: Callable, batch_size: int) -> int:
+    total = 0
+    # Rewritten rows no longer match typeof(), so every SELECT sees the next batch
+    select_sql = f'SELECT rowid, "{name}" FROM "{table}" WHERE typeof("{name}") = ? LIMIT ?'
+    update_sql = f'UPDATE "{table}" SET "{name}" = ? WHERE rowid = ?'
+    while True:
+        rows = cursor.execute(select_sql, (source_type, batch_size)).fetchall()
+        if not rows:
+            return total
+        try:
+            cursor.executemany(update_sql, [(convert(value), rowid) for rowid, value in rows])
+        except ValueError as e:
+            raise click.ClickException(f"{table}.{name} holds a value that is not a UUID: {e}")
+        total += len(rows)
+
+
+@click.command("convert-uuid-storage")
+@click.option("--batch-size", type=int, default=5000, help="Rows rewritten per statement batch")
+@click.option("--vacuum/--no-vacuum", default=True, help="Rebuild the database file afterwards to reclaim the space")
+@with_appcontext
+def convert_uuid_storage_command(batch_size, vacuum):
+    """Rewrite the UUID columns of a SQLite database into SQLITE_UUID_STORAGE."""
+    storage = uuid_storage()
+    converted = convert_uuid_storage(db.engine, storage, batch_size)
+    for column, count in converted.items():
+        if count:
+            click.echo(f"{column}: {count} values")
+    click.echo(f"Converted {sum(converted.values())} UUID values to {storage} storage")
+
+    if vacuum and any(converted.values()):
+        # Indexes only shrink once their pages are rebuilt
+        raw = db.engine.raw_connection()
+        try:
+            raw.driver_connection.isolation_level = None
+            raw.driver_connection.execute("VACUUM")
+        finally:
+            raw.close()
+        click.echo("Database vacuumed")
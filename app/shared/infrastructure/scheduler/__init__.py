@@ -0,0 +1,3 @@
+from app.shared.infrastructure.scheduler.advisory_lock import advisory_lock_key, try_advisory_lock
+from app.shared.infrastructure.scheduler.periodic_scheduler import PeriodicScheduler, ScheduledJob, run_scheduler_command
+__all__ = ['advisory_lock_key', 'try_advisory_lock', 'PeriodicScheduler', 'ScheduledJob', 'run_scheduler_command']
@@ -0,0 +1,79 @@
+import hashlib
+import logging
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(name: str) -> int:
+    """Stable signed 64-bit key for a lock name, as pg_try_advisory_lock expects."""
+    digest = hashlib.sha256(name.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big', signed=True)
+
+
+@contextmanager
+def try_advisory_lock(engine: Engine, name: str) -> Iterator[bool]:
+    """
+    Try to take a cluster-wide, non-blocking lock named ``name``.
+
+    Yields True while the lock is held by this process, False if someone
+    else holds it. On PostgreSQL this is a session advisory lock held on a
+    dedicated connection (released when the block exits, or by the server
+    if the process dies). SQLite databases live on one host, so a lock file
+    next to the database file serves the same purpose; in-memory databases
+    are private to the process and always lock.
+    """
+    if engine.dialect.name == 'postgresql':
+        with _postgres_lock(engine, name) as acquired:
+            yield acquired
+    elif engine.dialect.name == 'sqlite':
+        with _file_lock(engine, name) as acquired:
+            yield acquired
+    else:
+        logger.warning(f"No advisory lock for {engine.dialect.name}; running '{name}' unguarded")
+        yield True
+
+
+@contextmanager
+def _postgres_lock(engine: Engine, name: str) -> Iterator[bool]:
+    key = advisory_lock_key(name)
+    with engine.connect() as connection:
+        acquired = bool(connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar())
+        # Autobegin opened a transaction; do not hold it while the job runs
+        connection.commit()
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                connection.commit()
+
+
+@contextmanager
+def _file_lock(engine: Engine, name: str) -> Iterator[bool]:
+    database = engine.url.database
+    if not database or database == ':memory:' or fcntl is None:
+        yield True
+        return
+
+    path = f"{os.path.abspath(database)}.{name}.lock"
+    with open(path, 'a') as handle:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
@@ -0,0 +1,165 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+
+from app.dataBase import db
+from app.shared.infrastructure.persistence.engine import write_intent
+from app.shared.infrastructure.scheduler.advisory_lock import try_advisory_lock
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    func: Callable[[], object]
+    interval: float
+    # Run once right after the scheduler starts instead of one interval later
+    run_at_start: bool = True
+    next_run: float = 0.0
+    runs: int = 0
+    skipped: int = 0
+    failures: int = 0
+    last_duration: float = 0.0
+    last_error: Optional[str] = field(default=None)
+
+
+class PeriodicScheduler:
+    """
+    Runs registered jobs at fixed intervals on one background thread.
+
+    Every gunicorn worker may run a scheduler; each job run first takes the
+    advisory lock named after the job, so across all workers and hosts only
+    one of them executes a given job at a time and the others skip that
+    round. Jobs run inside an application context and their session is
+    committed on success and rolled back on failure.
+    """
+
+    def __init__(self, app: Flask, tick: float = 1.0, jitter: float = 0.1):
+        self._app = app
+        self._tick = tick
+        # Fraction of the interval added at random so workers do not all race for the lock at once
+        self._jitter = jitter
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_job(self, name: str, func: Callable[[], object], interval: float, run_at_start: bool = True) -> None:
+        """Register ``func`` to run every ``interval`` seconds under the lock ``name``."""
+        self._jobs[name] = ScheduledJob(name=name, func=func, interval=interval, run_at_start=run_at_start)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """Start the scheduler thread (idempotent)."""
+        with self._start_lock:
+            if self._thread is not None or not self._jobs:
+                return
+            now = time.monotonic()
+            for job in self._jobs.values():
+                job.next_run = now if job.run_at_start else now + self._delay(job)
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="periodic-scheduler", daemon=True)
+            self._thread.start()
+        logger.info(f"Scheduler started with jobs: {', '.join(self._jobs)}")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def run_job(self, name: str) -> bool:
+        """
+        Run a job now, if its lock is free.
+
+        Returns:
+            True if the job ran, False if another worker holds its lock
+        """
+        job = self._jobs[name]
+        with self._app.app_context(), write_intent():
+            with try_advisory_lock(db.engine, f"scheduler:{job.name}") as acquired:
+                if not acquired:
+                    job.skipped += 1
+                    logger.debug(f"Skipping job {job.name}, another worker is running it")
+                    return False
+
+                started = time.perf_counter()
+                try:
+                    job.func()
+                    db.session.commit()
+                    job.last_error = None
+                except Exception as e:
+                    db.session.rollback()
+                    job.failures += 1
+                    job.last_error = str(e)
+                    logger.error(f"Scheduled job {job.name} failed: {str(e)}", exc_info=True)
+                finally:
+                    job.runs += 1
+                    job.last_duration = time.perf_counter() - started
+                    db.session.remove()
+                return True
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {
+            job.name: {
+                "interval": job.interval,
+                "runs": job.runs,
+                "skipped": job.skipped,
+                "failures": job.failures,
+                "last_duration": round(job.last_duration, 6),
+                "last_error": job.last_error,
+            }
+            for job in self._jobs.values()
+        }
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            for job in self._due_jobs(now):
+                try:
+                    self.run_job(job.name)
+                except Exception as e:
+                    # Lock or connection problems; try again next interval
+                    logger.error(f"Could not run scheduled job {job.name}: {str(e)}", exc_info=True)
+                job.next_run = time.monotonic() + self._delay(job)
+            self._stop_event.wait(self._tick)
+
+    def _due_jobs(self, now: float) -> List[ScheduledJob]:
+        return [job for job in self._jobs.values() if job.next_run <= now]
+
+    def _delay(self, job: ScheduledJob) -> float:
+        return job.interval * (1 + random.uniform(0, self._jitter))
+
+
+@click.command("run-scheduler")
+@click.option("--once", is_flag=True, help="Run every job once and exit")
+@with_appcontext
+def run_scheduler_command(once):
+    """Run the periodic jobs from a dedicated process until interrupted."""
+    from app.extensions import build_scheduler
+
+    scheduler = build_scheduler(current_app._get_current_object())
+    if once:
+        for name in scheduler.stats():
+            ran = scheduler.run_job(name)
+            click.echo(f"{name}: {'done' if ran else 'skipped, locked by another process'}")
+        return
+
+    scheduler.start()
+    click.echo("Scheduler running, press Ctrl+C to stop")
+    try:
+        while scheduler.running:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        scheduler.stop()
@@ -0,0 +1,2 @@
+from app.shared.infrastructure.serialization.json_provider import OrjsonProvider, init_json_provider
+__all__ = ['OrjsonProvider', 'init_json_provider']
@@ -0,0 +1,70 @@
+import decimal
+import logging
+from typing import Any
+
+from flask import Flask
+from flask.json.provider import JSONProvider
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _default(o: Any) -> Any:
+    """Types orjson does not serialize itself"""
+    if isinstance(o, decimal.Decimal):
+        # Same as Flask's default provider: exact, never a rounded float
+        return str(o)
+    if isinstance(o, BaseModel):
+        return o.model_dump()
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    UUID, datetime/date, Enum and dataclasses are serialized natively by
+    orjson; Decimal (as a string), pydantic models and sets go through
+    ``_default``. Unlike Flask's default provider, datetimes are ISO 8601
+    (as the marshmallow schemas already emit them) and keys are not sorted.
+    """
+
+    mimetype = "application/json"
+    # UUID/Enum dictionary keys are allowed, as with the default provider's str() fallback
+    options = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._dumps(obj, kwargs.get("indent")).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if self._app.debug else None
+        return self._app.response_class(self._dumps(obj, indent), mimetype=self.mimetype)
+
+    def _dumps(self, obj: Any, indent: Any = None) -> bytes:
+        options = self.options | orjson.OPT_INDENT_2 if indent else self.options
+        return orjson.dumps(obj, default=_default, option=options)
+
+
+def init_json_provider(app: Flask) -> None:
+    """Install the JSON provider named by JSON_PROVIDER ('orjson' or 'default')"""
+    name = app.config.get('JSON_PROVIDER', 'orjson')
+    if name == 'orjson':
+        if orjson is None:
+            logger.warning("JSON_PROVIDER is 'orjson' but orjson is not installed; using Flask's default provider")
+            return
+        app.json = OrjsonProvider(app)
+    elif name != 'default':
+        raise ValueError(f"Unknown JSON_PROVIDER '{name}', expected 'orjson' or 'default'")
@@ -0,0 +1,91 @@
+"""add indexes for hot lookup columns
+
+Databases have so far been created with db.create_all(), so this is the
+first revision. Indexes that already exist (e.g. on a database created
+by create_all() from the current models) are skipped, which makes the
+upgrade safe to run against both old and fresh schemas.
+
+Revision ID: 3f2a9c1d7b4e
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b4e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (table, index name, columns)
+INDEXES = [
+    ('inventory', 'ix_inventory_expiry_date', ['expiry_date']),
+    ('orders', 'ix_orders_created_at_id', ['created_at', 'id']),
+    ('orders', 'ix_orders_user_id_created_at', ['user_id', 'created_at']),
+    ('orders', 'ix_orders_status_created_at', ['status', 'created_at']),
+    ('order_items', 'ix_order_items_order_id', ['order_id']),
+    ('stock_movements', 'ix_stock_movements_inventory_id_created_at', ['inventory_id', 'created_at']),
+    ('stock_movements', 'ix_stock_movements_reference_id', ['reference_id']),
+    ('invoices', 'ix_invoices_order_id', ['order_id']),
+    ('invoices', 'ix_invoices_user_id', ['user_id']),
+    ('invoices', 'ix_invoices_status_due_date', ['status', 'due_date']),
+    ('invoices', 'ix_invoices_due_date', ['due_date']),
+    ('invoices', 'ix_invoices_created_at', ['created_at']),
+    ('invoice_items', 'ix_invoice_items_invoice_id', ['invoice_id']),
+    ('categories', 'ix_categories_parent_id', ['parent_id']),
+    ('products', 'ix_products_name_id', ['name', 'id']),
+    ('products', 'ix_products_category_id', ['category_id']),
+]
+
+INVENTORY_PRODUCT_UNIQUE = 'uq_inventory_product_id'
+
+
+def _existing_indexes(inspector, table):
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def _existing_unique_constraints(inspector, table):
+    return {constraint['name'] for constraint in inspector.get_unique_constraints(table)}
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    for table, name, columns in INDEXES:
+        if name not in _existing_indexes(inspector, table):
+            op.create_index(name, table, columns)
+
+    if INVENTORY_PRODUCT_UNIQUE not in _existing_unique_constraints(inspector, 'inventory'):
+        duplicates = bind.execute(sa.text(
+            "SELECT product_id FROM inventory "
+            "WHERE product_id IS NOT NULL "
+            "GROUP BY product_id HAVING COUNT(*) > 1"
+        )).fetchall()
+        if duplicates:
+            raise RuntimeError(
+                f"Cannot add {INVENTORY_PRODUCT_UNIQUE}: {len(duplicates)} products have more "
+                f"than one inventory row (e.g. {duplicates[0][0]}). Merge them and rerun the upgrade."
+            )
+        with op.batch_alter_table('inventory') as batch_op:
+            batch_op.create_unique_constraint(INVENTORY_PRODUCT_UNIQUE, ['product_id'])
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if INVENTORY_PRODUCT_UNIQUE in _existing_unique_constraints(inspector, 'inventory'):
+        with op.batch_alter_table('inventory') as batch_op:
+            batch_op.drop_constraint(INVENTORY_PRODUCT_UNIQUE, type_='unique')
+
+    # ix_invoices_order_id / ix_invoices_user_id predate this revision (index=True on the model)
+    for table, name, _ in reversed(INDEXES):
+        if name in ('ix_invoices_order_id', 'ix_invoices_user_id'):
+            continue
+        if name in _existing_indexes(inspector, table):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,34 @@
+"""add users.authz_version
+
+Bumped on role changes and revocation; access and refresh tokens carry the
+version they were issued under.
+
+Revision ID: 5e9b7a3c0d18
+Revises: c4d1e8a6f203
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e9b7a3c0d18'
+down_revision = 'c4d1e8a6f203'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if 'users' not in inspector.get_table_names():
+        return
+
+    columns = {column['name'] for column in inspector.get_columns('users')}
+    if 'authz_version' not in columns:
+        op.add_column('users', sa.Column('authz_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('authz_version')
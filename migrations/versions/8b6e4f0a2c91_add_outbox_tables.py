@@ -0,0 +1,59 @@
+"""add transactional outbox and dead letter tables
+
+Revision ID: 8b6e4f0a2c91
+Revises: 3f2a9c1d7b4e
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b6e4f0a2c91'
+down_revision = '3f2a9c1d7b4e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing_tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'outbox' not in existing_tables:
+        op.create_table(
+            'outbox',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('event_id', sa.String(length=36), nullable=False, unique=True),
+            sa.Column('event_type', sa.String(length=255), nullable=False),
+            sa.Column('payload', sa.Text(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+            sa.Column('locked_by', sa.String(length=128), nullable=True),
+            sa.Column('locked_until', sa.DateTime(), nullable=True),
+            sa.Column('last_error', sa.Text(), nullable=True)
+        )
+        op.create_index('ix_outbox_next_attempt_at_id', 'outbox', ['next_attempt_at', 'id'])
+        op.create_index('ix_outbox_locked_by', 'outbox', ['locked_by'])
+
+    if 'outbox_dead_letter' not in existing_tables:
+        op.create_table(
+            'outbox_dead_letter',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('event_id', sa.String(length=36), nullable=False),
+            sa.Column('event_type', sa.String(length=255), nullable=False),
+            sa.Column('payload', sa.Text(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.Column('failed_at', sa.DateTime(), nullable=False),
+            sa.Column('attempts', sa.Integer(), nullable=False),
+            sa.Column('last_error', sa.Text(), nullable=True)
+        )
+        op.create_index('ix_outbox_dead_letter_event_id', 'outbox_dead_letter', ['event_id'])
+
+
+def downgrade():
+    op.drop_index('ix_outbox_dead_letter_event_id', table_name='outbox_dead_letter')
+    op.drop_table('outbox_dead_letter')
+    op.drop_index('ix_outbox_locked_by', table_name='outbox')
+    op.drop_index('ix_outbox_next_attempt_at_id', table_name='outbox')
+    op.drop_table('outbox')
@@ -0,0 +1,92 @@
+"""add order archive tables
+
+orders_archive and order_items_archive mirror orders and order_items
+(plus archived_at) so `flask archive-orders` can move rows with
+INSERT ... SELECT; order_archive_checkpoints lets an interrupted run
+resume where it stopped.
+
+Revision ID: a7c3e5f9b214
+Revises: 5e9b7a3c0d18
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e5f9b214'
+down_revision = '5e9b7a3c0d18'
+branch_labels = None
+depends_on = None
+
+
+ORDER_STATUSES = ('PENDING', 'CONFIRMED', 'COMPLETED', 'CANCELLED', 'FAILED')
+
+
+def _uuid(bind):
+    # Same storage as app.shared.database_types.UUID
+    return postgresql.UUID(as_uuid=True) if bind.dialect.name == 'postgresql' else sa.String(length=36)
+
+
+def _order_status(bind):
+    if bind.dialect.name == 'postgresql':
+        # Reuse the orders.status enum so INSERT ... SELECT needs no cast
+        return postgresql.ENUM(*ORDER_STATUSES, name='orderstatus', create_type=False)
+    return sa.Enum(*ORDER_STATUSES, name='orderstatus')
+
+
+def upgrade():
+    bind = op.get_bind()
+    existing_tables = sa.inspect(bind).get_table_names()
+
+    if 'orders_archive' not in existing_tables:
+        op.create_table(
+            'orders_archive',
+            sa.Column('id', _uuid(bind), primary_key=True),
+            sa.Column('user_id', _uuid(bind), nullable=True),
+            sa.Column('status', _order_status(bind), nullable=False),
+            sa.Column('total_amount', sa.Numeric(10, 2), nullable=False),
+            sa.Column('notes', sa.String(), nullable=True),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('archived_at', sa.DateTime(timezone=True), nullable=False)
+        )
+        op.create_index('ix_orders_archive_user_id_created_at', 'orders_archive', ['user_id', 'created_at'])
+
+    if 'order_items_archive' not in existing_tables:
+        op.create_table(
+            'order_items_archive',
+            sa.Column('id', _uuid(bind), primary_key=True),
+            sa.Column('order_id', _uuid(bind), nullable=False),
+            sa.Column('product_id', _uuid(bind), nullable=False),
+            sa.Column('quantity', sa.Integer(), nullable=False),
+            sa.Column('price', sa.Numeric(10, 2), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False)
+        )
+        op.create_index('ix_order_items_archive_order_id', 'order_items_archive', ['order_id'])
+
+    if 'order_archive_checkpoints' not in existing_tables:
+        op.create_table(
+            'order_archive_checkpoints',
+            sa.Column('job', sa.String(length=64), primary_key=True),
+            sa.Column('cutoff', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('last_created_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('last_id', _uuid(bind), nullable=True),
+            sa.Column('archived_orders', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('archived_items', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True)
+        )
+
+
+def downgrade():
+    op.drop_table('order_archive_checkpoints')
+    op.drop_index('ix_order_items_archive_order_id', table_name='order_items_archive')
+    op.drop_table('order_items_archive')
+    op.drop_index('ix_orders_archive_user_id_created_at', table_name='orders_archive')
+    op.drop_table('orders_archive')
@@ -0,0 +1,103 @@
+"""add full-text product search index
+
+PostgreSQL: GIN index on the weighted tsvector document searched by
+PostgresProductSearch, and a pg_trgm GIN index on products.name for
+substring matches (the extension is created when the role may do so).
+
+SQLite: external-content FTS5 table products_fts, kept in sync with
+products by triggers and filled from the existing rows.
+
+Revision ID: c4d1e8a6f203
+Revises: 8b6e4f0a2c91
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d1e8a6f203'
+down_revision = '8b6e4f0a2c91'
+branch_labels = None
+depends_on = None
+
+
+# Must stay identical to _PG_SEARCH_VECTOR in product_search.py
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(brand, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '') || ' ' || "
+    "coalesce(dosage_form, '') || ' ' || coalesce(strength, '')), 'C')"
+)
+
+FTS_COLUMNS = "name, brand, description, dosage_form, strength"
+
+
+def _fts_values(prefix):
+    return ", ".join(f"{prefix}.{name.strip()}" for name in FTS_COLUMNS.split(","))
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        _upgrade_postgresql(bind)
+    elif bind.dialect.name == 'sqlite':
+        _upgrade_sqlite()
+
+
+def _upgrade_postgresql(bind):
+    op.execute(f"CREATE INDEX IF NOT EXISTS ix_products_search_vector ON products USING gin (({PG_SEARCH_VECTOR}))")
+
+    has_trigram = bind.execute(sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first() is not None
+    if not has_trigram:
+        # Creating an extension needs extra privileges; without it search
+        # still works, only the substring match on the name is skipped
+        try:
+            with bind.begin_nested():
+                bind.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            has_trigram = True
+        except sa.exc.DBAPIError as e:
+            print(f"Skipping trigram index, could not create pg_trgm: {e}")
+
+    if has_trigram:
+        op.execute("CREATE INDEX IF NOT EXISTS ix_products_name_trgm ON products USING gin (name gin_trgm_ops)")
+
+
+def _upgrade_sqlite():
+    op.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5("
+        f"{FTS_COLUMNS}, content='products', content_rowid='rowid', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN "
+        f"INSERT INTO products_fts(rowid, {FTS_COLUMNS}) VALUES (new.rowid, {_fts_values('new')}); "
+        f"END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN "
+        f"INSERT INTO products_fts(products_fts, rowid, {FTS_COLUMNS}) VALUES ('delete', old.rowid, {_fts_values('old')}); "
+        f"END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE ON products BEGIN "
+        f"INSERT INTO products_fts(products_fts, rowid, {FTS_COLUMNS}) VALUES ('delete', old.rowid, {_fts_values('old')}); "
+        f"INSERT INTO products_fts(rowid, {FTS_COLUMNS}) VALUES (new.rowid, {_fts_values('new')}); "
+        f"END"
+    )
+    op.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_products_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_products_search_vector")
+    elif bind.dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS products_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS products_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS products_fts_ai")
+        op.execute("DROP TABLE IF EXISTS products_fts")
@@ -0,0 +1,64 @@
+"""
+Regression guard for per-request service construction: serving requests
+must not grow the event bus handler lists, so publish() costs the same
+after 10k requests as after the first.
+"""
+
+import time
+
+import pytest
+
+from app.extensions import container
+
+REQUESTS = 10_000
+PUBLISHES = 2_000
+
+
+class ProbeEvent:
+    pass
+
+
+class RebuiltService:
+    """Subscribes a bound method on construction, like the services do."""
+
+    handled = 0
+
+    def __init__(self, event_bus):
+        event_bus.subscribe(ProbeEvent, self.handle)
+
+    def handle(self, event):
+        RebuiltService.handled += 1
+
+
+def _handler_counts(event_bus):
+    return {event_type: len(handlers) for event_type, handlers in event_bus._handlers.items()}
+
+
+def _publish_seconds(event_bus):
+    started = time.perf_counter()
+    for _ in range(PUBLISHES):
+        event_bus.publish(ProbeEvent())
+    return (time.perf_counter() - started) / PUBLISHES
+
+
+@pytest.mark.benchmark
+def test_publish_cost_stays_flat_over_10k_requests(client):
+    event_bus = container.event_bus()
+    RebuiltService(event_bus)
+    assert client.get("/api/products/list").status_code == 200
+
+    counts_before = _handler_counts(event_bus)
+    first = _publish_seconds(event_bus)
+
+    for _ in range(REQUESTS):
+        client.get("/api/products/list")
+        # A service rebuilt on every request re-registers its handler
+        RebuiltService(event_bus)
+
+    assert _handler_counts(event_bus) == counts_before
+
+    RebuiltService.handled = 0
+    last = _publish_seconds(event_bus)
+    assert RebuiltService.handled == PUBLISHES
+    # Generous bound for timer noise; duplicated handlers would make it ~10000x
+    assert last < first * 3 + 5e-6, f"publish() went from {first * 1e6:.1f} to {last * 1e6:.1f} us"
@@ -0,0 +1,65 @@
+"""
+Query-count guard for the product listings: a page must cost a fixed
+number of SQL statements however many products it holds, so inventory
+is never lazy-loaded per row again.
+"""
+
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.dataBase import db
+
+# Page query, COUNT(*) and the odd lookup (e.g. category names); an N+1
+# over a full page would be 20 more
+MAX_STATEMENTS_PER_PAGE = 5
+# The endpoints' default page size
+PAGE_SIZE = 20
+
+ENDPOINTS = [
+    "/api/products/list",
+    "/api/products/search?search=Product",
+    "/api/products/low-stock",
+    "/api/products/expiring",
+]
+
+
+@contextmanager
+def count_statements(app):
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _page(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.get_json()["data"]["items"]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("url", ENDPOINTS)
+def test_listing_page_runs_bounded_statements(app, client, create_product, url):
+    # Low on stock and expiring soon, so every endpoint returns all of them
+    for _ in range(PAGE_SIZE + 5):
+        create_product(quantity=1, min_stock=5, expiry_date=date.today() + timedelta(days=10))
+
+    # Warm up: first-request setup queries are not part of the page cost
+    _page(client, url)
+
+    with count_statements(app) as statements:
+        items = _page(client, url)
+
+    assert len(items) == PAGE_SIZE
+    assert len(statements) <= MAX_STATEMENTS_PER_PAGE, "\n".join(statements)
@@ -0,0 +1,102 @@
+"""
+Order creation against product browsing from separate worker processes
+on one SQLite file, as under gunicorn. With the web profile (WAL, BEGIN
+IMMEDIATE for writes, busy_timeout) no request may fail with "database
+is locked" and browsing keeps going while orders are written.
+"""
+
+import multiprocessing
+import statistics
+import time
+import uuid
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import text
+
+from app.config import TestingConfig
+from app.dataBase import db
+
+WRITERS = 3
+READERS = 3
+ORDERS_PER_WRITER = 25
+PAGES_PER_READER = 50
+PRODUCTS = 5
+# Generous for a shared CI runner; a reader stuck behind writers waits busy_timeout (seconds)
+MAX_MEDIAN_BROWSE_SECONDS = 0.5
+
+
+@pytest.fixture
+def app_config():
+    return {"DB_ENGINE_PROFILE": "web"}
+
+
+def _worker(role, database_uri, product_ids, count, start, results):
+    """Worker process: build an app on the shared file, wait for the others, then write or browse."""
+    TestingConfig.SQLALCHEMY_DATABASE_URI = database_uri
+    TestingConfig.DB_ENGINE_PROFILE = "web"
+    from app import create_app
+
+    app = create_app("testing")
+    client = app.test_client()
+    with app.app_context():
+        headers = {"Authorization": f"Bearer {create_access_token(identity=str(uuid.uuid4()))}"}
+
+    start.wait()
+    statuses, seconds = [], []
+    for i in range(count):
+        began = time.perf_counter()
+        if role == "writer":
+            response = client.post("/order/order", json={"items": [
+                {"product_id": product_ids[i % len(product_ids)], "quantity": 1, "price": 7.5}
+            ]}, headers=headers)
+        else:
+            response = client.get("/api/products/list")
+        seconds.append(time.perf_counter() - began)
+        statuses.append((response.status_code, response.get_data(as_text=True)[:200]))
+    results.put((role, statuses, seconds))
+
+
+@pytest.mark.benchmark
+def test_orders_and_browsing_from_several_processes(app, client, create_product, db_path):
+    product_ids = [create_product(quantity=1000) for _ in range(PRODUCTS)]
+    with app.app_context():
+        assert db.session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+    context = multiprocessing.get_context("spawn")
+    start = context.Barrier(WRITERS + READERS)
+    results = context.Queue()
+    workers = [
+        context.Process(target=_worker, args=(role, f"sqlite:///{db_path}", product_ids, count, start, results))
+        for role, processes, count in (("writer", WRITERS, ORDERS_PER_WRITER), ("reader", READERS, PAGES_PER_READER))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    collected = [results.get(timeout=180) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+    statuses = {"writer": [], "reader": []}
+    seconds = {"writer": [], "reader": []}
+    for role, role_statuses, role_seconds in collected:
+        statuses[role].extend(role_statuses)
+        seconds[role].extend(role_seconds)
+
+    failures = [status for role in statuses for status in statuses[role] if status[0] >= 500]
+    assert not failures, failures[:5]
+    assert all(code == 201 for code, _ in statuses["writer"])
+    assert all(code == 200 for code, _ in statuses["reader"])
+
+    # Every order took its unit: nothing was lost to a failed or retried write
+    sold = 1000 * PRODUCTS - sum(
+        client.get(f"/api/products/{product_id}").get_json()["data"]["inventory_fields"]["quantity"]
+        for product_id in product_ids
+    )
+    assert sold == WRITERS * ORDERS_PER_WRITER
+
+    browse = statistics.median(seconds["reader"])
+    order = statistics.median(seconds["writer"])
+    print(f"median browse {browse * 1000:.1f} ms, median order {order * 1000:.1f} ms")
+    assert browse < MAX_MEDIAN_BROWSE_SECONDS
@@ -0,0 +1,63 @@
+"""
+Cold start of a worker: a fresh interpreter imports the app, builds it
+and serves its first request. With the schema managed by ``flask
+migrate-db`` instead of SCHEMA_AUTO_CREATE, boot does no schema work and
+time to first request stays within budget.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+RUNS = 3
+# Generous for a cold interpreter on a shared CI runner
+FIRST_REQUEST_BUDGET_SECONDS = 10.0
+
+# Runs in a fresh interpreter so that the imports are not already cached
+BOOT_SCRIPT = """
+import json, sys
+from app.config import TestingConfig
+TestingConfig.SQLALCHEMY_DATABASE_URI = sys.argv[1]
+TestingConfig.SCHEMA_AUTO_CREATE = sys.argv[2] == "1"
+from app import create_app
+app = create_app("testing")
+assert app.test_client().get("/health/").status_code == 200
+print(json.dumps(app.extensions_data["startup_timings"].stats()))
+"""
+
+
+def _boot(database_uri, auto_create):
+    result = subprocess.run(
+        [sys.executable, "-c", BOOT_SCRIPT, database_uri, "1" if auto_create else "0"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.benchmark
+def test_time_to_first_request(tmp_path):
+    database_uri = f"sqlite:///{tmp_path / 'startup.db'}"
+    # The release step: tables exist before any worker boots
+    _boot(database_uri, auto_create=True)
+
+    runs = [_boot(database_uri, auto_create=False) for _ in range(RUNS)]
+
+    for stats in runs:
+        assert "schema_seconds" not in stats, stats
+        assert stats["create_app_seconds"] <= stats["first_request_seconds"]
+
+    first_request = statistics.median(stats["first_request_seconds"] for stats in runs)
+    phases = {name: statistics.median(stats[name] for stats in runs) for name in runs[0]}
+    print(f"startup phases (median of {RUNS}): {phases}")
+    assert first_request < FIRST_REQUEST_BUDGET_SECONDS, phases
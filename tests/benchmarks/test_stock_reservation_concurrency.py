@@ -0,0 +1,91 @@
+"""
+Concurrent orders against a file-backed SQLite database (WAL, BEGIN
+IMMEDIATE for writes) must never sell more than is in stock: every
+order either takes its units or is rejected, from threads of one worker
+as well as from separate worker processes.
+"""
+
+import multiprocessing
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app.config import TestingConfig
+
+STOCK = 10
+THREADS = 8
+ORDERS_PER_THREAD = 4
+PROCESSES = 4
+ORDERS_PER_PROCESS = 6
+
+
+@pytest.fixture
+def app_config():
+    return {"DB_ENGINE_PROFILE": "web"}
+
+
+def _order(client, headers, product_id):
+    response = client.post(
+        "/order/order",
+        json={"items": [{"product_id": product_id, "quantity": 1, "price": 7.5}]},
+        headers=headers
+    )
+    return response.status_code
+
+
+def _stock(client, product_id):
+    return client.get(f"/api/products/{product_id}").get_json()["data"]["inventory_fields"]["quantity"]
+
+
+def _place_orders(database_uri, product_id, orders):
+    """Worker process: build its own app on the shared file and place orders."""
+    TestingConfig.SQLALCHEMY_DATABASE_URI = database_uri
+    TestingConfig.DB_ENGINE_PROFILE = "web"
+    from app import create_app
+
+    app = create_app("testing")
+    with app.app_context():
+        headers = {"Authorization": f"Bearer {create_access_token(identity=str(uuid.uuid4()))}"}
+    client = app.test_client()
+    return [_order(client, headers, product_id) for _ in range(orders)]
+
+
+def _assert_no_oversell(statuses, stock_left):
+    sold = statuses.count(201)
+    # Every order is either placed or cleanly refused, never a server error
+    assert all(status == 201 or 400 <= status < 500 for status in statuses), statuses
+    assert sold == STOCK, statuses
+    assert stock_left == 0
+
+
+@pytest.mark.benchmark
+def test_threads_never_oversell(app, client, create_product, auth_headers):
+    product_id = create_product(quantity=STOCK)
+    start = threading.Barrier(THREADS)
+
+    def place_orders():
+        headers = auth_headers()
+        thread_client = app.test_client()
+        start.wait()
+        return [_order(thread_client, headers, product_id) for _ in range(ORDERS_PER_THREAD)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        statuses = [status for result in [pool.submit(place_orders) for _ in range(THREADS)] for status in result.result()]
+
+    _assert_no_oversell(statuses, _stock(client, product_id))
+
+
+@pytest.mark.benchmark
+def test_processes_never_oversell(app, client, create_product, db_path):
+    product_id = create_product(quantity=STOCK)
+
+    with multiprocessing.get_context("spawn").Pool(PROCESSES) as pool:
+        results = pool.starmap(
+            _place_orders,
+            [(f"sqlite:///{db_path}", product_id, ORDERS_PER_PROCESS)] * PROCESSES
+        )
+
+    _assert_no_oversell([status for result in results for status in result], _stock(client, product_id))
@@ -0,0 +1,169 @@
+"""
+Text versus binary UUID storage on SQLite: the same orders, order items
+and inventory, once as 36-character text and once converted to 16-byte
+blobs with convert_uuid_storage. Binary keys must make the indexes of
+those tables markedly smaller and must not slow down key lookups.
+
+Each storage runs in its own process, since the storage is chosen once
+per process.
+"""
+
+import multiprocessing
+import random
+import time
+import uuid
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, insert, select, text
+
+from app.config import TestingConfig
+
+PRODUCTS = 2_000
+ORDERS = 20_000
+ITEMS_PER_ORDER = 2
+LOOKUPS = 2_000
+TABLES = ("orders", "order_items", "inventory")
+# 16 instead of 36 bytes per key over the three tables' indexes; indexed
+# dates and statuses do not shrink, so single tables vary
+MAX_BINARY_INDEX_RATIO = 0.75
+# Lookups may not get slower; generous for timer noise
+MAX_BINARY_LOOKUP_RATIO = 1.5
+
+
+def _seed(rng):
+    from app.dataBase import db
+    from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+    from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+    from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+
+    def new_id():
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    now = datetime.now(UTC)
+    product_ids = [new_id() for _ in range(PRODUCTS)]
+    order_ids = [new_id() for _ in range(ORDERS)]
+
+    db.session.execute(insert(ProductModel.__table__), [
+        {"id": product_id, "name": f"Product {i}", "status": "ACTIVE", "created_at": now, "updated_at": now}
+        for i, product_id in enumerate(product_ids)
+    ])
+    db.session.execute(insert(InventoryModel.__table__), [
+        {"id": new_id(), "product_id": product_id, "quantity": 100, "price": 7.5, "max_stock": 1000,
+         "min_stock": 1, "last_updated_at": now, "expiry_date": now}
+        for product_id in product_ids
+    ])
+    db.session.execute(insert(OrderModel.__table__), [
+        {"id": order_id, "user_id": new_id(), "status": "COMPLETED", "total_amount": Decimal("15.00"),
+         "created_at": now, "updated_at": now}
+        for order_id in order_ids
+    ])
+    db.session.execute(insert(OrderItemModel.__table__), [
+        {"id": new_id(), "order_id": order_id, "product_id": rng.choice(product_ids), "quantity": 1,
+         "price": Decimal("7.50"), "created_at": now, "updated_at": now}
+        for order_id in order_ids
+        for _ in range(ITEMS_PER_ORDER)
+    ])
+    db.session.commit()
+    return rng.sample(order_ids, LOOKUPS), rng.sample(product_ids, LOOKUPS)
+
+
+def _vacuum(engine):
+    # Freshly built indexes for both storages, so page fill does not skew the sizes
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.isolation_level = None
+        raw.driver_connection.execute("VACUUM")
+    finally:
+        raw.close()
+
+
+def _index_bytes(session):
+    indexes = session.execute(
+        text("SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND tbl_name IN ('orders', 'order_items', 'inventory')")
+    ).all()
+    sizes = dict.fromkeys(TABLES, 0)
+    for name, table in indexes:
+        sizes[table] += session.execute(text("SELECT SUM(pgsize) FROM dbstat WHERE name = :name"), {"name": name}).scalar()
+    return sizes
+
+
+def _lookup_seconds(session, order_ids, product_ids):
+    from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+    from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+
+    orders, items, inventory = OrderModel.__table__, OrderItemModel.__table__, InventoryModel.__table__
+    lookups = {
+        "orders": lambda i: select(orders).where(orders.c.id == order_ids[i]),
+        "order_items": lambda i: select(items).where(items.c.order_id == order_ids[i]),
+        "inventory": lambda i: select(inventory).where(inventory.c.product_id == product_ids[i]),
+    }
+    seconds = {}
+    for table, statement in lookups.items():
+        started = time.perf_counter()
+        for i in range(LOOKUPS):
+            assert session.execute(statement(i)).first() is not None
+        seconds[table] = (time.perf_counter() - started) / LOOKUPS
+    return seconds
+
+
+def _measure(storage, database_uri):
+    """Worker process: seed as text, convert to ``storage`` if needed, then measure."""
+    TestingConfig.SQLALCHEMY_DATABASE_URI = database_uri
+    TestingConfig.SQLITE_UUID_STORAGE = "text"
+    from app import create_app
+    from app.dataBase import db
+    from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel
+    from app.shared.infrastructure.persistence.uuid_storage import convert_uuid_storage
+
+    app = create_app("testing")
+    with app.app_context():
+        order_ids, product_ids = _seed(random.Random(23))
+        if storage == "binary":
+            convert_uuid_storage(db.engine, "binary")
+        db.session.remove()
+        db.engine.dispose()
+
+    # Reopen with the storage the data is now in
+    TestingConfig.SQLITE_UUID_STORAGE = storage
+    app = create_app("testing")
+    with app.app_context():
+        _vacuum(db.engine)
+        stored = db.session.execute(text("SELECT DISTINCT typeof(id) FROM orders")).scalars().all()
+        items = db.session.execute(select(func.count()).select_from(OrderItemModel.__table__)).scalar()
+        sizes = _index_bytes(db.session)
+        # Warm up the page cache before timing
+        _lookup_seconds(db.session, order_ids, product_ids)
+        seconds = _lookup_seconds(db.session, order_ids, product_ids)
+        db.session.remove()
+        db.engine.dispose()
+    return {"stored": stored, "items": items, "index_bytes": sizes, "lookup_seconds": seconds}
+
+
+@pytest.mark.benchmark
+def test_binary_uuids_shrink_indexes_without_slowing_lookups(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for storage in ("text", "binary"):
+        with context.Pool(1) as pool:
+            results[storage] = pool.apply(_measure, (storage, f"sqlite:///{tmp_path / f'{storage}.db'}"))
+
+    text_run, binary_run = results["text"], results["binary"]
+    assert text_run["stored"] == ["text"]
+    assert binary_run["stored"] == ["blob"]
+    # The conversion kept every row
+    assert text_run["items"] == binary_run["items"] == ORDERS * ITEMS_PER_ORDER
+
+    for table in TABLES:
+        text_bytes, binary_bytes = text_run["index_bytes"][table], binary_run["index_bytes"][table]
+        text_lookup, binary_lookup = text_run["lookup_seconds"][table], binary_run["lookup_seconds"][table]
+        print(
+            f"{table}: indexes {text_bytes / 1024:.0f} KiB text vs {binary_bytes / 1024:.0f} KiB binary, "
+            f"lookup {text_lookup * 1e6:.0f} us vs {binary_lookup * 1e6:.0f} us"
+        )
+        assert binary_bytes < text_bytes, (table, text_bytes, binary_bytes)
+        assert binary_lookup < text_lookup * MAX_BINARY_LOOKUP_RATIO, (table, text_lookup, binary_lookup)
+
+    text_total, binary_total = sum(text_run["index_bytes"].values()), sum(binary_run["index_bytes"].values())
+    assert binary_total < text_total * MAX_BINARY_INDEX_RATIO, (text_total, binary_total)
@@ -0,0 +1,128 @@
+"""
+Shared fixtures: an application on a file-backed SQLite database per test.
+
+Tests that need other settings override the ``app_config`` fixture in
+their module; its values are applied to TestingConfig before the app is
+created. The DI container is process-wide, so services (and their event
+handlers) are shared by every app built in a test run, as they are by
+every request of a worker.
+"""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app.config import TestingConfig
+from app.dataBase import db
+
+
+@pytest.fixture
+def app_config():
+    return {}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "pharmacy.db"
+
+
+@pytest.fixture
+def app(db_path, app_config, monkeypatch):
+    monkeypatch.setattr(TestingConfig, "SQLALCHEMY_DATABASE_URI", f"sqlite:///{db_path}")
+    for key, value in app_config.items():
+        monkeypatch.setattr(TestingConfig, key, value, raising=False)
+
+    from app import create_app
+
+    app = create_app("testing")
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def migrate_db(app):
+    """Bring the database up with ``flask migrate-db``, as a release does."""
+    result = app.test_cli_runner().invoke(args=["migrate-db"])
+    assert result.exit_code == 0, result.output
+    return app
+
+
+@pytest.fixture
+def auth_headers(app):
+    """Bearer token headers for a new (or the given) user id."""
+    def make(user_id=None):
+        with app.app_context():
+            token = create_access_token(identity=str(user_id or uuid.uuid4()))
+        return {"Authorization": f"Bearer {token}"}
+    return make
+
+
+@pytest.fixture
+def admin_headers(client):
+    """Bearer token headers of a registered administrator."""
+    account = {
+        "username": "admin",
+        "password": "Str0ngPassword",
+        "email": "admin@example.com",
+        "full_name": "Pharmacy admin",
+        "phone": "+15550100"
+    }
+    response = client.post("/auth/admin/register", json={
+        **account, "initialization_key": TestingConfig.ADMIN_INITIALIZATION_KEY
+    })
+    assert response.status_code == 201, response.get_data(as_text=True)
+    response = client.post("/auth/login", json={"email": account["email"], "password": account["password"]})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return {"Authorization": f"Bearer {response.get_json()['data']['access_token']}"}
+
+
+@pytest.fixture
+def create_product(client):
+    """Create a product with inventory through the API and return its id."""
+    def create(name=None, quantity=10, price=7.5, min_stock=1, max_stock=100, expiry_date=None, brand="Acme"):
+        response = client.post("/api/products/", json={
+            "product_fields": {
+                "name": name or f"Product {uuid.uuid4().hex[:8]}",
+                "description": "Test product",
+                "brand": brand,
+                "dosage_form": "tablet",
+                "strength": "500mg",
+                "package": "10",
+                "image_url": "https://example.com/product.png",
+                "status": "ACTIVE"
+            },
+            "inventory_fields": {
+                "quantity": quantity,
+                "price": price,
+                "max_stock": max_stock,
+                "min_stock": min_stock,
+                "expiry_date": (expiry_date or date.today() + timedelta(days=365)).isoformat()
+            }
+        })
+        assert response.status_code == 201, response.get_data(as_text=True)
+        return response.get_json()["data"]["id"]
+    return create
+
+
+@pytest.fixture
+def create_order(client, auth_headers):
+    """Place an order through the API and return the response."""
+    def create(items, user_id=None):
+        return client.post(
+            "/order/order",
+            json={"items": [
+                {"product_id": product_id, "quantity": quantity, "price": price}
+                for product_id, quantity, price in items
+            ]},
+            headers=auth_headers(user_id)
+        )
+    return create
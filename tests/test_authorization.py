@@ -0,0 +1,197 @@
+"""
+Admin authorization from token claims: ClaimsAuthorizer with its
+per-worker PrincipalCache, and require_admin end to end with access
+changes made through PATCH /auth/user/<id>/access.
+"""
+
+import uuid
+
+import pytest
+
+from app.config import Config
+from app.services.auth_service.domain.exceptions.auth_errors import AuthenticationError, AuthorizationError
+from app.services.auth_service.infrastructure.security.authorization import (
+    AUTHZ_VERSION_CLAIM,
+    ClaimsAuthorizer,
+    Principal,
+    PrincipalCache
+)
+
+PASSWORD = "Str0ngPassword"
+
+
+class Users:
+    """Principal loader over a dict, counting database loads."""
+
+    def __init__(self):
+        self.principals = {}
+        self.loads = 0
+
+    def add(self, is_admin=True, is_active=True, authz_version=1):
+        principal = Principal(uuid.uuid4(), is_active=is_active, is_admin=is_admin, authz_version=authz_version)
+        self.principals[principal.user_id] = principal
+        return principal
+
+    def change(self, user_id, **changes):
+        current = self.principals[user_id]
+        self.principals[user_id] = Principal(**{
+            **current.__dict__, **changes, "authz_version": current.authz_version + 1
+        })
+
+    def load(self, user_id):
+        self.loads += 1
+        return self.principals.get(user_id)
+
+
+@pytest.fixture
+def users():
+    return Users()
+
+
+@pytest.fixture
+def authorizer(users):
+    return ClaimsAuthorizer(users.load, PrincipalCache(ttl=60))
+
+
+def _claims(principal, is_admin=True, version=None):
+    return {"is_admin": is_admin, AUTHZ_VERSION_CLAIM: principal.authz_version if version is None else version}
+
+
+def test_non_admin_claim_is_rejected_without_a_lookup(authorizer, users):
+    admin = users.add()
+
+    with pytest.raises(AuthorizationError):
+        authorizer.authorize_admin(admin.user_id, {"is_admin": False})
+    with pytest.raises(AuthorizationError):
+        authorizer.authorize_admin(admin.user_id, {})
+    assert users.loads == 0
+
+
+def test_admin_principal_is_cached(authorizer, users):
+    admin = users.add()
+
+    for _ in range(3):
+        assert authorizer.authorize_admin(str(admin.user_id), _claims(admin)) == admin
+    assert users.loads == 1
+    assert authorizer.stats()["hits"] == 2
+
+
+def test_revoked_token_is_rejected_after_the_version_bump(authorizer, users):
+    admin = users.add()
+    old_claims = _claims(admin)
+    authorizer.authorize_admin(admin.user_id, old_claims)
+
+    # What ChangeUserAccessUseCase does: bump the version, drop the local entry
+    users.change(admin.user_id)
+    authorizer.invalidate(admin.user_id)
+
+    with pytest.raises(AuthenticationError):
+        authorizer.authorize_admin(admin.user_id, old_claims)
+    assert authorizer.authorize_admin(admin.user_id, _claims(admin, version=2)).authz_version == 2
+
+
+def test_demoted_and_deactivated_admins_are_rejected(authorizer, users):
+    demoted, deactivated = users.add(), users.add()
+    users.change(demoted.user_id, is_admin=False)
+    users.change(deactivated.user_id, is_active=False)
+
+    # A token issued after the change still carries no admin rights
+    with pytest.raises(AuthorizationError):
+        authorizer.authorize_admin(demoted.user_id, _claims(demoted, version=2))
+    with pytest.raises(AuthenticationError):
+        authorizer.authorize_admin(deactivated.user_id, _claims(deactivated, version=2))
+
+
+def test_stale_cache_entry_is_reloaded_for_a_newer_token(authorizer, users):
+    admin = users.add()
+    authorizer.authorize_admin(admin.user_id, _claims(admin))
+    assert users.loads == 1
+
+    # Another worker bumped the version and issued a new token; this
+    # worker's cache still holds version 1
+    users.change(admin.user_id)
+    assert authorizer.authorize_admin(admin.user_id, _claims(admin, version=2)).authz_version == 2
+    assert users.loads == 2
+
+
+def test_expired_cache_entry_is_reloaded(users):
+    authorizer = ClaimsAuthorizer(users.load, PrincipalCache(ttl=0))
+    admin = users.add()
+    old_claims = _claims(admin)
+    authorizer.authorize_admin(admin.user_id, old_claims)
+
+    # A change made by another worker, which could not invalidate this cache
+    users.change(admin.user_id)
+
+    with pytest.raises(AuthenticationError):
+        authorizer.authorize_admin(admin.user_id, old_claims)
+    assert users.loads == 2
+
+
+def _register_admin(client, name):
+    response = client.post("/auth/admin/register", json={
+        "username": name,
+        "password": PASSWORD,
+        "email": f"{name}@example.com",
+        "full_name": f"{name} admin",
+        "phone": "+15550100",
+        "initialization_key": Config.ADMIN_INITIALIZATION_KEY
+    })
+    assert response.status_code == 201, response.get_data(as_text=True)
+    return response.get_json()["data"]["id"]
+
+
+def _login(client, name):
+    response = client.post("/auth/login", json={"email": f"{name}@example.com", "password": PASSWORD})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return {"Authorization": f"Bearer {response.get_json()['data']['access_token']}"}
+
+
+def _admin_only(client, headers):
+    return client.get("/auth/access-codes", headers=headers).status_code
+
+
+def test_require_admin_rejects_tokens_without_the_admin_claim(client, auth_headers):
+    assert _admin_only(client, {}) == 401
+    assert _admin_only(client, auth_headers()) == 403
+
+
+def test_access_change_revokes_existing_tokens(client):
+    root_id = _register_admin(client, "root")
+    other_id = _register_admin(client, "other")
+    root, other = _login(client, "root"), _login(client, "other")
+    assert _admin_only(client, root) == 200
+    assert _admin_only(client, other) == 200
+
+    response = client.patch(f"/auth/user/{other_id}/access", json={"is_admin": False}, headers=root)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()["data"]["is_admin"] is False
+
+    # The demoted user's token is revoked and a fresh one carries no admin claim
+    assert _admin_only(client, other) == 401
+    assert _admin_only(client, _login(client, "other")) == 403
+
+    # An empty change only revokes: root's current token stops working
+    response = client.patch(f"/auth/user/{root_id}/access", json={}, headers=root)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert _admin_only(client, root) == 401
+    assert _admin_only(client, _login(client, "root")) == 200
+
+
+def test_access_change_requires_an_admin(client, auth_headers):
+    admin_id = _register_admin(client, "root")
+
+    response = client.patch(f"/auth/user/{admin_id}/access", json={"is_admin": False}, headers=auth_headers())
+    assert response.status_code == 403
+    assert _admin_only(client, _login(client, "root")) == 200
+
+    response = client.patch(f"/auth/user/{uuid.uuid4()}/access", json={}, headers=_login(client, "root"))
+    assert response.status_code == 404
+
+
+def test_deleting_a_user_revokes_their_admin_token(client):
+    admin_id = _register_admin(client, "root")
+    headers = _login(client, "root")
+
+    assert client.delete(f"/auth/user/{admin_id}", headers=headers).status_code == 200
+    assert _admin_only(client, headers) == 401
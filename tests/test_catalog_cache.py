@@ -0,0 +1,78 @@
+"""
+Catalog cache invalidation: every write that changes a product or its
+stock must drop the cached detail and listing pages.
+"""
+
+import pytest
+
+from app.extensions import container
+from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+from app.shared.contracts.product.product_events import CatalogChangedEvent
+from app.shared.infrastructure.cache import build_cache_backend
+from app.shared.infrastructure.cache.backends import InMemoryCacheBackend
+
+
+@pytest.fixture
+def app_config():
+    return {"CATALOG_CACHE_BACKEND": "memory"}
+
+
+def _stock(client, product_id):
+    response = client.get(f"/api/products/{product_id}")
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.get_json()["data"]["inventory_fields"]["quantity"]
+
+
+def _listed_stock(app, product_id):
+    # The list endpoint's schema only keeps product IDs, so read the cached page itself
+    with app.test_request_context():
+        page = container.product_service().list_products(GetProductsByFilterQuery())
+    return next(item["stockQuantity"] for item in page["items"] if str(item["id"]) == product_id)
+
+
+def test_order_reservation_invalidates_cached_stock(app, client, create_product, create_order):
+    product_id = create_product(quantity=10)
+    # Cache the detail and the listing page
+    assert _stock(client, product_id) == 10
+    assert _listed_stock(app, product_id) == 10
+
+    assert create_order([(product_id, 3, 7.5)]).status_code == 201
+
+    assert _stock(client, product_id) == 7
+    assert _listed_stock(app, product_id) == 7
+
+
+def test_product_update_invalidates_cached_detail(client, create_product):
+    product_id = create_product(quantity=10)
+    assert _stock(client, product_id) == 10
+
+    response = client.put(f"/api/products/{product_id}", json={
+        "product_fields": {
+            "name": "Renamed",
+            "description": "Test product",
+            "brand": "Acme",
+            "dosage_form": "tablet",
+            "strength": "500mg",
+            "package": "10",
+            "image_url": "https://example.com/product.png",
+            "status": "ACTIVE"
+        },
+        "inventory_fields": {"quantity": 4, "price": 7.5, "max_stock": 100, "min_stock": 1, "expiry_date": "2030-01-01"}
+    })
+    assert response.status_code == 200, response.get_data(as_text=True)
+
+    assert _stock(client, product_id) == 4
+
+
+def test_catalog_changes_reach_every_worker():
+    event_bus = container.event_bus()
+    assert event_bus._fanout_handlers(CatalogChangedEvent)
+
+
+@pytest.mark.parametrize("transport, expected", [
+    ("inprocess", type(None)),
+    ("sqlite", InMemoryCacheBackend),
+])
+def test_auto_backend_needs_an_event_transport(transport, expected):
+    backend = build_cache_backend({"CATALOG_CACHE_BACKEND": "auto", "EVENT_BUS_TRANSPORT": transport})
+    assert isinstance(backend, expected)
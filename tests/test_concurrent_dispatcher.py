@@ -0,0 +1,198 @@
+"""
+Priority-aware concurrent dispatch. Every test holds the pool's only
+worker on a latch, so what runs next is decided by the backlog and the
+CRITICAL bypass alone, not by thread timing.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from app.extensions import container
+from app.shared.application.events.concurrent_dispatcher import ConcurrentDispatcher
+from app.shared.application.events.event_bus import EventPriority
+
+TIMEOUT = 5
+
+LOW = EventPriority.LOW.value
+NORMAL = EventPriority.NORMAL.value
+HIGH = EventPriority.HIGH.value
+CRITICAL = EventPriority.CRITICAL.value
+
+
+@dataclass
+class Ping:
+    name: str
+
+
+class Recorder:
+    """Handlers that record which event they ran for, and in which thread."""
+
+    def __init__(self):
+        self.ran = []
+        self.threads = {}
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def handler(self, event):
+        with self._lock:
+            self.ran.append(event.name)
+            self.threads[event.name] = threading.current_thread()
+
+    def on_error(self, error, event):
+        with self._lock:
+            self.errors.append((event.name, str(error)))
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def dispatcher(recorder):
+    """One worker and room for two waiting events."""
+    dispatcher = ConcurrentDispatcher(
+        run_handler=lambda handler, event: handler(event),
+        on_error=recorder.on_error,
+        max_workers=1,
+        backlog_size=2
+    )
+    yield dispatcher
+    dispatcher.shutdown()
+
+
+@pytest.fixture
+def blocked_worker(dispatcher, recorder):
+    """Occupy the only worker until the returned latch is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def block(event):
+        started.set()
+        assert release.wait(TIMEOUT)
+        recorder.handler(event)
+
+    dispatcher.dispatch(Ping("blocker"), [block], LOW)
+    assert started.wait(TIMEOUT)
+    yield release
+    release.set()
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def _publish_in_thread(dispatcher, event, handlers, priority):
+    thread = threading.Thread(target=dispatcher.dispatch, args=(event, handlers, priority))
+    thread.start()
+    return thread
+
+
+def _queue_low(dispatcher, recorder, name):
+    """Queue a LOW event the feeder takes off the backlog and holds for the busy worker."""
+    dispatcher.dispatch(Ping(name), [recorder.handler], LOW)
+    _wait_for(lambda: dispatcher.backlog_size() == 0)
+
+
+def test_low_events_never_block_the_publisher(dispatcher, recorder, blocked_worker):
+    _queue_low(dispatcher, recorder, "held")
+
+    # Fills the backlog; each call returns while the worker is still busy
+    dispatcher.dispatch(Ping("queued-1"), [recorder.handler], LOW)
+    dispatcher.dispatch(Ping("queued-2"), [recorder.handler], LOW)
+    assert dispatcher.backlog_size() == 2
+
+    # A full backlog runs the LOW event inline rather than waiting for room
+    dispatcher.dispatch(Ping("overflow"), [recorder.handler], LOW)
+    assert recorder.ran == ["overflow"]
+    assert recorder.threads["overflow"] is threading.current_thread()
+
+    blocked_worker.set()
+    _wait_for(lambda: len(recorder.ran) == 5)
+    assert recorder.ran == ["overflow", "blocker", "held", "queued-1", "queued-2"]
+
+
+def test_critical_jumps_a_full_backlog(dispatcher, recorder, blocked_worker):
+    _queue_low(dispatcher, recorder, "held")
+    dispatcher.dispatch(Ping("queued-1"), [recorder.handler], LOW)
+    dispatcher.dispatch(Ping("queued-2"), [recorder.handler], LOW)
+    assert dispatcher.backlog_size() == 2
+
+    critical = _publish_in_thread(dispatcher, Ping("critical"), [recorder.handler], CRITICAL)
+    # The CRITICAL publisher waits for its handler, which needs the worker
+    critical.join(0.05)
+    assert critical.is_alive()
+
+    blocked_worker.set()
+    critical.join(TIMEOUT)
+    assert not critical.is_alive()
+    _wait_for(lambda: len(recorder.ran) == 5)
+    assert recorder.ran == ["blocker", "critical", "held", "queued-1", "queued-2"]
+    assert recorder.threads["critical"] is not threading.current_thread()
+
+
+def test_backlog_runs_higher_priorities_first(dispatcher, recorder, blocked_worker):
+    _queue_low(dispatcher, recorder, "held")
+    dispatcher.dispatch(Ping("low"), [recorder.handler], LOW)
+    high = _publish_in_thread(dispatcher, Ping("high"), [recorder.handler], HIGH)
+    _wait_for(lambda: dispatcher.backlog_size() == 2)
+
+    blocked_worker.set()
+    high.join(TIMEOUT)
+    assert not high.is_alive()
+    _wait_for(lambda: len(recorder.ran) == 4)
+    assert recorder.ran == ["blocker", "held", "high", "low"]
+
+
+def test_a_raising_handler_does_not_stop_its_siblings(dispatcher, recorder):
+    def boom(event):
+        raise RuntimeError(f"{event.name} failed")
+
+    # NORMAL and CRITICAL publishers wait for all of their handlers
+    dispatcher.dispatch(Ping("normal"), [boom, recorder.handler, recorder.handler], NORMAL)
+    dispatcher.dispatch(Ping("critical"), [recorder.handler, boom, recorder.handler], CRITICAL)
+
+    assert recorder.ran == ["normal", "normal", "critical", "critical"]
+    assert recorder.errors == [("normal", "normal failed"), ("critical", "critical failed")]
+
+
+def test_nested_events_run_inline(dispatcher, recorder):
+    def publish_nested(event):
+        # Waiting on the pool from its only worker would deadlock
+        dispatcher.dispatch(Ping("nested"), [recorder.handler], NORMAL)
+        recorder.handler(event)
+
+    outer = _publish_in_thread(dispatcher, Ping("outer"), [publish_nested], NORMAL)
+    outer.join(TIMEOUT)
+
+    assert not outer.is_alive()
+    assert recorder.ran == ["nested", "outer"]
+    assert recorder.threads["nested"] is recorder.threads["outer"]
+
+
+@dataclass
+class SerialPing:
+    name: str
+
+
+def test_serial_dispatch_isolates_handler_failures(recorder):
+    event_bus = container.event_bus()
+    assert event_bus._concurrent is None
+
+    def boom(event):
+        raise RuntimeError("first handler failed")
+
+    event_bus.subscribe(SerialPing, boom, priority=EventPriority.HIGH)
+    event_bus.subscribe(SerialPing, recorder.handler)
+    try:
+        event_bus.publish(SerialPing("serial"))
+    finally:
+        event_bus.unsubscribe(SerialPing, boom)
+        event_bus.unsubscribe(SerialPing, recorder.handler)
+
+    assert recorder.ran == ["serial"]
@@ -0,0 +1,269 @@
+"""
+Events relayed between worker processes through the SQLite broker file.
+Two workers read the stream in one consumer group: every event runs its
+ordinary handlers in exactly one of them and its fanout handlers in
+each, a worker that dies before acknowledging leaves the event to be
+claimed by another, and the event's EventMetadata arrives intact.
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import sqlite3
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from app.config import TestingConfig
+from app.extensions import container
+from app.shared.application.events.event_bus import Event, EventMetadata, EventPriority
+from app.shared.infrastructure.outbox.serialization import deserialize_event, serialize_event
+
+GROUP = "pharmacy"
+EVENTS = 20
+TIMEOUT = 30
+# Short waits so that workers stop, and claim a dead worker's events, quickly
+CLAIM_IDLE = 0.5
+RELAY_BLOCK = 0.2
+
+
+@dataclass
+class RelayPing(Event):
+    name: str = ""
+
+
+def _relay_config(broker_path):
+    return {
+        "EVENT_BUS_TRANSPORT": "sqlite",
+        "EVENT_BROKER_PATH": str(broker_path),
+        "EVENT_BUS_GROUP": GROUP,
+        "EVENT_RELAY_BLOCK": RELAY_BLOCK,
+        "EVENT_RELAY_CLAIM_IDLE": CLAIM_IDLE
+    }
+
+
+def _run_worker(database_uri, broker_path, results, stop, crash):
+    """Worker process: relay through the broker and report every handler run."""
+    TestingConfig.SQLALCHEMY_DATABASE_URI = database_uri
+    TestingConfig.SCHEMA_AUTO_CREATE = False
+    for key, value in _relay_config(broker_path).items():
+        setattr(TestingConfig, key, value)
+    from app import create_app
+
+    app = create_app("testing")
+    worker = os.getpid()
+
+    def handle(event):
+        if crash:
+            # Dies with the message handed out but not acknowledged
+            os._exit(1)
+        results.put((worker, "shared", event.name, event.metadata.to_headers()))
+
+    def refresh(event):
+        results.put((worker, "fanout", event.name, None))
+
+    event_bus = container.event_bus()
+    event_bus.subscribe(RelayPing, handle)
+    if not crash:
+        # A process killed mid-put could leave the results queue locked
+        event_bus.subscribe(RelayPing, refresh, fanout=True)
+    relay = app.extensions_data["event_relay"]
+    relay.start()
+    results.put((worker, "ready", None, None))
+
+    stop.wait(TIMEOUT)
+    relay.stop(TIMEOUT)
+
+
+class Workers:
+    """Worker processes on the test's database and broker, and what they report."""
+
+    def __init__(self, database_uri, broker_path):
+        self._context = multiprocessing.get_context("spawn")
+        self._args = (database_uri, str(broker_path))
+        self.results = self._context.Queue()
+        # One stop event per worker: setting an event another process died
+        # waiting on blocks forever
+        self.stops = []
+        self.processes = []
+        self.reports = []
+
+    def start(self, crash=False):
+        stop = self._context.Event()
+        process = self._context.Process(
+            target=_run_worker,
+            args=(*self._args, self.results, stop, crash),
+            daemon=True
+        )
+        process.start()
+        self.processes.append(process)
+        self.stops.append(stop)
+        self.wait_for(lambda: self.pids("ready").count(process.pid) == 1)
+        return process
+
+    def pids(self, kind):
+        return [pid for pid, reported, _, _ in self.reports if reported == kind]
+
+    def runs(self, kind, pid=None):
+        return [
+            (name, headers) for worker, reported, name, headers in self.reports
+            if reported == kind and pid in (None, worker)
+        ]
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + TIMEOUT
+        while not condition():
+            remaining = deadline - time.monotonic()
+            assert remaining > 0, f"timed out; reports: {self.reports}"
+            self.collect(min(remaining, 0.1))
+
+    def collect(self, timeout=0.1):
+        try:
+            self.reports.append(self.results.get(timeout=timeout))
+        except queue.Empty:
+            pass
+
+    def shutdown(self):
+        for process, stop in zip(self.processes, self.stops):
+            if process.exitcode is None:
+                stop.set()
+        for process in self.processes:
+            process.join(TIMEOUT)
+            if process.is_alive():
+                process.kill()
+        # Whatever was reported up to the end, duplicates included
+        while any(process.exitcode is None for process in self.processes) or not self.results.empty():
+            self.collect()
+
+
+class Publisher:
+    """Handlers of the publishing worker, which runs only the fanout one."""
+
+    def __init__(self):
+        self.shared = []
+        self.fanout = []
+
+    def handle(self, event):
+        self.shared.append(event.name)
+
+    def refresh(self, event):
+        self.fanout.append(event.name)
+
+
+@pytest.fixture
+def broker_path(tmp_path):
+    return tmp_path / "event_broker.db"
+
+
+@pytest.fixture
+def app_config(broker_path):
+    return _relay_config(broker_path)
+
+
+@pytest.fixture
+def publisher(app):
+    """This process as the publishing worker; events go back in-process afterwards."""
+    event_bus = container.event_bus()
+    handlers = Publisher()
+    event_bus.subscribe(RelayPing, handlers.handle)
+    event_bus.subscribe(RelayPing, handlers.refresh, fanout=True)
+    yield handlers
+    event_bus.unsubscribe(RelayPing, handlers.handle)
+    event_bus.unsubscribe(RelayPing, handlers.refresh)
+    event_bus.set_transport(None)
+
+
+@pytest.fixture
+def workers(app, db_path, broker_path):
+    workers = Workers(f"sqlite:///{db_path}", broker_path)
+    yield workers
+    workers.shutdown()
+
+
+def _pending(broker_path, group=GROUP):
+    """Consumer of each message of the group that is not acknowledged yet."""
+    with sqlite3.connect(broker_path) as connection:
+        return dict(connection.execute(
+            "SELECT message_id, consumer FROM broker_pending WHERE group_name = ?", (group,)
+        ).fetchall())
+
+
+def _publish(names):
+    event_bus = container.event_bus()
+    events = [
+        RelayPing(
+            metadata=EventMetadata(correlation_id=f"request-{name}", priority=EventPriority.HIGH, user_id=7),
+            name=name
+        )
+        for name in names
+    ]
+    for event in events:
+        event_bus.publish(event)
+    return {event.name: event.metadata.to_headers() for event in events}
+
+
+def test_shared_handlers_run_once_per_group_and_fanout_in_every_worker(publisher, workers, broker_path):
+    first, second = workers.start(), workers.start()
+
+    sent = _publish([f"ping-{i}" for i in range(EVENTS)])
+
+    workers.wait_for(lambda: len(workers.runs("shared")) >= EVENTS and len(workers.runs("fanout")) >= 2 * EVENTS)
+    # Every message was acknowledged, so none can come back
+    workers.wait_for(lambda: not _pending(broker_path))
+    workers.shutdown()
+
+    # Each event ran its ordinary handler exactly once, in one of the workers
+    shared = workers.runs("shared")
+    assert sorted(name for name, _ in shared) == sorted(sent)
+    # ... and its fanout handler in every worker, the publisher included
+    for process in (first, second):
+        assert sorted(name for name, _ in workers.runs("fanout", process.pid)) == sorted(sent)
+    assert sorted(publisher.fanout) == sorted(sent)
+    assert publisher.shared == []
+
+    # The metadata came through the stream unchanged
+    assert all(headers == sent[name] for name, headers in shared)
+
+
+def test_unacknowledged_event_is_claimed_after_a_crash(publisher, workers, broker_path):
+    crashed = workers.start(crash=True)
+
+    sent = _publish(["ping"])
+
+    crashed.join(TIMEOUT)
+    assert crashed.exitcode == 1
+    # Handed to the dead worker and never acknowledged
+    assert list(_pending(broker_path).values()) == [f"{socket.gethostname()}:{crashed.pid}"]
+
+    survivor = workers.start()
+    workers.wait_for(lambda: workers.runs("shared", survivor.pid))
+    workers.wait_for(lambda: not _pending(broker_path))
+    workers.shutdown()
+
+    assert workers.runs("shared") == [("ping", sent["ping"])]
+
+
+def test_event_metadata_round_trips():
+    metadata = EventMetadata(
+        event_type="RelayPing",
+        correlation_id="request-1",
+        causation_id="event-0",
+        priority=EventPriority.CRITICAL,
+        source="order_service",
+        user_id=42
+    )
+
+    # As a transport carries it: string fields through JSON
+    headers = json.loads(json.dumps(metadata.to_headers()))
+    assert all(isinstance(value, str) for value in headers.values())
+    assert EventMetadata.from_headers(headers) == metadata
+
+    # Unset optional fields stay unset
+    assert EventMetadata.from_headers(EventMetadata().to_headers()).correlation_id is None
+
+    # Inside the relayed event's payload
+    event = RelayPing(metadata=metadata, name="ping")
+    assert deserialize_event(*serialize_event(event)) == event
@@ -0,0 +1,61 @@
+"""
+The hot queries of the query services read their tables through an index
+on a database migrated with ``flask migrate-db``.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.dataBase import db
+from app.shared.infrastructure.persistence.index_check import check_indexes, hot_queries
+
+
+@pytest.fixture
+def app_config():
+    # Only the release step builds the schema
+    return {"SCHEMA_AUTO_CREATE": False}
+
+
+def _drop_index(app, name):
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.execute(text(f"DROP INDEX {name}"))
+        # Pooled connections keep their prepared EXPLAIN statements, whose
+        # plans SQLite does not re-prepare after a schema change
+        db.engine.dispose()
+
+
+def test_no_hot_query_scans_its_table(app, migrate_db):
+    with app.app_context(), db.engine.connect() as connection:
+        results = check_indexes(connection)
+
+    assert len(results) == len(hot_queries())
+    scans = [
+        (result.name, step)
+        for result in results
+        for step in result.plan
+        if step.startswith("SCAN") and "USING" not in step
+    ]
+    assert not scans, scans
+    assert all(result.uses_index for result in results), [r.name for r in results if not r.uses_index]
+
+
+def test_a_dropped_index_is_reported(app, migrate_db):
+    _drop_index(app, "ix_order_items_order_id")
+    with app.app_context(), db.engine.connect() as connection:
+        results = {result.name: result for result in check_indexes(connection)}
+
+    assert not results["order items by order"].uses_index
+    assert results["order items by order"].plan == ["SCAN order_items"]
+    assert results["orders by user"].uses_index
+
+
+def test_check_indexes_command_fails_on_a_scan(app, migrate_db):
+    runner = app.test_cli_runner()
+    assert runner.invoke(args=["check-indexes"]).exit_code == 0
+
+    _drop_index(app, "ix_invoices_user_id")
+
+    result = runner.invoke(args=["check-indexes"])
+    assert result.exit_code != 0
+    assert "invoices by user" in result.output
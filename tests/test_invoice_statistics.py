@@ -0,0 +1,140 @@
+"""
+Invoice statistics aggregated in SQL agree with the same numbers computed
+in Python from the rows, including invoices on either side of day, ISO
+week, month, quarter and year boundaries.
+"""
+
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.dataBase import db
+from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.infrastructure.persistence.models import InvoiceModel
+from app.services.invoice_service.infrastructure.query_services.invoice_statistics_query_service import (
+    InvoiceStatisticsQueryService
+)
+
+START = datetime(2025, 1, 1)
+END = datetime(2026, 1, 10)
+
+# Pairs straddling a boundary: 2025-03-31 is a Monday and the last day of
+# Q1, and the ISO week of Monday 2025-12-29 spans the new year
+CREATED_AT = [
+    datetime(2025, 1, 1, 0, 0, 0),
+    datetime(2025, 2, 28, 23, 59, 59),
+    datetime(2025, 3, 1, 0, 0, 0),
+    datetime(2025, 3, 30, 23, 59, 59),
+    datetime(2025, 3, 31, 0, 0, 0),
+    datetime(2025, 3, 31, 23, 59, 59),
+    datetime(2025, 4, 1, 0, 0, 0),
+    datetime(2025, 6, 30, 23, 59, 59),
+    datetime(2025, 7, 1, 0, 0, 0),
+    datetime(2025, 7, 1, 12, 30, 0),
+    datetime(2025, 12, 28, 23, 59, 59),
+    datetime(2025, 12, 29, 0, 0, 0),
+    datetime(2025, 12, 31, 23, 59, 59),
+    datetime(2026, 1, 1, 0, 0, 0),
+    datetime(2026, 1, 4, 23, 59, 59),
+    datetime(2026, 1, 5, 0, 0, 0),
+]
+STATUSES = [InvoiceStatus.PAID, InvoiceStatus.PENDING, InvoiceStatus.OVERDUE, InvoiceStatus.CANCELLED]
+
+
+def _label(created_at, interval):
+    day = created_at.date()
+    if interval == "week":
+        monday = day - timedelta(days=day.weekday())
+        return f"{monday:%Y-%m-%d} to {monday + timedelta(days=6):%Y-%m-%d}"
+    if interval == "month":
+        return f"{day:%Y-%m}"
+    if interval == "quarter":
+        return f"{day.year} Q{(day.month - 1) // 3 + 1}"
+    if interval == "year":
+        return str(day.year)
+    return f"{day:%Y-%m-%d}"
+
+
+@pytest.fixture
+def invoices(app):
+    seeded = []
+    with app.app_context():
+        for i, created_at in enumerate(CREATED_AT):
+            invoice = InvoiceModel(
+                invoice_id=str(uuid.uuid4()),
+                order_id=str(uuid.uuid4()),
+                user_id=str(uuid.uuid4()),
+                status=STATUSES[i % len(STATUSES)],
+                subtotal=10.0 * (i + 1),
+                total_amount=10.0 * (i + 1) + 0.25,
+                due_date=created_at + timedelta(days=30),
+                created_at=created_at,
+                updated_at=created_at
+            )
+            db.session.add(invoice)
+            seeded.append((created_at, invoice.status, invoice.total_amount))
+        db.session.commit()
+    return seeded
+
+
+@pytest.mark.parametrize("interval", ["day", "week", "month", "quarter", "year"])
+def test_time_series_buckets_match_python(app, invoices, interval):
+    expected = defaultdict(lambda: [0, 0.0, 0, 0.0])
+    for created_at, status, amount in invoices:
+        totals = expected[_label(created_at, interval)]
+        totals[0] += 1
+        totals[1] += amount
+        if status == InvoiceStatus.PAID:
+            totals[2] += 1
+            totals[3] += amount
+
+    with app.app_context():
+        series = InvoiceStatisticsQueryService(db.session).time_series(START, END, interval, {})
+
+    points = series["data_points"]
+    labels = [point["period"] for point in points]
+    assert len(labels) == len(set(labels))
+    # Every bucket of the range, empty ones included; END itself is exclusive
+    assert labels[0] == _label(START, interval)
+    assert labels[-1] == _label(END - timedelta(seconds=1), interval)
+
+    actual = {
+        point["period"]: [point["invoice_count"], point["total_value"], point["paid_count"], point["paid_value"]]
+        for point in points
+        if point["invoice_count"]
+    }
+    assert actual.keys() == expected.keys()
+    for label, (count, value, paid_count, paid_value) in expected.items():
+        assert actual[label][0] == count, label
+        assert actual[label][1] == pytest.approx(value), label
+        assert actual[label][2] == paid_count, label
+        assert actual[label][3] == pytest.approx(paid_value), label
+
+
+def test_status_totals_and_summary_match_python(app, invoices):
+    counts = defaultdict(int)
+    amounts = defaultdict(float)
+    for _, status, amount in invoices:
+        counts[status] += 1
+        amounts[status] += amount
+
+    with app.app_context():
+        statistics = InvoiceStatisticsQueryService(db.session)
+        totals = statistics.status_totals()
+        summary = statistics.summary(START, END, {})
+
+    for status in InvoiceStatus:
+        assert totals[status][0] == counts[status]
+        assert totals[status][1] == pytest.approx(amounts[status])
+
+    assert summary["total_invoices"] == len(invoices)
+    assert summary["total_value"] == pytest.approx(sum(amounts.values()))
+    assert summary["paid_invoices"]["count"] == counts[InvoiceStatus.PAID]
+    assert summary["paid_invoices"]["value"] == pytest.approx(amounts[InvoiceStatus.PAID])
+    assert summary["overdue_invoices"]["count"] == counts[InvoiceStatus.OVERDUE]
+    assert summary["pending_invoices"]["value"] == pytest.approx(amounts[InvoiceStatus.PENDING])
+    assert summary["paid_invoices"]["percentage"] == pytest.approx(
+        counts[InvoiceStatus.PAID] / len(invoices) * 100
+    )
@@ -0,0 +1,63 @@
+"""
+List endpoints answer with the same JSON whether the payload goes
+through the marshmallow response schema or straight to the JSON
+provider (TRUSTED_RESPONSES_ENABLED).
+"""
+
+import pytest
+
+from app.shared.infrastructure.serialization import init_json_provider
+
+
+def _both_ways(app, request):
+    bodies = []
+    for trusted in (False, True):
+        app.config["TRUSTED_RESPONSES_ENABLED"] = trusted
+        response = request()
+        assert response.status_code == 200, response.get_data(as_text=True)
+        bodies.append(response.get_json())
+    return bodies
+
+
+@pytest.fixture
+def placed_order(client, create_product, auth_headers):
+    product_id = create_product(quantity=10, price=7.5)
+    response = client.post("/order/order", json={
+        "items": [{"product_id": product_id, "quantity": 3, "price": 7.5}]
+    }, headers=auth_headers())
+    assert response.status_code == 201, response.get_data(as_text=True)
+    return product_id
+
+
+def test_order_list_matches_the_schema(app, client, placed_order):
+    schema_body, trusted_body = _both_ways(app, lambda: client.post("/order/orders", json={}))
+
+    assert trusted_body == schema_body
+    [order] = trusted_body["data"]["orders"]
+    assert set(order) == {"status", "total_amount", "items", "notes", "created_at", "updated_at", "completed_at"}
+    assert order["total_amount"] == 22.5
+    # The stored notes, not a placeholder
+    assert order["notes"] is None
+    assert order["items"] == [{"product_id": placed_order, "quantity": 3, "price": 7.5}]
+
+
+def test_product_list_keeps_the_schema_contract(app, client, create_product):
+    create_product()
+
+    schema_body, trusted_body = _both_ways(app, lambda: client.get("/api/products/list"))
+
+    assert trusted_body == schema_body
+
+
+def test_order_list_keeps_the_schema_under_flasks_json_provider(app, client, placed_order):
+    schema_body, _ = _both_ways(app, lambda: client.post("/order/orders", json={}))
+
+    # Flask's provider cannot write the DTO's enums and datetimes as the
+    # schema does, so the trusted path falls back to the schema dump
+    app.config["JSON_PROVIDER"] = "default"
+    app.json = app.json_provider_class(app)
+    init_json_provider(app)
+    response = client.post("/order/orders", json={})
+
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json() == schema_body
@@ -0,0 +1,42 @@
+"""
+Order archival moves old finished orders only; open orders stay in the
+hot tables however old they are.
+"""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from app.dataBase import db
+from app.extensions import container
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import ArchivedOrderModel
+
+
+def test_archives_only_finished_orders(app, create_product, create_order):
+    product_id = create_product(quantity=100)
+    orders = {}
+    for status in OrderStatus:
+        response = create_order([(product_id, 1, 7.5)])
+        assert response.status_code == 201, response.get_data(as_text=True)
+        orders[status] = UUID(response.get_json()["data"]["order_id"])
+    recent = UUID(create_order([(product_id, 1, 7.5)]).get_json()["data"]["order_id"])
+
+    old = datetime.now(UTC) - timedelta(days=200)
+    with app.app_context():
+        for status, order_id in orders.items():
+            db.session.execute(update(OrderModel).where(OrderModel.id == order_id).values(status=status, created_at=old))
+        db.session.execute(update(OrderModel).where(OrderModel.id == recent).values(status=OrderStatus.COMPLETED))
+        db.session.commit()
+
+        result = container.order_service().archive_orders(days=90)
+
+        archived = set(db.session.scalars(select(ArchivedOrderModel.id)))
+        remaining = set(db.session.scalars(select(OrderModel.id)))
+
+    assert result["completed"]
+    assert result["archived_orders"] == 3
+    assert archived == {orders[OrderStatus.COMPLETED], orders[OrderStatus.CANCELLED], orders[OrderStatus.FAILED]}
+    assert remaining == {orders[OrderStatus.PENDING], orders[OrderStatus.CONFIRMED], recent}
@@ -0,0 +1,94 @@
+"""
+Streaming order export: every matching order comes out once, in CSV or
+NDJSON, as one chunk per server-side cursor batch, gzip-encoded when the
+client accepts it or asks for it.
+"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from sqlalchemy import select
+
+from app.dataBase import db
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel
+
+BATCH_SIZE = 4
+ORDERS = 10
+
+
+@pytest.fixture
+def app_config():
+    return {"ORDER_EXPORT_BATCH_SIZE": BATCH_SIZE}
+
+
+@pytest.fixture
+def order_ids(app, create_product, create_order):
+    product_id = create_product(quantity=100)
+    for _ in range(ORDERS):
+        response = create_order([(product_id, 1, 7.5)])
+        assert response.status_code == 201, response.get_data(as_text=True)
+    # The order response does not carry the ID
+    with app.app_context():
+        return [str(order_id) for order_id in db.session.scalars(select(OrderModel.id))]
+
+
+def _export(client, headers, fmt, accept_gzip, **params):
+    if accept_gzip:
+        headers = {**headers, "Accept-Encoding": "gzip"}
+    response = client.get("/order/orders/export", query_string={"format": fmt, **params}, headers=headers, buffered=False)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    chunks = list(response.response)
+    response.close()
+    body = b"".join(chunk if isinstance(chunk, bytes) else chunk.encode() for chunk in chunks)
+    return response, chunks, body
+
+
+def _rows(fmt, text):
+    if fmt == "csv":
+        header, *rows = list(csv.reader(io.StringIO(text)))
+        assert header[0] == "Order ID"
+        return [row[0] for row in rows]
+    return [json.loads(line)["id"] for line in text.splitlines()]
+
+
+@pytest.mark.parametrize("fmt, media_type", [
+    ("csv", "text/csv; charset=utf-8"),
+    ("ndjson", "application/x-ndjson"),
+])
+@pytest.mark.parametrize("accept_gzip", [False, True])
+def test_export_streams_every_order(client, admin_headers, order_ids, fmt, media_type, accept_gzip):
+    response, chunks, body = _export(client, admin_headers, fmt, accept_gzip)
+
+    assert response.headers["Content-Type"] == media_type
+    assert response.headers["Content-Disposition"].startswith("attachment; filename=\"orders-")
+    assert response.headers["Content-Disposition"].endswith(f".{fmt}\"")
+    assert response.headers["Vary"] == "Accept-Encoding"
+    if accept_gzip:
+        assert response.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(body)
+    else:
+        assert "Content-Encoding" not in response.headers
+        # One chunk per cursor batch
+        assert len(chunks) == -(-ORDERS // BATCH_SIZE)
+
+    exported = _rows(fmt, body.decode("utf-8"))
+    assert len(exported) == ORDERS
+    assert sorted(exported) == sorted(order_ids)
+
+
+def test_gzip_parameter_overrides_accept_encoding(client, admin_headers, order_ids):
+    response, _, body = _export(client, admin_headers, "ndjson", accept_gzip=True, gzip="false")
+
+    assert "Content-Encoding" not in response.headers
+    assert len(_rows("ndjson", body.decode("utf-8"))) == ORDERS
+
+    response, _, body = _export(client, admin_headers, "csv", accept_gzip=False, gzip="true")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(_rows("csv", gzip.decompress(body).decode("utf-8"))) == ORDERS
+
+
+def test_export_requires_an_admin(client, auth_headers):
+    assert client.get("/order/orders/export", headers=auth_headers()).status_code == 403
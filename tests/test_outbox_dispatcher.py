@@ -0,0 +1,78 @@
+"""
+Outbox polling: an empty outbox is checked with a plain read, and only a
+poll that finds due events takes SQLite's write lock to claim them.
+"""
+
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import event
+
+from app.dataBase import db
+from app.extensions import container
+from app.shared.infrastructure.outbox.dispatcher import OutboxDispatcher
+from app.shared.infrastructure.outbox.models import OutboxEventModel
+from app.shared.infrastructure.outbox.serialization import serialize_event
+
+
+@dataclass
+class PingEvent:
+    note: str
+
+
+@pytest.fixture
+def app_config():
+    # The web profile begins read transactions deferred and writes immediate
+    return {"DB_ENGINE_PROFILE": "web"}
+
+
+@pytest.fixture
+def statements(app):
+    with app.app_context():
+        engine = db.engine
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement.strip().upper())
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def received():
+    """PingEvents delivered through the shared event bus, unsubscribed afterwards."""
+    event_bus = container.event_bus()
+    delivered = []
+    event_bus.subscribe(PingEvent, delivered.append)
+    yield delivered
+    event_bus.unsubscribe(PingEvent, delivered.append)
+    assert not event_bus.has_subscribers(PingEvent)
+
+
+def test_empty_poll_takes_no_write_lock(app, statements):
+    dispatcher = OutboxDispatcher(app, container.event_bus())
+
+    for _ in range(5):
+        assert dispatcher.run_once() == 0
+
+    assert not [s for s in statements if s.startswith(("BEGIN IMMEDIATE", "UPDATE", "DELETE"))], statements
+
+
+def test_due_event_is_claimed_and_delivered(app, statements, received):
+    event_bus = container.event_bus()
+
+    event_type, payload = serialize_event(PingEvent(note="hello"))
+    with app.app_context():
+        db.session.add(OutboxEventModel(event_id="ping-1", event_type=event_type, payload=payload))
+        db.session.commit()
+    statements.clear()
+
+    dispatcher = OutboxDispatcher(app, event_bus)
+    assert dispatcher.run_once() == 1
+
+    assert received == [PingEvent(note="hello")]
+    assert any(s.startswith("BEGIN IMMEDIATE") for s in statements)
+    with app.app_context():
+        assert db.session.query(OutboxEventModel).count() == 0
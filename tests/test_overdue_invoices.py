@@ -0,0 +1,149 @@
+"""
+Overdue invoice sweeps on a SQLite file: concurrent sweeps mark every
+overdue invoice exactly once, and the scheduler's advisory lock lets only
+one worker run the job at a time.
+"""
+
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.dataBase import db
+from app.extensions import build_scheduler, container
+from app.services.invoice_service.application.events.invoices_overdue_event import InvoicesOverdueEvent
+from app.services.invoice_service.domain.enums.invoice_status import InvoiceStatus
+from app.services.invoice_service.infrastructure.persistence.models import InvoiceModel
+from app.shared.infrastructure.persistence.engine import write_intent
+from app.shared.infrastructure.scheduler import PeriodicScheduler
+
+OVERDUE = 25
+BATCH_SIZE = 3
+JOB = "invoices.mark_overdue"
+TIMEOUT = 10
+
+
+@pytest.fixture
+def app_config():
+    # BEGIN IMMEDIATE for writes, as in the web workers that run the scheduler
+    return {"DB_ENGINE_PROFILE": "web", "OVERDUE_SWEEP_BATCH_SIZE": BATCH_SIZE}
+
+
+@pytest.fixture
+def invoices(app):
+    """Overdue pending invoices, plus pending ones not yet due and paid ones past due."""
+    now = datetime.now()
+    seeded = {status: [] for status in ("overdue", "not_due", "paid")}
+    with app.app_context():
+        for kind, count, status, due_date in (
+            ("overdue", OVERDUE, InvoiceStatus.PENDING, now - timedelta(days=3)),
+            ("not_due", 5, InvoiceStatus.PENDING, now + timedelta(days=3)),
+            ("paid", 5, InvoiceStatus.PAID, now - timedelta(days=3)),
+        ):
+            for i in range(count):
+                invoice_id = str(uuid.uuid4())
+                db.session.add(InvoiceModel(
+                    invoice_id=invoice_id,
+                    order_id=str(uuid.uuid4()),
+                    user_id=str(uuid.uuid4()),
+                    status=status,
+                    subtotal=10.0,
+                    total_amount=10.0,
+                    due_date=due_date - timedelta(minutes=i),
+                    created_at=now - timedelta(days=30)
+                ))
+                seeded[kind].append(invoice_id)
+        db.session.commit()
+    return seeded
+
+
+@pytest.fixture
+def marked():
+    """Invoice IDs of every InvoicesOverdueEvent published, in order."""
+    event_bus = container.event_bus()
+    invoice_ids = []
+    lock = threading.Lock()
+
+    def collect(event):
+        with lock:
+            invoice_ids.extend(event.invoice_ids)
+
+    event_bus.subscribe(InvoicesOverdueEvent, collect)
+    yield invoice_ids
+    event_bus.unsubscribe(InvoicesOverdueEvent, collect)
+
+
+def _statuses(app):
+    with app.app_context():
+        return dict(db.session.query(InvoiceModel.invoice_id, InvoiceModel.status).all())
+
+
+def test_concurrent_sweeps_mark_each_invoice_once(app, invoices, marked):
+    start = threading.Barrier(2)
+    counts, errors = [], []
+
+    def sweep():
+        try:
+            start.wait()
+            with app.app_context(), write_intent():
+                counts.append(container.invoice_service().check_and_update_overdue_invoices(BATCH_SIZE))
+                db.session.remove()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=sweep) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+
+    assert not errors, errors
+    # Between them the sweeps marked every overdue invoice, none twice
+    assert sum(counts) == OVERDUE
+    assert sorted(marked) == sorted(invoices["overdue"])
+
+    statuses = _statuses(app)
+    assert all(statuses[invoice_id] == InvoiceStatus.OVERDUE for invoice_id in invoices["overdue"])
+    assert all(statuses[invoice_id] == InvoiceStatus.PENDING for invoice_id in invoices["not_due"])
+    assert all(statuses[invoice_id] == InvoiceStatus.PAID for invoice_id in invoices["paid"])
+
+
+def test_second_sweep_finds_nothing(app, invoices, marked):
+    with app.app_context(), write_intent():
+        service = container.invoice_service()
+        assert service.check_and_update_overdue_invoices(BATCH_SIZE) == OVERDUE
+        assert service.check_and_update_overdue_invoices(BATCH_SIZE) == 0
+
+    assert len(marked) == OVERDUE
+
+
+def test_scheduler_lock_lets_one_worker_run_the_job(app, invoices, marked):
+    # Two workers' schedulers; the first holds the job's lock mid-run
+    entered, release = threading.Event(), threading.Event()
+
+    def held_sweep():
+        entered.set()
+        assert release.wait(TIMEOUT)
+        container.invoice_service().check_and_update_overdue_invoices(BATCH_SIZE)
+
+    first = PeriodicScheduler(app)
+    first.add_job(JOB, held_sweep, interval=3600)
+    second = build_scheduler(app)
+    running = threading.Thread(target=first.run_job, args=(JOB,))
+    running.start()
+    assert entered.wait(TIMEOUT)
+
+    assert second.run_job(JOB) is False
+    assert second.stats()[JOB]["skipped"] == 1
+    assert marked == []
+
+    release.set()
+    running.join(TIMEOUT)
+    assert first.stats()[JOB]["runs"] == 1
+    assert first.stats()[JOB]["failures"] == 0
+    assert sorted(marked) == sorted(invoices["overdue"])
+
+    # The lock is free again and nothing is left to mark
+    assert second.run_job(JOB) is True
+    assert len(marked) == OVERDUE
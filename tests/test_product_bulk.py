@@ -0,0 +1,49 @@
+"""
+/api/products/bulk answers with the same product representation as
+single product creation, plus the rejected entries.
+"""
+
+
+def _product(name):
+    return {
+        "product_fields": {
+            "name": name,
+            "description": "Test product",
+            "brand": "Acme",
+            "dosage_form": "tablet",
+            "strength": "500mg",
+            "package": "10",
+            "image_url": "https://example.com/product.png",
+            "status": "ACTIVE"
+        },
+        "inventory_fields": {"quantity": 10, "price": 7.5, "max_stock": 100, "min_stock": 1, "expiry_date": "2030-01-01"}
+    }
+
+
+def _without_ids(product):
+    product = {key: dict(value) if isinstance(value, dict) else value for key, value in product.items()}
+    product.pop("id")
+    product["product_fields"].pop("id")
+    product["inventory_fields"].pop("product_id")
+    return product
+
+
+def test_bulk_returns_created_products_like_single_create(client):
+    single = client.post("/api/products/", json=_product("Single"))
+    assert single.status_code == 201, single.get_data(as_text=True)
+
+    response = client.post("/api/products/bulk", json={"products": [
+        _product("Bulk"),
+        {"product_fields": {}, "inventory_fields": {}}
+    ]})
+    assert response.status_code == 201, response.get_data(as_text=True)
+    data = response.get_json()["data"]
+
+    assert (data["total_attempted"], data["total_created"], data["total_errors"]) == (2, 1, 1)
+    assert data["errors"][0]["index"] == 1
+    [created] = data["created"]
+    assert created["id"] == created["product_fields"]["id"] == created["inventory_fields"]["product_id"]
+
+    expected = _without_ids(single.get_json()["data"])
+    expected["product_fields"]["name"] = "Bulk"
+    assert _without_ids(created) == expected
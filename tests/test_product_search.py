@@ -0,0 +1,94 @@
+"""
+Full-text product search on SQLite. ``flask migrate-db`` creates the FTS5
+index and the triggers that keep it in step with the products table;
+results are ranked name before brand and follow inserts, updates and
+deletes without any application code.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy import text
+
+from app.dataBase import db
+from app.extensions import container
+from app.services.product_service.infrastructure.search.product_search import (
+    LikeProductSearch,
+    SqliteProductSearch,
+    product_search_for
+)
+
+PRODUCT_FIELDS = {
+    "description": "Test product",
+    "dosage_form": "tablet",
+    "strength": "500mg",
+    "package": "10",
+    "image_url": "https://example.com/product.png",
+    "status": "ACTIVE"
+}
+INVENTORY_FIELDS = {"quantity": 10, "price": 7.5, "max_stock": 100, "min_stock": 1, "expiry_date": "2030-01-01"}
+
+
+def _search(app, term):
+    with app.test_request_context():
+        page = container.product_service().search_products(search_term=term)
+    return [item["product_fields"]["name"] for item in page["items"]]
+
+
+def _fts_integrity_check(app):
+    with app.app_context(), db.engine.begin() as connection:
+        connection.execute(text("INSERT INTO products_fts(products_fts) VALUES ('integrity-check')"))
+
+
+@pytest.fixture
+def app_config():
+    # Only the release step builds the schema
+    return {"SCHEMA_AUTO_CREATE": False}
+
+
+def test_uses_the_fts5_index(app, migrate_db):
+    with app.app_context():
+        assert isinstance(product_search_for(db.session), SqliteProductSearch)
+
+
+def test_name_matches_rank_above_brand_matches(app, migrate_db, create_product):
+    # Alphabetically the brand match would come first
+    create_product(name="Alpha Relief", brand="Paracetamol Pharma")
+    create_product(name="Zeta Paracetamol", brand="Acme")
+    create_product(name="Ibuprofen", brand="Acme")
+
+    assert _search(app, "paracetamol") == ["Zeta Paracetamol", "Alpha Relief"]
+    # Tokens match as prefixes
+    assert _search(app, "parac") == ["Zeta Paracetamol", "Alpha Relief"]
+    assert _search(app, "zeta parac") == ["Zeta Paracetamol"]
+    assert _search(app, "aspirin") == []
+
+
+def test_index_follows_updates_and_deletes(app, migrate_db, client, create_product):
+    renamed = create_product(name="Zeta Paracetamol", brand="Acme")
+    deleted = create_product(name="Alpha Relief", brand="Paracetamol Pharma")
+
+    response = client.put(f"/api/products/{renamed}", json={
+        "product_fields": {**PRODUCT_FIELDS, "name": "Zeta Tablets", "brand": "Acme"},
+        "inventory_fields": INVENTORY_FIELDS
+    })
+    assert response.status_code == 200, response.get_data(as_text=True)
+
+    assert _search(app, "paracetamol") == ["Alpha Relief"]
+    assert _search(app, "tablets") == ["Zeta Tablets"]
+
+    response = client.delete(f"/api/products/{deleted}")
+    assert response.status_code == 200, response.get_data(as_text=True)
+
+    assert _search(app, "paracetamol") == []
+    assert _search(app, "relief") == []
+    assert _search(app, "zeta") == ["Zeta Tablets"]
+    _fts_integrity_check(app)
+
+
+def test_unmigrated_database_falls_back_with_a_warning(app, caplog):
+    with app.app_context(), caplog.at_level(logging.WARNING):
+        backend = product_search_for(db.session)
+
+    assert isinstance(backend, LikeProductSearch)
+    assert "flask migrate-db" in caplog.text